@@ -5,6 +5,96 @@ class Settings(BaseSettings):
     NAVER_CLIENT_SECRET: str
     DB_URL:              str
 
+    # 네이버 API 클라이언트 (커넥션 풀 / 동시 요청 수 / 초당 요청 수 / 타임아웃 / 재시도)
+    NAVER_API_BASE_URL:       str   = "https://openapi.naver.com/v1/search/news.json"
+    NAVER_RSS_URL:            str   = "https://news.naver.com/main/main.naver?mode=LSD&mid=shm&sid1=0&type=RSS"
+    NAVER_MAX_CONNECTIONS:    int   = 20
+    NAVER_MAX_CONCURRENCY:    int   = 8
+    NAVER_RATE_LIMIT_PER_SEC: float = 10.0
+    NAVER_TIMEOUT_SECONDS:    float = 5.0
+    NAVER_MAX_RETRIES:        int   = 3
+
+    # 모델 로딩: background(lifespan 에서 백그라운드 스레드로 프리로드) | eager(시작 시 동기 로드) | lazy(첫 요청 시 로드)
+    MODEL_LOAD_MODE: str  = "background"
+    MODEL_WARMUP:    bool = True
+
+    # 추론 백엔드: eager | int8 (동적 양자화) | torchscript (분류 모델 전용, EXPORT_DIR 에 저장)
+    CLASSIFIER_BACKEND:    str = "eager"
+    COT_BACKEND:           str = "eager"
+    EXPORT_DIR:            str = "models/export"
+    # torch 스레드 수 (0 이면 torch 기본값)
+    TORCH_NUM_THREADS:     int = 0
+    TORCH_INTEROP_THREADS: int = 0
+
+    # spaCy NER (nlp.pipe 배치 크기 / 프로세스 수)
+    NER_MODEL:      str = "ko_core_news_sm"
+    NER_BATCH_SIZE: int = 64
+    NER_N_PROCESS:  int = 1
+
+    # 분류 모델 마이크로 배칭 (동시 요청을 모아 한 번의 forward pass로 처리)
+    PREDICT_MAX_BATCH_SIZE: int   = 16
+    PREDICT_MAX_WAIT_MS:    float = 5.0
+    # 분류 모델 길이별 배치: 최대 토큰 길이(초과분은 잘림), 배치의 패딩 포함 토큰 수 상한
+    PREDICT_MAX_SEQ_LENGTH:       int = 512
+    PREDICT_MAX_TOKENS_PER_BATCH: int = 8192
+
+    # CoT 생성 모델 (허브 ID, 예: 운영용 "EleutherAI/gpt-j-6B")
+    COT_MODEL:        str  = "EleutherAI/gpt-neo-125M"
+    # CoT 생성 배치 (한 번의 generate 에 묶을 최대 시퀀스 수, 기사 prefix KV 캐시 공유 여부)
+    COT_BATCH_SIZE:   int  = 16
+    COT_PREFIX_CACHE: bool = True
+    # greedy 디코딩 (같은 입력 → 같은 결과, CoT 예측 캐시 사용 조건). 기본은 기존과 같은 샘플링(temperature 0.7, top_p 0.9)
+    COT_DETERMINISTIC: bool = False
+    # 제약 디코딩: '결과:' 뒤 토큰을 up/down/neutral 로 제한하고 방향이 나오면 바로 종료, 확신도는 세 방향 logit 의 softmax
+    COT_CONSTRAINED:   bool = False
+    # 프롬프트의 기사 문맥 토큰 예산: 넘는 기사는 제목 + 개체 언급 문장과 주변 문장만 사용 (0 이면 기사 전체, 예: 384)
+    COT_CONTEXT_TOKENS: int = 0
+    # 추측 디코딩: 작은 draft 모델이 COT_DRAFT_TOKENS 개씩 제안하고 본 모델이 한 번의 forward 로 검증
+    # (greedy 전용 — COT_DETERMINISTIC=False 면 사용하지 않음, draft 모델은 본 모델과 토크나이저를 공유해야 함)
+    # 권장 조합 (GPT-2 BPE 토크나이저 공유): COT_MODEL=gpt-j-6B ↔ gpt-neo-125M, gpt-neo-125M ↔ distilgpt2
+    # draft 가 COT_MODEL 과 같으면 이득 없이 forward 만 늘어나므로 경고 후 사용하지 않음
+    COT_SPECULATIVE:   bool = False
+    COT_DRAFT_MODEL:   str  = "distilgpt2"
+    COT_DRAFT_TOKENS:  int  = 4
+
+    # 예측 모드 (요청의 mode 로 덮어쓸 수 있음)
+    #  cot: 개체별 CoT 생성 | classifier: 분류 모델만 | cascade: 분류 모델 먼저, 확신도가 임계값 미만인 기사만 CoT
+    PREDICT_MODE:                 str   = "cot"
+    CASCADE_CONFIDENCE_THRESHOLD: float = 0.8
+
+    # 추론 executor (이벤트 루프 밖에서 torch / spaCy 실행)
+    #  실행 수 + 대기 수(INFERENCE_MAX_QUEUE)를 넘는 요청은 429 + Retry-After 로 거절
+    INFERENCE_WORKERS:             int = 2
+    INFERENCE_MAX_QUEUE:           int = 16
+    INFERENCE_RETRY_AFTER_SECONDS: int = 1
+    # NER executor: thread | process (spaCy 는 GIL 을 오래 잡으므로 process 도 선택 가능)
+    NER_EXECUTOR: str = "thread"
+    NER_WORKERS:  int = 1
+
+    # 스트리밍 배치 예측 (/predict/batch/stream): 한 번에 처리할 고유 텍스트 수 / 동시 처리 묶음 수
+    PREDICT_STREAM_CHUNK_SIZE:  int = 4
+    PREDICT_STREAM_CONCURRENCY: int = 4
+
+    # GraphQL 쿼리 제한 (정적 비용 / 중첩 깊이 / 별칭 수) 및 영속 쿼리
+    #  영속 쿼리 파일: {"<sha256>": "<query>"} 또는 ["<query>", ...] JSON, PERSISTED_ONLY 면 등록된 쿼리만 허용
+    GRAPHQL_MAX_COST:               int  = 1500
+    GRAPHQL_MAX_DEPTH:              int  = 8
+    GRAPHQL_MAX_ALIASES:            int  = 30
+    GRAPHQL_PERSISTED_QUERIES_PATH: str  = ""
+    GRAPHQL_PERSISTED_ONLY:         bool = False
+
+    # news_id 예측 결과를 DB(predictions / news_entities)에 저장하고, 같은 기사 재요청 시 저장된 결과 사용
+    PREDICTION_STORE_ENABLED: bool = True
+
+    # 단계별 지연시간 구조화 로그 (news_trend.span 로거, 한 줄 JSON) — 메트릭은 항상 /metrics 에 기록
+    LOG_SPANS: bool = False
+
+    # 예측 결과 캐시 (메모리 LRU/TTL + 선택적 SQLite 영구 계층, 경로가 비어 있으면 메모리만 사용)
+    PREDICT_CACHE_ENABLED:     bool  = True
+    PREDICT_CACHE_MAX_ENTRIES: int   = 1024
+    PREDICT_CACHE_TTL_SECONDS: float = 3600
+    PREDICT_CACHE_SQLITE_PATH: str   = ""
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -1,4 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, create_engine
+from sqlalchemy import (
+    Column, DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint,
+    create_engine, inspect, text,
+)
 from sqlalchemy.orm import declarative_base
 from datetime import datetime
 from backend.app.config import settings
@@ -13,10 +16,141 @@ class News(Base):
     originallink = Column(String(1024))
     description = Column(Text)
     pub_date = Column(DateTime, nullable=False)
+    source = Column(String(64))  # 수집 경로 (naver_search / naver_rss / 직접 저장 시 None)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # 목록 조회는 (pub_date, id) 역순 keyset 페이지네이션이므로 같은 순서의 복합 인덱스 사용
+    __table_args__ = (
+        Index("ix_news_pub_date_id", "pub_date", "id"),
+        Index("ix_news_source_pub_date_id", "source", "pub_date", "id"),
+    )
+
+class IngestState(Base):
+    # 수집 소스(RSS 피드 / 검색어)별 조건부 요청 헤더와 최신 기사 시각(high-water mark)
+    __tablename__ = "ingest_state"
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String(512), unique=True, nullable=False)
+    etag = Column(String(512))
+    last_modified = Column(String(128))
+    high_water = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class Entity(Base):
+    # NER 로 추출한 개체명 사전 (이름 + 라벨 당 한 행)
+    __tablename__ = "entities"
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(256), nullable=False)
+    label = Column(String(32), nullable=False)
+
+    __table_args__ = (UniqueConstraint("name", "label", name="uq_entities_name_label"),)
+
+class NewsEntity(Base):
+    # 기사별 개체명 (position: 추출 순서, 같은 개체가 여러 번 나오면 여러 행)
+    __tablename__ = "news_entities"
+    news_id = Column(Integer, ForeignKey("news.id", ondelete="CASCADE"), primary_key=True)
+    position = Column(Integer, primary_key=True)
+    entity_id = Column(Integer, ForeignKey("entities.id"), nullable=False, index=True)
+
+class Prediction(Base):
+    """
+    기사별 예측 결과 (모델 버전마다 따로 저장)
+
+    asset 이 NULL 인 행은 "계산했지만 예측 대상이 없음" 표시로, 같은 기사를 다시 계산하지 않기 위해 남깁니다.
+    pub_date 는 자산별 기간 조회를 위해 news.pub_date 를 복사해 둡니다.
+    """
+    __tablename__ = "predictions"
+    id = Column(Integer, primary_key=True, index=True)
+    news_id = Column(Integer, ForeignKey("news.id", ondelete="CASCADE"), nullable=False)
+    model_version = Column(String(128), nullable=False)
+    asset = Column(String(256))
+    direction = Column(String(16), nullable=False, default="")
+    confidence = Column(Float)
+    reasoning = Column(Text, nullable=False, default="")
+    latency_ms = Column(Float)  # 배치 추론 시간을 기사 수로 나눈 값
+    pub_date = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_predictions_news_model", "news_id", "model_version"),
+        Index("ix_predictions_asset_pub_date", "asset", "pub_date"),
+    )
+
+class AssetTrend(Base):
+    """
+    자산 × 시간 구간(minute/hour/day) × 모델 버전별 누적 집계.
+    예측 저장·교체·삭제 시 증분 갱신되므로, 추이 조회는 기사 수가 아니라 구간 수에 비례합니다. (services/trends 참고)
+    """
+    __tablename__ = "asset_trends"
+    id = Column(Integer, primary_key=True, index=True)
+    model_version = Column(String(128), nullable=False)
+    asset = Column(String(256), nullable=False)
+    bucket = Column(String(8), nullable=False)
+    bucket_start = Column(DateTime, nullable=False)
+    mentions = Column(Integer, nullable=False, default=0)  # 개체명으로 언급된 기사 수
+    up = Column(Integer, nullable=False, default=0)
+    down = Column(Integer, nullable=False, default=0)
+    neutral = Column(Integer, nullable=False, default=0)
+    confidence_sum = Column(Float, nullable=False, default=0.0)
+    confidence_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("model_version", "asset", "bucket", "bucket_start", name="uq_asset_trends_bucket"),
+    )
+
 # DB 초기화 함수
 
 def init_db():
     engine = create_engine(settings.DB_URL, connect_args={"check_same_thread": False})
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    had_trends = inspect(engine).has_table(AssetTrend.__tablename__)
+    Base.metadata.create_all(bind=engine)
+    _migrate(engine)
+    ensure_news_fts(engine)
+    if not had_trends:
+        # 집계 테이블이 새로 생긴 경우, 이미 저장된 예측으로 한 번 채움
+        from sqlalchemy.orm import Session
+        from backend.app.services.trends import rebuild_trends
+        with Session(engine) as db:
+            rebuild_trends(db)
+
+def _migrate(engine):
+    # create_all 은 이미 있는 테이블을 바꾸지 않으므로, 기존 DB 에 추가된 컬럼/인덱스만 보충
+    columns = {col["name"] for col in inspect(engine).get_columns("news")}
+    if "source" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE news ADD COLUMN source VARCHAR(64)"))
+    for index in News.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+# 로컬 전문 검색용 FTS5 인덱스 (SQLite 전용)
+#  - trigram 토크나이저: 띄어쓰기·조사와 무관하게 3글자 이상 부분 문자열 검색 (한국어용 n-gram)
+#  - external content 테이블이라 본문은 news 에만 저장, 트리거로 INSERT/UPDATE/DELETE 동기화
+NEWS_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5("
+    " title, description, content='news', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS news_fts_ai AFTER INSERT ON news BEGIN"
+    " INSERT INTO news_fts(rowid, title, description) VALUES (new.id, new.title, new.description);"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS news_fts_ad AFTER DELETE ON news BEGIN"
+    " INSERT INTO news_fts(news_fts, rowid, title, description)"
+    " VALUES ('delete', old.id, old.title, old.description);"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS news_fts_au AFTER UPDATE ON news BEGIN"
+    " INSERT INTO news_fts(news_fts, rowid, title, description)"
+    " VALUES ('delete', old.id, old.title, old.description);"
+    " INSERT INTO news_fts(rowid, title, description) VALUES (new.id, new.title, new.description);"
+    " END",
+]
+
+def ensure_news_fts(engine) -> bool:
+    """news_fts 인덱스와 동기화 트리거를 만들고, 처음 만들 때는 기존 기사로 색인을 채웁니다."""
+    if engine.dialect.name != "sqlite":
+        return False
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'")
+        ).first()
+        for ddl in NEWS_FTS_DDL:
+            conn.execute(text(ddl))
+        if not exists:
+            conn.execute(text("INSERT INTO news_fts(news_fts) VALUES ('rebuild')"))
+    return True
@@ -1,13 +1,23 @@
 # backend/app/graphql/context.py
 from backend.app.db.session import SessionLocal
+from backend.app.graphql.loaders import Loaders
+from ariadne.types import Extension
 from typing import Dict, Any
 
 async def graphql_context(request) -> Dict[str, Any]:
     """
-    GraphQL context creator for Ariadne, injecting a SQLAlchemy session.
+    GraphQL context creator for Ariadne, injecting a SQLAlchemy session
+    and per-request DataLoaders.
 
-    Returns a dict with 'db' key containing a new SessionLocal instance.
-    Make sure to close the session after request if necessary.
+    Returns a dict with 'db' (a new SessionLocal instance) and 'loaders'.
+    The session is closed by SessionCleanupExtension when the request finishes.
     """
     db = SessionLocal()
-    return {"db": db}
+    return {"db": db, "loaders": Loaders(db)}
+
+class SessionCleanupExtension(Extension):
+    # 쿼리 성공/실패와 관계없이 요청이 끝나면 세션을 닫아 커넥션을 풀에 반환
+    def request_finished(self, context: Dict[str, Any]) -> None:
+        db = context.get("db") if isinstance(context, dict) else None
+        if db is not None:
+            db.close()
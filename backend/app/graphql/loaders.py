@@ -0,0 +1,156 @@
+# backend/app/graphql/loaders.py
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from backend.app.config import settings
+from backend.app.db.models import News
+from backend.app.services.cache import PredictionCache, prediction_cache
+from backend.app.services.crud import get_news_by_ids, try_get_saved_predictions, try_save_predictions
+from backend.app.services.executor import get_ner_executor
+from backend.app.services.ner import extract_entities_many
+from backend.app.services.pipeline import KEYWORD_MODEL_VERSION
+from backend.app.services.predict_ser import predict_directions
+from backend.app.utils.logger import span
+
+
+class DataLoader:
+    """
+    요청 단위 배치 로더.
+
+    같은 이벤트 루프 tick 에서 호출된 load() 들을 모아 batch_fn(keys) 를 한 번만 호출합니다.
+    GraphQL 실행기는 같은 레벨의 async 필드(별칭 포함)를 동시에 시작하므로,
+    predict(newsId:) 별칭 20개도 하나의 배치로 처리됩니다. 같은 키는 요청 안에서 한 번만 계산합니다.
+
+    batch_fn 은 keys 와 같은 길이·순서의 결과 리스트를 반환해야 하며, 실패한 키 자리에는 예외 객체를 넣습니다.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Any]], Awaitable[List[Any]]]):
+        self._batch_fn = batch_fn
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self._queue: List[Hashable] = []
+        self.batches = 0
+
+    def load(self, key: Hashable) -> "asyncio.Future":
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            self._queue.append(key)
+            if len(self._queue) == 1:
+                # 이번 tick 에 시작된 다른 resolver 들의 load() 가 모두 들어온 뒤 실행
+                loop.call_soon(lambda: asyncio.ensure_future(self._dispatch()))
+        return future
+
+    async def load_many(self, keys: List[Hashable]) -> List[Any]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    async def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        self.batches += 1
+        try:
+            values = await self._batch_fn(keys)
+            if len(values) != len(keys):
+                raise RuntimeError(f"batch_fn returned {len(values)} values for {len(keys)} keys")
+        except Exception as e:
+            for key in keys:
+                self._futures.pop(key).set_exception(e)
+            return
+        for key, value in zip(keys, values):
+            future = self._futures[key]
+            if future.done():
+                continue
+            # 예외 객체는 해당 키만 실패 처리
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+
+def keyword_cache_key(text: str) -> Optional[str]:
+    if not settings.PREDICT_CACHE_ENABLED:
+        return None
+    return PredictionCache.make_key(text, model_id="predict_directions", mode="keyword")
+
+
+async def predict_keywords_many(texts: List[str]) -> List[Dict]:
+    """GraphQL predict 용: 캐시에 없는 텍스트만 모아 NER 을 한 번(nlp.pipe) 실행하고 키워드 규칙으로 예측"""
+    keys = [keyword_cache_key(text) for text in texts]
+    results: List[Optional[Dict]] = [prediction_cache.get(key) if key else None for key in keys]
+    missing = [i for i, res in enumerate(results) if res is None]
+    if missing:
+        # spaCy NER 은 이벤트 루프 밖(NER executor)에서 실행
+        entities_list = await get_ner_executor().run(extract_entities_many, [texts[i] for i in missing])
+        for i, entities in zip(missing, entities_list):
+            results[i] = {"entities": entities, "predictions": predict_directions(entities, texts[i])}
+            if keys[i]:
+                prediction_cache.set(keys[i], results[i])
+    return results
+
+
+def keyword_model_version() -> Optional[str]:
+    # DB 에 저장할 키워드 규칙 예측의 모델 버전 (저장이 꺼져 있으면 None)
+    return KEYWORD_MODEL_VERSION if settings.PREDICTION_STORE_ENABLED else None
+
+
+def news_text(news: News) -> str:
+    return f"{news.title}\n{news.description or ''}"
+
+
+class Loaders:
+    """
+    GraphQL 요청마다 새로 만드는 로더 묶음 (context["loaders"])
+
+    - news:       news_id → News (WHERE id IN (...) 한 번)
+    - prediction: ("news", id) | ("text", text) → {'entities', 'predictions'}
+                  newsId 별칭과 text 별칭이 섞여 있어도 NER 은 한 번만 실행,
+                  news 키는 DB 에 저장된 예측을 먼저 읽고 새로 계산한 결과는 일괄 저장 (저장소 오류는 무시)
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.news = DataLoader(self._load_news)
+        self.prediction = DataLoader(self._load_predictions)
+
+    async def _load_news(self, ids: List[int]) -> List[Optional[News]]:
+        with span("db_fetch", batch=len(ids)):
+            found = await run_in_threadpool(get_news_by_ids, self.db, ids)
+        return [found.get(news_id) for news_id in ids]
+
+    async def _load_predictions(self, keys: List[Tuple[str, Any]]) -> List[Any]:
+        news_ids = [value for kind, value in keys if kind == "news"]
+        news_map = dict(zip(news_ids, await self.news.load_many(news_ids)))
+        version = keyword_model_version()
+        saved: Dict[int, Dict] = {}
+        found = [news_id for news_id in news_ids if news_map[news_id] is not None]
+        if version and found:
+            saved = await run_in_threadpool(try_get_saved_predictions, self.db, found, version)
+
+        texts: List[str] = []
+        slots: List[Any] = []
+        for kind, value in keys:
+            if kind == "news" and news_map[value] is None:
+                slots.append(LookupError("News not found"))
+            elif kind == "news" and value in saved:
+                slots.append(saved[value])
+            else:
+                slots.append(len(texts))
+                texts.append(news_text(news_map[value]) if kind == "news" else value)
+
+        if not texts:
+            return slots
+        started = time.perf_counter()
+        results = await predict_keywords_many(texts)
+        latency_ms = (time.perf_counter() - started) * 1000 / len(texts)
+        fresh = {
+            key[1]: results[slot]
+            for key, slot in zip(keys, slots)
+            if key[0] == "news" and isinstance(slot, int)
+        }
+        if version and fresh:
+            await run_in_threadpool(try_save_predictions, self.db, fresh, version, latency_ms)
+        return [results[slot] if isinstance(slot, int) else slot for slot in slots]
@@ -1,35 +1,92 @@
-from typing import Any, Dict, List
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 from backend.app.db.session import get_db
-from backend.app.services.scraper import fetch_news
-from backend.app.services.crud import get_news, get_news_by_id
-from backend.app.services.ner import extract_entities
-from backend.app.services.predict_ser import predict_directions
+from backend.app.graphql.loaders import Loaders
+from backend.app.services.scraper import afetch_news
+from backend.app.services.crud import (
+    encode_cursor, get_news, get_news_page, search_news_local
+)
+from backend.app.services.pipeline import stored_model_version
+from backend.app.services.trends import get_trends
 
 # 각 Query 필드에 매핑할 함수
 
-def resolve_search_news(obj: Any, info: Any, query: str, display: int = 10, start: int = 1, sort: str = "date") -> List[Dict]:
-    return fetch_news(query=query, display=display, start=start, sort=sort)
+async def resolve_search_news(obj: Any, info: Any, query: str, display: int = 10, start: int = 1, sort: str = "date") -> List[Dict]:
+    return await afetch_news(query=query, display=display, start=start, sort=sort)
 
 
-def resolve_get_news(obj: Any, info: Any, skip: int = 0, limit: int = 100) -> List[Dict]:
+def resolve_get_news(
+    obj: Any, info: Any, skip: int = 0, limit: int = 100, after: Optional[str] = None,
+    dateFrom: Optional[str] = None, dateTo: Optional[str] = None, source: Optional[str] = None,
+) -> List[Dict]:
     db: Session = info.context["db"]
-    return get_news(db, skip, limit)
+    limit = max(1, min(limit, 100))
+    if skip and not (after or dateFrom or dateTo or source):
+        return get_news(db, skip, limit)
+    # 다음 페이지는 마지막 항목의 cursor 를 after 로 전달 (keyset 페이지네이션)
+    items, _ = get_news_page(
+        db,
+        limit=limit,
+        cursor=after,
+        date_from=datetime.fromisoformat(dateFrom) if dateFrom else None,
+        date_to=datetime.fromisoformat(dateTo) if dateTo else None,
+        source=source,
+    )
+    return items
 
 
-def resolve_predict(obj: Any, info: Any, newsId: int = None, text: str = None) -> Dict:
-    
-    db: Session = info.context["db"]
+async def resolve_predict(obj: Any, info: Any, newsId: int = None, text: str = None) -> Dict:
+    # 같은 쿼리의 predict 별칭들은 DataLoader 로 모여 뉴스 조회 1회 + NER 1회로 처리 (캐시 포함)
+    loaders: Loaders = info.context["loaders"]
     if newsId:
-        news = get_news_by_id(db, newsId)
-        text = news.title + "\n" + news.description
-    entities = extract_entities(text)
-    predictions = predict_directions(entities, text)
-    return {"entities": entities, "predictions": predictions}
+        return await loaders.prediction.load(("news", newsId))
+    if not text:
+        raise ValueError("newsId or text is required")
+    return await loaders.prediction.load(("text", text))
+
+def resolve_local_search(obj: Any, info: Any, query: str, limit: int = 20, offset: int = 0) -> List[Dict]:
+    db: Session = info.context["db"]
+    return search_news_local(db, query, limit=max(1, min(limit, 100)), offset=max(0, offset))
+
+def resolve_trends(
+    obj: Any, info: Any, asset: str, bucket: str = "hour",
+    dateFrom: Optional[str] = None, dateTo: Optional[str] = None, model: str = "cot",
+) -> List[Dict]:
+    # 증분 집계 테이블(asset_trends)에서 구간별 추이 조회 (model: cot | classifier | cascade | keyword)
+    db: Session = info.context["db"]
+    points = get_trends(
+        db,
+        asset,
+        stored_model_version(model),
+        bucket,
+        date_from=datetime.fromisoformat(dateFrom) if dateFrom else None,
+        date_to=datetime.fromisoformat(dateTo) if dateTo else None,
+    )
+    return [
+        {
+            "bucketStart": p["bucket_start"].isoformat(),
+            "mentions": p["mentions"],
+            "up": p["up"],
+            "down": p["down"],
+            "neutral": p["neutral"],
+            "meanConfidence": p["mean_confidence"],
+        }
+        for p in points
+    ]
+
+# News 타입 필드 (ORM 속성명이 snake_case 라 직접 매핑)
+news_resolvers_map = {
+    "pubDate": lambda news, info: news.pub_date.isoformat(),
+    "createdAt": lambda news, info: news.created_at.isoformat(),
+    "cursor": lambda news, info: encode_cursor(news),
+}
 
 # 필드명과 resolver 함수 매핑
 resolvers_map = {
     "searchNews": resolve_search_news,
     "getNews": resolve_get_news,
     "predict": resolve_predict,
+    "localSearch": resolve_local_search,
+    "trends": resolve_trends,
 }
\ No newline at end of file
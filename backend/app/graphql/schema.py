@@ -1,13 +1,30 @@
-from ariadne import QueryType, make_executable_schema, gql
-from backend.app.graphql.resolvers import resolvers_map
+from ariadne import ObjectType, QueryType, make_executable_schema, gql
+from backend.app.graphql.resolvers import news_resolvers_map, resolvers_map
 from backend.app.graphql.context import graphql_context
 
 # GraphQL SDL
 type_defs = gql("""
   type Query {
-    searchNews(query: String!, display: Int, start: Int, sort: String): [NewsItem!]!
-    getNews(skip: Int, limit: Int): [News!]!
+    searchNews(query: String!, display: Int = 10, start: Int, sort: String): [NewsItem!]!
+    getNews(skip: Int, limit: Int = 100, after: String, dateFrom: String, dateTo: String, source: String): [News!]!
     predict(newsId: Int, text: String): PredictResponse!
+    localSearch(query: String!, limit: Int = 20, offset: Int): [LocalSearchHit!]!
+    trends(asset: String!, bucket: String = "hour", dateFrom: String, dateTo: String, model: String = "cot"): [TrendPoint!]!
+  }
+
+  type TrendPoint {
+    bucketStart: String!
+    mentions: Int!
+    up: Int!
+    down: Int!
+    neutral: Int!
+    meanConfidence: Float
+  }
+
+  type LocalSearchHit {
+    news: News!
+    snippet: String!
+    score: Float!
   }
 
   type NewsItem {
@@ -25,7 +42,9 @@ type_defs = gql("""
     originallink: String
     description: String
     pubDate: String!
+    source: String
     createdAt: String!
+    cursor: String!
   }
 
   type Entity {
@@ -54,5 +73,9 @@ query = QueryType()
 for field_name, resolver_func in resolvers_map.items():
     query.set_field(field_name, resolver_func)
 
+news = ObjectType("News")
+for field_name, resolver_func in news_resolvers_map.items():
+    news.set_field(field_name, resolver_func)
+
 # Executable Schema
-graphql_schema = make_executable_schema(type_defs, query)
\ No newline at end of file
+graphql_schema = make_executable_schema(type_defs, query, news)
\ No newline at end of file
@@ -0,0 +1,216 @@
+# backend/app/graphql/security.py
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from ariadne.validation import cost_validator
+from ariadne.validation.query_cost import CostValidator
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLSchema,
+    InlineFragmentNode,
+    SelectionSetNode,
+    parse,
+    specified_rules,
+    validate,
+)
+from graphql.validation import ValidationRule
+
+from backend.app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# ─── 정적 비용 분석 ───
+# 필드별 가중치: predict(CoT 생성) >> searchNews(외부 API, 건수 비례) > getNews/localSearch(DB, 건수 비례) > trends(집계 테이블)
+COST_MAP: Dict[str, Dict[str, Any]] = {
+    "Query": {
+        "predict":     {"complexity": 50},
+        "searchNews":  {"complexity": 2, "multipliers": ["display"]},
+        "getNews":     {"complexity": 1, "multipliers": ["limit"]},
+        "localSearch": {"complexity": 1, "multipliers": ["limit"]},
+        "trends":      {"complexity": 5},
+    },
+}
+
+
+def depth_limit_rule(max_depth: int) -> type:
+    """선택 집합 중첩 깊이 제한 (fragment 포함, 인트로스펙션 필드 제외)"""
+
+    class DepthLimitRule(ValidationRule):
+        def enter_operation_definition(self, node, *_):
+            depth = self._depth(node.selection_set, 0, frozenset())
+            if depth > max_depth:
+                self.report_error(GraphQLError(
+                    f"Query depth {depth} exceeds maximum allowed depth {max_depth}.", node
+                ))
+
+        def _depth(self, selection_set: Optional[SelectionSetNode], depth: int, fragments: frozenset) -> int:
+            if selection_set is None:
+                return depth
+            deepest = depth
+            for selection in selection_set.selections:
+                if isinstance(selection, FieldNode):
+                    if selection.name.value.startswith("__"):
+                        continue
+                    deepest = max(deepest, self._depth(selection.selection_set, depth + 1, fragments))
+                elif isinstance(selection, InlineFragmentNode):
+                    deepest = max(deepest, self._depth(selection.selection_set, depth, fragments))
+                elif isinstance(selection, FragmentSpreadNode):
+                    name = selection.name.value
+                    fragment = self.context.get_fragment(name)
+                    if fragment is not None and name not in fragments:
+                        deepest = max(deepest, self._depth(fragment.selection_set, depth, fragments | {name}))
+            return deepest
+
+    return DepthLimitRule
+
+
+def alias_limit_rule(max_aliases: int) -> type:
+    """문서 전체의 별칭(alias) 수 제한 (같은 필드를 별칭으로 수십 번 호출하는 쿼리 차단)"""
+
+    class AliasLimitRule(ValidationRule):
+        def __init__(self, context):
+            super().__init__(context)
+            self.aliases = 0
+
+        def enter_field(self, node: FieldNode, *_):
+            if node.alias is not None:
+                self.aliases += 1
+
+        def leave_document(self, node, *_):
+            if self.aliases > max_aliases:
+                self.report_error(GraphQLError(
+                    f"Query uses {self.aliases} aliases, maximum allowed is {max_aliases}."
+                ))
+
+    return AliasLimitRule
+
+
+def static_rules() -> List[type]:
+    # 변수와 무관한 규칙 (영속 쿼리 등록 시에도 사용)
+    return [
+        depth_limit_rule(settings.GRAPHQL_MAX_DEPTH),
+        alias_limit_rule(settings.GRAPHQL_MAX_ALIASES),
+    ]
+
+
+def validation_rules(context: Any, document: DocumentNode, data: dict) -> List[type]:
+    """요청마다 호출되는 ariadne validation_rules (비용 계산은 요청 변수 값이 필요)"""
+    return static_rules() + [
+        cost_validator(
+            maximum_cost=settings.GRAPHQL_MAX_COST,
+            variables=data.get("variables"),
+            cost_map=COST_MAP,
+        ),
+    ]
+
+
+# ─── 영속 쿼리 (persisted queries) ───
+
+def query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class PersistedQueryRegistry:
+    """
+    sha256(쿼리 문자열) → 파싱·검증이 끝난 DocumentNode.
+
+    프런트엔드가 쓰는 쿼리를 미리 등록해 두면, 요청은 해시만 보내고
+    (Apollo 형식 extensions.persistedQuery.sha256Hash 또는 id) 파싱·정적 검증을 건너뜁니다.
+    변수에 따라 달라지는 비용 검사는 요청마다 실행됩니다. (query_validator 참고)
+    """
+
+    def __init__(self):
+        self._queries: Dict[str, str] = {}
+        self._documents: Dict[str, DocumentNode] = {}
+        self._trusted: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def register(self, schema: GraphQLSchema, query: str, expected_hash: Optional[str] = None) -> str:
+        digest = query_hash(query)
+        if expected_hash is not None and expected_hash != digest:
+            raise ValueError(f"persisted query hash mismatch: {expected_hash} != {digest}")
+        document = parse(query)
+        errors = validate(schema, document, specified_rules + tuple(static_rules()))
+        if errors:
+            raise ValueError(f"persisted query {digest} is invalid: {errors[0].message}")
+        self._queries[digest] = query
+        self._documents[digest] = document
+        self._trusted.add(id(document))
+        return digest
+
+    def load_file(self, schema: GraphQLSchema, path: str) -> int:
+        """JSON 파일 로드: {"<sha256>": "<query>", ...} 또는 ["<query>", ...]"""
+        entries = json.loads(Path(path).read_text(encoding="utf-8"))
+        if isinstance(entries, list):
+            entries = {query_hash(query): query for query in entries}
+        for digest, query in entries.items():
+            self.register(schema, query, expected_hash=digest)
+        return len(entries)
+
+    def get(self, digest: str) -> Optional[DocumentNode]:
+        return self._documents.get(digest)
+
+    def query(self, digest: str) -> Optional[str]:
+        return self._queries.get(digest)
+
+    def is_trusted(self, document: DocumentNode) -> bool:
+        return id(document) in self._trusted
+
+    def clear(self) -> None:
+        self._queries.clear()
+        self._documents.clear()
+        self._trusted.clear()
+
+
+persisted_queries = PersistedQueryRegistry()
+
+
+def load_persisted_queries(schema: GraphQLSchema) -> int:
+    if not settings.GRAPHQL_PERSISTED_QUERIES_PATH:
+        return 0
+    count = persisted_queries.load_file(schema, settings.GRAPHQL_PERSISTED_QUERIES_PATH)
+    logger.info(f"Loaded {count} persisted GraphQL queries")
+    return count
+
+
+def requested_hash(data: Any) -> Optional[str]:
+    if not isinstance(data, dict):
+        return None
+    persisted = (data.get("extensions") or {}).get("persistedQuery") or {}
+    return persisted.get("sha256Hash") or data.get("id")
+
+
+def query_validator(schema, document_ast, rules=None, max_errors=None, type_info=None) -> List[GraphQLError]:
+    # 등록 시 이미 검증된 영속 쿼리 문서는 스펙·정적 규칙을 생략하고,
+    # 요청 변수(limit, display 등)에 따라 달라지는 비용 규칙만 실행
+    if persisted_queries.is_trusted(document_ast):
+        rules = [rule for rule in rules or () if issubclass(rule, CostValidator)]
+        if not rules:
+            return []
+    return validate(schema, document_ast, rules, max_errors=max_errors, type_info=type_info)
+
+
+class PersistedQueryHTTPHandler(GraphQLHTTPHandler):
+    """해시로 요청된 영속 쿼리를 등록된 DocumentNode 로 바로 실행하는 HTTP 핸들러"""
+
+    async def execute_graphql_query(self, request, data, *, context_value=None, query_document=None):
+        digest = requested_hash(data)
+        if digest is not None and query_document is None:
+            query_document = persisted_queries.get(digest)
+            if query_document is None:
+                return False, {"errors": [{"message": "PersistedQueryNotFound"}]}
+            data = {**data, "query": persisted_queries.query(digest)}
+        elif settings.GRAPHQL_PERSISTED_ONLY:
+            return False, {"errors": [{"message": "PersistedQueryRequired"}]}
+        return await super().execute_graphql_query(
+            request, data, context_value=context_value, query_document=query_document
+        )
@@ -25,43 +25,104 @@
 
 # backend/app/main.py
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 
 from backend.app.db.models import init_db
 from backend.app.routers.news import router as news_router
 from backend.app.routers.predict_rout import router as predict_router
+from backend.app.routers.health import router as health_router
+from backend.app.routers.metrics import router as metrics_router
+from backend.app.routers.trends import router as trends_router
 
 # Ariadne GraphQL imports
 from ariadne.asgi import GraphQL
 from backend.app.graphql.schema import graphql_schema
-from backend.app.graphql.context import graphql_context
+from backend.app.graphql.context import SessionCleanupExtension, graphql_context
+from backend.app.graphql.security import (
+    PersistedQueryHTTPHandler, load_persisted_queries, query_validator, validation_rules
+)
 
 # ─── 모델 로드용 서비스 임포트 ───
-from backend.app.services.model import load_model
+from backend.app.config import settings
+from backend.app.services.registry import registry
+from backend.app.services.backends import configure_threads
+from backend.app.services.model import close_predict_batcher, get_predict_batcher
+from backend.app.services.naver_client import close_naver_client
+from backend.app.services.executor import reset_executors, shutdown_executors
+from backend.app.utils.exceptions import ExecutorClosedError, ExecutorSaturatedError
+from backend.app.utils.metrics import HTTP_REQUEST_SECONDS
+import time
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 1) 애플리케이션 시작 시 실행
     init_db()                                # DB 초기화
-    app.state.predict_model = load_model()   # 모델 로드 및 캐싱
+    load_persisted_queries(graphql_schema)   # GraphQL 영속 쿼리 등록 (설정된 경우)
+    configure_threads()                      # torch 스레드 수 설정
+    reset_executors()                        # 이전 종료에서 닫힌 추론 executor 정리
+    # 모델 로드: 레지스트리가 모델별로 한 번만 로드 (readiness 는 /health/ready)
+    if settings.MODEL_LOAD_MODE == "eager":
+        registry.preload(warmup=settings.MODEL_WARMUP)
+    elif settings.MODEL_LOAD_MODE == "background":
+        registry.preload_in_background(warmup=settings.MODEL_WARMUP)
+    # 동시 요청의 분류 모델 예측을 모아 한 번에 추론하는 마이크로 배처 (pipeline 의 비동기 경로가 사용)
+    app.state.predict_batcher = get_predict_batcher()
+    await app.state.predict_batcher.start()
     yield
     # 2) 애플리케이션 종료 시 실행 (필요 시 정리 로직 추가)
-    # 예: await some_cleanup()
+    await close_predict_batcher()
+    await close_naver_client()               # 네이버 API 커넥션 풀 정리
+    shutdown_executors(wait=False)           # 추론 executor 정리 (대기 중 작업 취소)
 
 # FastAPI 인스턴스 생성 시 lifespan 전달
 app = FastAPI(lifespan=lifespan)
 
+# 요청 지연시간 (라우트 템플릿 단위로 집계해 경로 파라미터별로 라벨이 늘어나지 않게 함)
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.labels(
+            request.method, getattr(route, "path", "unmatched"), str(status)
+        ).observe(time.perf_counter() - start)
+
+# 추론 executor 포화 → 429 (Retry-After), 종료 중 → 503
+@app.exception_handler(ExecutorSaturatedError)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+    return JSONResponse(
+        {"detail": str(exc)},
+        status_code=429,
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+@app.exception_handler(ExecutorClosedError)
+async def executor_closed_handler(request: Request, exc: ExecutorClosedError):
+    return JSONResponse({"detail": str(exc)}, status_code=503)
+
 # RESTful 라우터 등록
 app.include_router(news_router)
 app.include_router(predict_router)
+app.include_router(health_router)
+app.include_router(metrics_router)
+app.include_router(trends_router)
 
 # GraphQL 엔드포인트 등록 (POST & GET)
-app.add_route(
-    "/graphql",
-    GraphQL(schema=graphql_schema, context_value=graphql_context)
-)
-app.add_websocket_route(
-    "/graphql",
-    GraphQL(schema=graphql_schema, context_value=graphql_context)
+#  요청마다 context 에서 세션·DataLoader 생성, 요청이 끝나면 SessionCleanupExtension 이 세션 종료
+#  비용/깊이/별칭 제한을 넘는 쿼리는 실행 전에 거절, 영속 쿼리는 해시로 요청하면 파싱·검증 생략
+graphql_app = GraphQL(
+    schema=graphql_schema,
+    context_value=graphql_context,
+    validation_rules=validation_rules,
+    query_validator=query_validator,
+    http_handler=PersistedQueryHTTPHandler(extensions=[SessionCleanupExtension]),
 )
+app.add_route("/graphql", graphql_app)
+app.add_websocket_route("/graphql", graphql_app)
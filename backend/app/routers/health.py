@@ -0,0 +1,19 @@
+# backend/app/routers/health.py
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from backend.app.services.registry import registry
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+# 1) 프로세스 생존 여부 (GET /health/live)
+@router.get("/live")
+def live():
+    return {"status": "ok"}
+
+# 2) 모델 준비 여부 (GET /health/ready) — 로드 중이면 503
+@router.get("/ready")
+def ready():
+    body = {"ready": registry.ready, "models": registry.status()}
+    return JSONResponse(body, status_code=200 if body["ready"] else 503)
@@ -0,0 +1,16 @@
+# backend/app/routers/metrics.py
+
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from backend.app.utils.metrics import register_runtime_collector
+
+router = APIRouter(tags=["metrics"])
+
+# 큐 깊이·캐시 적중률 등 상태 값은 스크랩 시점에 읽어 옴
+register_runtime_collector()
+
+# Prometheus 스크랩 엔드포인트 (GET /metrics)
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
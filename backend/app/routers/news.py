@@ -1,14 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from backend.app.services.scraper import (
-    fetch_news, fetch_news_by_rss
+    afetch_news, afetch_news_pages, afetch_news_by_rss
 )
 from backend.app.services.crud import (
-    create_news, get_news, get_news_by_id, delete_news
+    create_news, create_news_bulk, get_news, get_news_page, get_news_by_id, delete_news,
+    search_news_local
 )
-from backend.app.routers.schemas import NewsCreate, NewsRead
+from backend.app.routers.schemas import NewsBulkResult, NewsCreate, NewsRead, NewsSearchHit
 from backend.app.db.session import get_db
 
 router = APIRouter(prefix="/news", tags=["news"])
@@ -19,10 +21,13 @@ async def search_news(
     q: str = Query(..., description="검색 키워드"),
     display: int = Query(10, ge=1, le=100),
     start: int = Query(1, ge=1),
-    sort: str = Query("date", pattern="^(date|sim)$")
+    sort: str = Query("date", pattern="^(date|sim)$"),
+    pages: int = Query(1, ge=1, le=10, description="start 부터 연속된 페이지 수 (동시 요청)")
 ) -> List[Dict]:
     try:
-        return fetch_news(query=q, display=display, start=start, sort=sort)
+        if pages > 1:
+            return await afetch_news_pages(query=q, pages=pages, display=display, sort=sort, start=start)
+        return await afetch_news(query=q, display=display, start=start, sort=sort)
     except Exception as e:
         raise HTTPException(status_code=502, detail=str(e))
 
@@ -31,37 +36,76 @@ async def search_news(
 async def get_rss(
     limit: int = Query(10, ge=1, le=100)
 ) -> List[Dict]:
-    return fetch_news_by_rss(max_articles=limit)
+    try:
+        return await afetch_news_by_rss(max_articles=limit)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+# ※ 아래 DB 핸들러는 동기 SQLAlchemy 를 쓰므로 async 가 아닌 def 로 선언
+#   (FastAPI 가 스레드풀에서 실행해 이벤트 루프를 막지 않음)
 
 # 3) CRUD: 단일 저장 (POST /news/)
 @router.post("/", response_model=NewsRead)
-async def add_news(
+def add_news(
     news_in: NewsCreate,
     db: Session = Depends(get_db)
 ) -> NewsRead:
     return create_news(db, news_in)
 
 # 4) CRUD: 일괄 저장 (POST /news/bulk)
-@router.post("/bulk", response_model=List[NewsRead])
-async def add_news_bulk(
+#    한 트랜잭션의 배치 INSERT, 중복 link 는 on_conflict 에 따라 건너뛰거나 갱신
+@router.post("/bulk", response_model=NewsBulkResult)
+def add_news_bulk(
     news_list: List[NewsCreate],
+    on_conflict: str = Query("skip", pattern="^(skip|update)$"),
     db: Session = Depends(get_db)
-) -> List[NewsRead]:
-    return [create_news(db, item) for item in news_list]
+) -> NewsBulkResult:
+    inserted, updated, skipped = create_news_bulk(db, news_list, on_conflict=on_conflict)
+    return {"inserted": inserted, "updated": updated, "skipped": skipped}
 
 # 5) CRUD: 저장된 뉴스 조회 (GET /news or /news/)
+#    최신순, 다음 페이지는 응답 헤더 X-Next-Cursor 값을 cursor 로 전달
 @router.get("", response_model=List[NewsRead])
 @router.get("/", response_model=List[NewsRead])
-async def read_news(
-    skip: int = Query(0, ge=0),
+def read_news(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor"),
     limit: int = Query(100, ge=1, le=100),
+    date_from: Optional[datetime] = Query(None, description="pub_date 시작 (포함)"),
+    date_to: Optional[datetime] = Query(None, description="pub_date 끝 (제외)"),
+    source: Optional[str] = Query(None, description="naver_search / naver_rss"),
+    skip: int = Query(0, ge=0, description="(deprecated) OFFSET 조회, cursor 사용 권장"),
     db: Session = Depends(get_db)
 ) -> List[NewsRead]:
-    return get_news(db, skip, limit)
+    if skip and not (cursor or date_from or date_to or source):
+        return get_news(db, skip, limit)
+    try:
+        items, next_cursor = get_news_page(
+            db, limit=limit, cursor=cursor, date_from=date_from, date_to=date_to, source=source
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
+
+# 6) 저장된 뉴스 전문 검색 (GET /news/local-search)
+#    외부 API 쿼터를 쓰지 않고 DB 의 FTS 색인에서 관련도 순으로 검색
+@router.get("/local-search", response_model=List[NewsSearchHit])
+def local_search_news(
+    q: str = Query(..., min_length=1, description="검색 키워드 (공백으로 구분한 단어 AND 검색)"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+) -> List[NewsSearchHit]:
+    return [
+        NewsSearchHit(**NewsRead.from_orm(hit["news"]).dict(), snippet=hit["snippet"], score=hit["score"])
+        for hit in search_news_local(db, q, limit=limit, offset=offset)
+    ]
 
-# 6) CRUD: 특정 뉴스 상세 조회 (GET /news/{news_id})
+# 7) CRUD: 특정 뉴스 상세 조회 (GET /news/{news_id})
 @router.get("/{news_id}", response_model=NewsRead)
-async def read_news_detail(
+def read_news_detail(
     news_id: int,
     db: Session = Depends(get_db)
 ) -> NewsRead:
@@ -70,9 +114,9 @@ async def read_news_detail(
         raise HTTPException(status_code=404, detail="News not found")
     return news
 
-# 7) CRUD: 뉴스 삭제 (DELETE /news/{news_id})
+# 8) CRUD: 뉴스 삭제 (DELETE /news/{news_id})
 @router.delete("/{news_id}")
-async def remove_news(
+def remove_news(
     news_id: int,
     db: Session = Depends(get_db)
 ):
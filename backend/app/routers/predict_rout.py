@@ -1,15 +1,32 @@
 # backend/app/routers/predict_rout.py
 
+import asyncio                                            # 스트리밍 배치의 동시 처리
+import copy
+import json
+import logging
+import time
 from fastapi import APIRouter, HTTPException, Depends  # FastAPI 라우터 및 예외, 의존성
+from fastapi.responses import StreamingResponse          # NDJSON 스트리밍 응답
+from starlette.concurrency import run_in_threadpool       # 블로킹 DB 조회를 스레드풀에서 실행
 from sqlalchemy.orm import Session                        # DB 세션 타입
-from typing import List, Optional                         # 타입 힌팅
-from pydantic import BaseModel, root_validator           # 요청/응답 모델 검증
+from typing import AsyncIterator, Dict, List, Literal, Optional, Tuple  # 타입 힌팅
+from pydantic import BaseModel, confloat, root_validator  # 요청/응답 모델 검증
 
 # 서비스 로직 임포트
-from backend.app.services.ner import extract_entities    # NER(개체명 인식) 추출 함수
-from backend.app.services.cot import cot_predict          # Chain-of-Thought 예측 함수
-from backend.app.db.session import get_db                # DB 세션 종속성
-from backend.app.services.crud import get_news_by_id     # 뉴스 조회 함수
+from backend.app.services.pipeline import (              # NER + 분류 / CoT 예측 (캐시, executor 사용)
+    PredictOptions, apredict_texts, predict_options, stored_version
+)
+from backend.app.services.cache import prediction_cache  # 예측 결과 캐시
+from backend.app.services.executor import executor_stats # 추론 executor 상태
+from backend.app.db.session import SessionLocal, get_db  # DB 세션 팩토리 / 종속성
+from backend.app.services.crud import (                  # 뉴스 조회 / 예측 결과 저장 함수 (저장소 오류는 무시)
+    get_news_by_id, get_news_by_ids, try_get_saved_predictions, try_save_predictions
+)
+from backend.app.config import settings                  # 스트리밍 동시 처리 설정
+from backend.app.utils.exceptions import ExecutorClosedError, ExecutorSaturatedError
+from backend.app.utils.logger import span                # 단계별 지연시간 기록
+
+logger = logging.getLogger(__name__)
 
 # 라우터 생성: /predict 경로로 시작하는 모든 엔드포인트에 적용
 router = APIRouter(prefix="/predict", tags=["predict"])
@@ -18,6 +35,10 @@ router = APIRouter(prefix="/predict", tags=["predict"])
 class PredictRequest(BaseModel):
     news_id: Optional[int] = None  # 뉴스 ID (DB 조회용)
     text: Optional[str]    = None  # 직접 입력한 텍스트
+    # 예측 모드 (생략 시 PREDICT_MODE 설정): cot | classifier | cascade (분류 모델 확신도 미달 시에만 CoT)
+    mode: Optional[Literal["cot", "classifier", "cascade"]] = None
+    confidence_threshold: Optional[confloat(ge=0, le=1)] = None  # cascade 임계값 (생략 시 설정값)
+    explain: bool = False          # 근거(reasoning) 요청: cascade 에서도 CoT 로 예측
 
     @root_validator
     def check_one_of(cls, values):
@@ -44,30 +65,41 @@ class PredictResponse(BaseModel):
     entities: List[Entity]
     predictions: List[Prediction]
 
-# 내부 헬퍼 함수: 단일 요청 처리 로직
-async def _predict_one(payload: PredictRequest, db: Session):
-    # 1) 텍스트 결정: news_id 모드 vs text 직접 모드
+# 해석된 요청 항목: (분석할 텍스트, 자산명, news_id)
+Resolved = Tuple[str, Optional[str], Optional[int]]
+
+# 내부 헬퍼 함수: 요청에서 분석할 텍스트와 자산명 결정
+def _resolve_text(payload: PredictRequest, db: Session) -> Resolved:
+    # news_id 모드 vs text 직접 모드
     if payload.news_id is not None:
         # DB에서 뉴스 조회
-        news = get_news_by_id(db, payload.news_id)
+        with span("db_fetch", batch=1):
+            news = get_news_by_id(db, payload.news_id)
         if not news:
             # 없는 ID면 404 에러
             raise HTTPException(status_code=404, detail="News not found")
         # title + description 합쳐서 사용
-        text = f"{news.title}\n{news.description}"
-        asset_name = news.title
-    else:
-        # 직접 입력된 텍스트 사용
-        text = payload.text
-        asset_name = None
-
-    # 2) NER로 엔티티 추출
-    entities = extract_entities(text)
+        return f"{news.title}\n{news.description}", news.title, payload.news_id
+    # 직접 입력된 텍스트 사용
+    return payload.text, None, None
 
-    # 3) Chain-of-Thought 방식으로 예측 수행
-    predictions = cot_predict(entities, text)
+# 내부 헬퍼 함수: 배치 요청의 텍스트 결정 (news_id 들은 IN 쿼리 한 번으로 조회, 없는 ID 는 None)
+def _resolve_many(payloads: List[PredictRequest], db: Session) -> List[Optional[Resolved]]:
+    with span("db_fetch", batch=len(payloads)):
+        news_map = get_news_by_ids(db, (p.news_id for p in payloads if p.news_id is not None))
+    resolved = []
+    for p in payloads:
+        if p.news_id is None:
+            resolved.append((p.text, None, None))
+        elif p.news_id in news_map:
+            news = news_map[p.news_id]
+            resolved.append((f"{news.title}\n{news.description}", news.title, p.news_id))
+        else:
+            resolved.append(None)
+    return resolved
 
-    # 4) news_id 모드일 땐 asset명 덮어쓰기, 결과 없으면 기본값 추가
+# 내부 헬퍼 함수: news_id 모드일 땐 asset명 덮어쓰기, 결과 없으면 기본값 추가
+def _finalize(entities: List[dict], predictions: List[dict], asset_name: Optional[str]):
     if asset_name is not None:
         for p in predictions:
             p["asset"] = asset_name
@@ -78,10 +110,58 @@ async def _predict_one(payload: PredictRequest, db: Session):
                 "confidence": None,
                 "reasoning": ""
             })
-
-    # 최종 결과 딕셔너리 반환
     return {"entities": entities, "predictions": predictions}
 
+# 내부 헬퍼 함수: 요청의 예측 옵션 (같은 결과를 내는 조합은 같은 값)
+def _options(payload: PredictRequest) -> PredictOptions:
+    return predict_options(payload.mode, payload.confidence_threshold, payload.explain)
+
+# 내부 헬퍼 함수: 해석된 항목들의 예측 (입력 순서, 항목마다 독립된 사본)
+#  news_id 항목은 DB 에 저장된 결과를 먼저 읽고, 새로 계산한 결과는 일괄 저장
+async def _predict_resolved(
+    items: List[Resolved],
+    db: Session,
+    options: PredictOptions,
+    db_lock: Optional[asyncio.Lock] = None,    # 여러 작업이 같은 세션을 쓸 때 DB 접근 직렬화
+) -> List[dict]:
+    db_lock = db_lock or asyncio.Lock()
+    version = stored_version(options)
+    news_ids = {news_id for _, _, news_id in items if news_id is not None}
+    saved: Dict[int, dict] = {}
+    if version and news_ids:
+        async with db_lock:
+            saved = await run_in_threadpool(try_get_saved_predictions, db, news_ids, version)
+
+    pending = [item for item in items if item[2] not in saved]
+    computed: Dict[str, dict] = {}
+    if pending:
+        texts = list(dict.fromkeys(text for text, _, _ in pending))
+        started = time.perf_counter()
+        # 추론 executor 가 가득 차면 ExecutorSaturatedError → 429
+        computed = dict(zip(texts, await apredict_texts(texts, options)))
+        latency_ms = (time.perf_counter() - started) * 1000 / len(texts)
+        fresh = {news_id: computed[text] for text, _, news_id in pending if news_id is not None}
+        if version and fresh:
+            async with db_lock:
+                await run_in_threadpool(try_save_predictions, db, fresh, version, latency_ms)
+
+    return [
+        copy.deepcopy(saved[news_id] if news_id in saved else computed[text])
+        for text, _, news_id in items
+    ]
+
+# 내부 헬퍼 함수: 단일 요청 처리 로직
+async def _predict_one(payload: PredictRequest, db: Session):
+    # 1) 텍스트 결정
+    item = await run_in_threadpool(_resolve_text, payload, db)
+
+    # 2) NER로 엔티티 추출 + 3) 모드에 따라 분류 모델 / CoT 로 예측 수행 (저장된 결과·캐시 적중 시 생략)
+    result = (await _predict_resolved([item], db, _options(payload)))[0]
+    asset_name = item[1]
+
+    # 4) 최종 결과 딕셔너리 반환
+    return _finalize(result["entities"], result["predictions"], asset_name)
+
 # 단일 예측 엔드포인트
 @router.post("/", response_model=PredictResponse)
 async def predict(
@@ -96,8 +176,118 @@ async def predict_batch(
     payloads: List[PredictRequest],            # 요청 본문으로 여러 PredictRequest 배열 받음
     db: Session = Depends(get_db)              # DB 세션 주입
 ):
-    results = []                               # 결과 리스트
-    for p in payloads:
-        res = await _predict_one(p, db)        # 각 요청별 예측 수행
-        results.append(res)
-    return results                             # 전체 결과 반환
+    resolved = await run_in_threadpool(_resolve_many, payloads, db)
+    if any(r is None for r in resolved):
+        raise HTTPException(status_code=404, detail="News not found")
+    # 예측 옵션별로, 저장된 결과·캐시에 없는 텍스트만 모아 NER(nlp.pipe) + 배치 추론
+    groups: Dict[PredictOptions, List[int]] = {}
+    for i, payload in enumerate(payloads):
+        groups.setdefault(_options(payload), []).append(i)
+    db_lock = asyncio.Lock()
+    outputs = await asyncio.gather(*(
+        _predict_resolved([resolved[i] for i in indices], db, options, db_lock)
+        for options, indices in groups.items()
+    ))
+    results: List[dict] = [None] * len(resolved)
+    for indices, output in zip(groups.values(), outputs):
+        for i, res in zip(indices, output):
+            results[i] = res
+    return [                                   # 전체 결과 반환
+        _finalize(res["entities"], res["predictions"], asset_name)
+        for res, (_, asset_name, _) in zip(results, resolved)
+    ]
+
+# NDJSON 한 줄: {"index": 요청 내 위치, "result": PredictResponse} 또는 {"index", "error": {status, detail}}
+def _ndjson(index: int, result: Optional[dict] = None, status: int = 200, detail: str = "") -> str:
+    body = {"index": index}
+    if result is not None:
+        body["result"] = PredictResponse(**result).dict()
+    else:
+        body["error"] = {"status": status, "detail": detail}
+    return json.dumps(body, ensure_ascii=False) + "\n"
+
+async def _stream_predictions(
+    resolved: List[Optional[Resolved]], options_list: List[PredictOptions]
+) -> AsyncIterator[str]:
+    # 요청 종속성(get_db)의 세션은 본문 전송 전에 닫히므로, 스트림 동안 쓸 세션을 직접 열고 닫음
+    db = SessionLocal()
+    try:
+        async for line in _stream_with_session(resolved, options_list, db):
+            yield line
+    finally:
+        db.close()
+
+async def _stream_with_session(
+    resolved: List[Optional[Resolved]], options_list: List[PredictOptions], db: Session
+) -> AsyncIterator[str]:
+    # 같은 (텍스트, news_id, 옵션) 조합은 한 번만 처리하고, 결과를 해당 위치들에 모두 전달
+    groups: Dict[Tuple[str, Optional[int], PredictOptions], List[int]] = {}
+    # 옵션별 텍스트 → 그 텍스트를 가진 news_id 목록 (직접 입력한 텍스트는 None)
+    by_options: Dict[PredictOptions, Dict[str, List[Optional[int]]]] = {}
+    for i, item in enumerate(resolved):
+        if item is None:
+            yield _ndjson(i, status=404, detail="News not found")
+            continue
+        key = (item[0], item[2], options_list[i])
+        if key not in groups:
+            by_options.setdefault(options_list[i], {}).setdefault(item[0], []).append(item[2])
+        groups.setdefault(key, []).append(i)
+
+    # 옵션이 같은 고유 텍스트끼리 묶음을 만듦 (같은 텍스트의 news_id 들은 한 묶음에서 함께 저장)
+    size = max(1, settings.PREDICT_STREAM_CHUNK_SIZE)
+    chunks: List[Tuple[PredictOptions, List[str]]] = []
+    for options, ids_by_text in by_options.items():
+        texts = list(ids_by_text)
+        chunks.extend((options, texts[i:i + size]) for i in range(0, len(texts), size))
+    semaphore = asyncio.Semaphore(max(1, settings.PREDICT_STREAM_CONCURRENCY))
+    db_lock = asyncio.Lock()
+
+    async def run(options: PredictOptions, chunk: List[str]):
+        items = [(text, None, news_id) for text in chunk for news_id in by_options[options][text]]
+        async with semaphore:
+            try:
+                return options, items, await _predict_resolved(items, db, options, db_lock), None
+            except ExecutorSaturatedError as e:
+                return options, items, None, (429, str(e))
+            except ExecutorClosedError as e:
+                return options, items, None, (503, str(e))
+            except Exception as e:
+                logger.exception("streaming prediction failed")
+                return options, items, None, (500, str(e))
+
+    tasks = [asyncio.create_task(run(options, chunk)) for options, chunk in chunks]
+    try:
+        # 끝난 묶음부터 바로 내보냄 (응답 순서 ≠ 요청 순서, index 로 구분)
+        for finished in asyncio.as_completed(tasks):
+            options, items, results, error = await finished
+            for n, (text, _, news_id) in enumerate(items):
+                for i in groups[(text, news_id, options)]:
+                    if error is not None:
+                        yield _ndjson(i, status=error[0], detail=error[1])
+                        continue
+                    res = copy.deepcopy(results[n])
+                    yield _ndjson(i, _finalize(res["entities"], res["predictions"], resolved[i][1]))
+    finally:
+        # 클라이언트가 연결을 끊으면 남은 작업 취소
+        for task in tasks:
+            task.cancel()
+
+# 스트리밍 배치 예측 엔드포인트 (application/x-ndjson, 항목이 끝나는 대로 한 줄씩 전송)
+@router.post("/batch/stream")
+async def predict_batch_stream(
+    payloads: List[PredictRequest],
+    db: Session = Depends(get_db)
+):
+    resolved = await run_in_threadpool(_resolve_many, payloads, db)
+    options_list = [_options(payload) for payload in payloads]
+    return StreamingResponse(_stream_predictions(resolved, options_list), media_type="application/x-ndjson")
+
+# 예측 캐시 적중/미스 통계
+@router.get("/cache/stats")
+async def cache_stats():
+    return prediction_cache.stats()
+
+# 추론 executor 실행/대기/거절 통계
+@router.get("/executor/stats")
+async def executor_status():
+    return executor_stats()
@@ -7,6 +7,7 @@ class NewsBase(BaseModel):
     originallink: str | None = None
     description: str | None = None
     pub_date: datetime
+    source: str | None = None
 
 class NewsCreate(NewsBase):
     pass
@@ -16,4 +17,21 @@ class NewsRead(NewsBase):
     created_at: datetime
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+class NewsBulkResult(BaseModel):
+    inserted: list[NewsRead]
+    updated: list[NewsRead] = []  # on_conflict=update 로 내용이 갱신된 기존 기사
+    skipped: list[str]  # 이미 저장되어 있거나 요청 안에서 중복된 link
+
+class NewsSearchHit(NewsRead):
+    snippet: str   # 일치 부분을 <b></b> 로 강조한 제목/본문 일부
+    score: float   # 관련도 (높을수록 관련)
+
+class TrendPoint(BaseModel):
+    bucket_start: datetime
+    mentions: int                  # 개체명으로 언급된 기사 수
+    up: int
+    down: int
+    neutral: int
+    mean_confidence: float | None  # 구간 내 예측 확신도 평균 (예측이 없으면 None)
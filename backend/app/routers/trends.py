@@ -0,0 +1,30 @@
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from backend.app.db.session import get_db
+from backend.app.routers.schemas import TrendPoint
+from backend.app.services.pipeline import stored_model_version
+from backend.app.services.trends import get_trends
+
+router = APIRouter(prefix="/trends", tags=["trends"])
+
+# 자산별 시간 구간 추이 (GET /trends?asset=&bucket=&from=&to=)
+#  예측 저장 시 증분 갱신되는 집계 테이블만 읽으므로 기사 수와 무관하게 구간 수에 비례
+@router.get("", response_model=List[TrendPoint])
+@router.get("/", response_model=List[TrendPoint])
+def read_trends(
+    asset: str = Query(..., min_length=1, description="자산(개체명)"),
+    bucket: str = Query("hour", pattern="^(minute|hour|day)$"),
+    date_from: Optional[datetime] = Query(None, alias="from", description="구간 시작 (포함)"),
+    date_to: Optional[datetime] = Query(None, alias="to", description="구간 끝 (제외)"),
+    model: str = Query(
+        "cot", pattern="^(cot|classifier|cascade|keyword)$",
+        description="/predict 의 예측 모드 (cascade 는 기본 임계값), keyword: GraphQL predict",
+    ),
+    db: Session = Depends(get_db)
+) -> List[TrendPoint]:
+    if date_from and date_to and date_from >= date_to:
+        raise HTTPException(status_code=400, detail="from must be earlier than to")
+    return get_trends(db, asset, stored_model_version(model), bucket, date_from, date_to)
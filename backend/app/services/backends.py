@@ -0,0 +1,162 @@
+# backend/app/services/backends.py
+import hashlib
+import logging
+from pathlib import Path
+
+import torch
+from transformers.modeling_outputs import SequenceClassifierOutput
+
+from backend.app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 선택 가능한 추론 백엔드
+#   eager       : HuggingFace 모델 그대로 (fp32)
+#   int8        : Linear 레이어 동적 int8 양자화 (CPU 전용)
+#   torchscript : torch.jit.trace 로 내보낸 그래프 (models/export/ 에 저장·재사용, 분류 모델 전용)
+BACKENDS = ("eager", "int8", "torchscript")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def configure_threads() -> None:
+    """TORCH_NUM_THREADS / TORCH_INTEROP_THREADS 설정을 적용합니다. (0 이면 torch 기본값 유지)"""
+    if settings.TORCH_NUM_THREADS > 0:
+        torch.set_num_threads(settings.TORCH_NUM_THREADS)
+    if settings.TORCH_INTEROP_THREADS > 0:
+        try:
+            torch.set_interop_threads(settings.TORCH_INTEROP_THREADS)
+        except RuntimeError as e:
+            # inter-op 스레드 수는 병렬 작업이 시작되기 전 한 번만 설정 가능
+            logger.warning(f"Could not set inter-op threads: {e}")
+
+
+def cpu_dtype(device: torch.device) -> torch.dtype:
+    """fp16 은 CPU 에서 오히려 느리므로, GPU 일 때만 fp16 을 사용합니다."""
+    return torch.float16 if device.type == "cuda" else torch.float32
+
+
+def quantize_int8(model: torch.nn.Module) -> torch.nn.Module:
+    """nn.Linear 레이어를 동적 int8 양자화한 복사본을 반환합니다."""
+    if any(p.device.type != "cpu" for p in model.parameters()):
+        logger.warning("int8 dynamic quantization is CPU-only; keeping the model as is")
+        return model
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class _LogitsOnly(torch.nn.Module):
+    # trace 대상: (input_ids, attention_mask) → logits 텐서
+    def __init__(self, model: torch.nn.Module):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask):
+        return self.model(input_ids=input_ids, attention_mask=attention_mask).logits
+
+
+class TracedClassifier:
+    """
+    TorchScript 그래프를 HF 분류 모델처럼 `model(**enc).logits` 형태로 호출할 수 있게 감쌉니다.
+    """
+
+    def __init__(self, module: torch.jit.ScriptModule, config=None):
+        self.module = module
+        self.config = config
+
+    def __call__(self, input_ids, attention_mask, **_):
+        return SequenceClassifierOutput(logits=self.module(input_ids, attention_mask))
+
+    def eval(self):
+        return self
+
+
+def export_dir() -> Path:
+    path = Path(settings.EXPORT_DIR)
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+
+def export_key(model, model_id: str = "") -> str:
+    """
+    내보낸 그래프의 키: 모델 이름 + config + 가중치 해시.
+    같은 이름이라도 가중치나 설정이 바뀌면 키가 달라져 다시 trace 합니다.
+    """
+    digest = hashlib.sha256()
+    digest.update(model_id.encode())
+    digest.update(model.config.to_json_string(use_diff=False).encode())
+    for key, tensor in sorted(model.state_dict().items()):
+        digest.update(key.encode())
+        digest.update(str(tensor.dtype).encode())
+        digest.update(str(tuple(tensor.shape)).encode())
+        digest.update(tensor.detach().cpu().contiguous().view(torch.uint8).numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def export_torchscript(tokenizer, model, path: Path) -> torch.jit.ScriptModule:
+    """분류 모델을 예시 입력으로 trace 하여 path 에 저장합니다."""
+    example = tokenizer(
+        ["뉴스 기사 예시 입력", "삼성전자가 코스피 시장에서 급등했다."],
+        padding=True,
+        return_tensors="pt",
+    )
+    wrapper = _LogitsOnly(model).eval()
+    with torch.no_grad():
+        traced = torch.jit.trace(
+            wrapper,
+            (example["input_ids"], example["attention_mask"]),
+            strict=False,
+            check_trace=False,
+        )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    torch.jit.save(traced, str(path))
+    logger.info(f"Exported TorchScript classifier to {path}")
+    return traced
+
+
+def _load_or_export(tokenizer, model, name: str, model_id: str) -> torch.jit.ScriptModule:
+    # EXPORT_DIR/<name>-<키>.pt 를 재사용하고, 키가 다른 예전 그래프는 지움
+    path = export_dir() / f"{name}-{export_key(model, model_id)}.pt"
+    for stale in path.parent.glob(f"{name}-*.pt"):
+        if stale != path:
+            logger.info(f"Removing stale TorchScript export {stale}")
+            stale.unlink(missing_ok=True)
+    if path.exists():
+        try:
+            return torch.jit.load(str(path))
+        except RuntimeError as e:
+            logger.warning(f"Could not load TorchScript export {path}, re-tracing: {e}")
+    return export_torchscript(tokenizer, model, path)
+
+
+def apply_classifier_backend(
+    tokenizer, model, backend: str = None, name: str = "classifier", model_id: str = ""
+):
+    """
+    분류 모델에 선택한 백엔드를 적용합니다.
+    torchscript 는 EXPORT_DIR/<name>-<키>.pt 가 있으면 불러오고, 없거나 모델이 바뀌었으면 trace 후 저장합니다.
+    (키는 model_id + config + 가중치 해시, export_key 참고)
+    """
+    backend = backend or settings.CLASSIFIER_BACKEND
+    if backend == "eager":
+        return model
+    if backend == "int8":
+        return quantize_int8(model)
+    if backend == "torchscript":
+        traced = _load_or_export(tokenizer, model, name, model_id)
+        return TracedClassifier(traced, config=model.config)
+    raise ValueError(f"unknown inference backend: {backend} (choose from {BACKENDS})")
+
+
+def apply_generation_backend(model, backend: str = None):
+    """
+    생성(CoT) 모델에 백엔드를 적용합니다. generate() 는 trace 할 수 없으므로
+    torchscript 를 요청하면 경고 후 eager 로 동작합니다.
+    """
+    backend = backend or settings.COT_BACKEND
+    if backend == "int8":
+        return quantize_int8(model)
+    if backend == "torchscript":
+        logger.warning("torchscript backend is not supported for generation; using eager")
+        return model
+    if backend != "eager":
+        raise ValueError(f"unknown inference backend: {backend} (choose from {BACKENDS})")
+    return model
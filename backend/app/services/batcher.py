@@ -0,0 +1,138 @@
+# backend/app/services/batcher.py
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple
+
+
+def plan_token_batches(lengths: Sequence[int], max_tokens: int, max_batch_size: int) -> List[List[int]]:
+    """
+    길이(토큰 수)가 제각각인 입력을 패딩 낭비가 적은 배치들로 나눕니다. (입력 위치 목록의 리스트)
+
+    긴 입력부터 정렬해 비슷한 길이끼리 묶고, 배치의 패딩 포함 토큰 수(개수 x 최대 길이)가
+    max_tokens 를, 개수가 max_batch_size 를 넘지 않게 자릅니다. 혼자서 max_tokens 를 넘는 입력은 단독 배치가 됩니다.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+    batches: List[List[int]] = []
+    for i in order:
+        batch = batches[-1] if batches else None
+        # 내림차순이므로 배치의 최대 길이는 첫 입력의 길이
+        if batch and len(batch) < max_batch_size and (len(batch) + 1) * max(1, lengths[batch[0]]) <= max_tokens:
+            batch.append(i)
+        else:
+            batches.append([i])
+    return batches
+
+
+class MicroBatcher:
+    """
+    동시에 들어오는 요청을 최대 max_wait_ms 동안 모아 한 번의 배치로 처리합니다.
+
+    process_fn 은 입력 리스트를 받아 같은 길이·같은 순서의 결과 리스트를 반환해야 하며,
+    이벤트 루프를 막지 않도록 executor 스레드에서 실행됩니다.
+    runner(process_fn, items) 를 주면 그 코루틴으로 실행합니다. (예: 크기 제한이 있는 추론 executor)
+    """
+
+    def __init__(
+        self,
+        process_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        runner: Optional[Callable[[Callable, List[Any]], Awaitable[List[Any]]]] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self._process_fn = process_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._runner = runner
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def queue_depth(self) -> int:
+        """배치로 묶이기를 기다리는 요청 수"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        """배치 수집 워커를 시작합니다. (submit 시 자동으로 시작되기도 합니다)"""
+        # 큐·워커는 이벤트 루프에 묶이므로, 다른 루프에서 쓰이면 새로 만듦 (테스트 클라이언트 등)
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """워커를 종료하고, 처리되지 못한 요청은 에러로 돌려보냅니다."""
+        if self._loop is not asyncio.get_running_loop():
+            # 시작하지 않았거나 다른(이미 끝난) 루프의 워커·큐는 버림
+            self._worker = self._queue = self._loop = None
+            return
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+        while self._queue is not None and not self._queue.empty():
+            _, fut = self._queue.get_nowait()
+            if not fut.done():
+                fut.set_exception(RuntimeError("batcher stopped"))
+
+    async def submit(self, item: Any) -> Any:
+        """단일 입력을 큐에 넣고, 배치 처리 결과 중 자신의 결과를 기다립니다."""
+        await self.start()
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, fut))
+        return await fut
+
+    async def submit_many(self, items: List[Any]) -> List[Any]:
+        return list(await asyncio.gather(*(self.submit(it) for it in items)))
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        # 첫 요청이 올 때까지 대기한 뒤, 마감 시간까지 최대 max_batch_size 만큼 모음
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            # 이미 취소된 요청은 제외
+            batch = [(item, fut) for item, fut in batch if not fut.done()]
+            if not batch:
+                continue
+            items = [item for item, _ in batch]
+            try:
+                if self._runner is not None:
+                    results = await self._runner(self._process_fn, items)
+                else:
+                    results = await loop.run_in_executor(None, self._process_fn, items)
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"process_fn returned {len(results)} results for {len(items)} inputs"
+                    )
+            except asyncio.CancelledError:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(RuntimeError("batcher stopped"))
+                raise
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            for (_, fut), res in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(res)
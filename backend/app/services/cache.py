@@ -0,0 +1,120 @@
+# backend/app/services/cache.py
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from backend.app.config import settings
+
+
+class PredictionCache:
+    """
+    예측 결과 캐시. 키는 (원문 텍스트, 모델 id, 모드, 생성 파라미터)의 sha256 입니다.
+    결과의 개체 start/end 오프셋과 제목/본문 분할은 입력 문자열 기준이므로
+    공백·유니코드 정규화 없이 원문 그대로 키를 만듭니다.
+
+    - 1차: 메모리 LRU + TTL
+    - 2차(선택): SQLite 파일 (프로세스 재시작·다중 워커 간 공유)
+    값은 JSON 으로 저장되므로 get() 은 항상 새 객체를 돌려줍니다. (호출자가 결과를 수정해도 안전)
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600, sqlite_path: str = ""):
+        self.max_entries = max_entries
+        self.ttl = ttl_seconds
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS prediction_cache ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+        self.hits = 0
+        self.misses = 0
+        self.persistent_hits = 0
+
+    @staticmethod
+    def make_key(text: str, model_id: str, mode: str, params: Optional[Dict] = None) -> str:
+        payload = json.dumps(
+            [text or "", model_id, mode, params or {}],
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl > 0 and time.time() - created_at > self.ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._expired(entry[1]):
+                del self._memory[key]
+                entry = None
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return json.loads(entry[0])
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, created_at FROM prediction_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and not self._expired(row[1]):
+                    # 메모리 계층으로 승격
+                    self._put_memory(key, row[0], row[1])
+                    self.hits += 1
+                    self.persistent_hits += 1
+                    return json.loads(row[0])
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        raw = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self._put_memory(key, raw, now)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO prediction_cache (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, raw, now),
+                )
+                self._db.commit()
+
+    def _put_memory(self, key: str, raw: str, created_at: float) -> None:
+        self._memory[key] = (raw, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM prediction_cache")
+                self._db.commit()
+            self.hits = self.misses = self.persistent_hits = 0
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "persistent_hits": self.persistent_hits,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._memory),
+        }
+
+
+# 애플리케이션 전역 예측 캐시
+prediction_cache = PredictionCache(
+    max_entries=settings.PREDICT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PREDICT_CACHE_TTL_SECONDS,
+    sqlite_path=settings.PREDICT_CACHE_SQLITE_PATH,
+)
@@ -0,0 +1,120 @@
+# backend/app/services/context.py
+import re
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from backend.app.utils.metrics import COT_CONTEXT_TOKENS, COT_CONTEXT_TOKENS_SAVED
+
+# (시작, 끝) 글자 위치
+Span = Tuple[int, int]
+
+# 문장 경계: 문장부호 뒤 공백, 또는 줄바꿈 (3.5% 같은 소수점은 나누지 않음)
+_BOUNDARY_RE = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+
+def split_sentences(text: str, start: int = 0) -> List[Span]:
+    """text[start:] 를 문장 단위 글자 구간으로 나눕니다. (공백뿐인 구간은 제외)"""
+    spans: List[Span] = []
+    pos = start
+    for m in _BOUNDARY_RE.finditer(text, start):
+        if text[pos:m.start()].strip():
+            spans.append((pos, m.start()))
+        pos = m.end()
+    if text[pos:].strip():
+        spans.append((pos, len(text)))
+    return spans
+
+
+class ArticleContext:
+    """
+    CoT 프롬프트에 넣을 기사 문맥을 개체별로 고릅니다.
+
+    기사 전체가 토큰 예산 안이면 그대로 쓰고, 넘으면 제목(첫 줄)과 개체가 언급된 문장을 먼저 넣은 뒤
+    예산이 남는 만큼 언급 문장의 앞뒤 문장을 가까운 순서로 추가합니다. (원문 순서 유지)
+    기사를 한 번만 토큰화해 같은 기사의 모든 개체가 재사용합니다.
+    """
+
+    def __init__(self, text: str, tokenizer):
+        self.text = text
+        encoded = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)
+        self._starts = [start for start, _ in encoded["offset_mapping"]]
+        self.total_tokens = len(self._starts)
+        newline = text.find("\n")
+        self.title: Optional[Span] = (0, newline) if newline >= 0 else None
+        self.sentences = split_sentences(text, newline + 1 if newline >= 0 else 0)
+
+    def tokens(self, span: Span) -> int:
+        return bisect_left(self._starts, span[1]) - bisect_left(self._starts, span[0])
+
+    def _window(self, span: Span, mention: Span, budget: int) -> Span:
+        # 예산보다 긴 문장은 언급 위치를 중심으로 budget 토큰만 남김
+        lo, hi = bisect_left(self._starts, span[0]), bisect_left(self._starts, span[1])
+        if hi - lo <= budget:
+            return span
+        if budget <= 0:
+            return (span[0], span[0])
+        first = max(lo, min(bisect_left(self._starts, mention[0]) - budget // 2, hi - budget))
+        last = first + budget
+        end = self._starts[last] if last < len(self._starts) else len(self.text)
+        return (self._starts[first], min(end, span[1]))
+
+    def mentions(self, entity: Dict) -> List[Span]:
+        # NER 이 준 위치 + 같은 이름의 다른 등장 위치 (DB 에서 읽은 개체처럼 위치가 없으면 이름으로만 찾음)
+        spans = set()
+        if entity.get("start") is not None and entity.get("end") is not None:
+            spans.add((entity["start"], entity["end"]))
+        name = entity["entity"]
+        i = self.text.find(name) if name else -1
+        while i >= 0:
+            spans.add((i, i + len(name)))
+            i = self.text.find(name, i + 1)
+        return sorted(spans)
+
+    def _record(self, selected: int) -> None:
+        COT_CONTEXT_TOKENS.labels("original").inc(self.total_tokens)
+        COT_CONTEXT_TOKENS.labels("selected").inc(selected)
+        COT_CONTEXT_TOKENS_SAVED.inc(self.total_tokens - selected)
+
+    def select(self, entity: Dict, budget: int) -> str:
+        """entity 주변 문맥을 budget 토큰 이내로 골라 '제목\\n본문' 형태로 반환합니다. (budget <= 0 이면 원문)"""
+        if budget <= 0 or self.total_tokens <= budget:
+            self._record(self.total_tokens)
+            return self.text
+
+        remaining = budget
+        title = ""
+        if self.title is not None:
+            span = self._window(self.title, self.title, remaining)
+            remaining -= self.tokens(span)
+            title = self.text[span[0]:span[1]].strip()
+
+        # 언급이 있는 문장 (언급 순서), 본문에 언급이 없으면 첫 문장(리드)부터
+        anchors: Dict[int, Span] = {}
+        for mention in self.mentions(entity):
+            for i, (start, end) in enumerate(self.sentences):
+                if start <= mention[0] < end:
+                    anchors.setdefault(i, mention)
+                    break
+        if not anchors and self.sentences:
+            anchors[0] = self.sentences[0]
+
+        chosen: Dict[int, Span] = {}
+        for distance in range(len(self.sentences)):
+            for anchor, mention in anchors.items():
+                for i in (anchor,) if distance == 0 else (anchor - distance, anchor + distance):
+                    if not 0 <= i < len(self.sentences) or i in chosen:
+                        continue
+                    cost = self.tokens(self.sentences[i])
+                    if cost <= remaining:
+                        chosen[i] = self.sentences[i]
+                        remaining -= cost
+                    elif distance == 0 and not chosen:
+                        # 첫 언급 문장조차 예산을 넘으면 언급 주변만 잘라 넣음
+                        chosen[i] = self._window(self.sentences[i], mention, remaining)
+                        remaining -= self.tokens(chosen[i])
+            if remaining <= 0:
+                break
+
+        body = " ".join(self.text[start:end].strip() for _, (start, end) in sorted(chosen.items()))
+        self._record(budget - remaining)
+        return f"{title}\n{body}" if self.title is not None else body
@@ -1,24 +1,51 @@
 # backend/app/services/cot.py
-from typing import List, Dict, Tuple
-from backend.app.services.predict_ser import load_model
+import time
+from functools import lru_cache
+from typing import List, Dict, Optional, Set, Tuple
+from backend.app.config import settings
+from backend.app.services.context import ArticleContext
+from backend.app.services.predict_ser import load_draft_model, load_model, speculative_enabled
+from backend.app.services.speculative import speculative_generate
+from backend.app.utils.logger import span
+from backend.app.utils.metrics import BATCH_SIZE, GENERATED_TOKENS, GENERATION_TOKENS_PER_SECOND
+from transformers import (
+    DynamicCache,
+    LogitsProcessor,
+    LogitsProcessorList,
+    StoppingCriteria,
+    StoppingCriteriaList,
+)
 import torch
 
-# 모델과 토크나이저 로드
-tokenizer, model, device = load_model()
+# 최종 답 표시와 허용 방향 (제약 디코딩용)
+ANSWER_MARKER = "결과:"
+DIRECTIONS = ("up", "down", "neutral")
 
-# CoT(Chain-of-Thought) 프롬프트 생성 함수
-def generate_cot_prompt(entity: str, text: str) -> str:
+# 생성 결과: (프롬프트 이후 텍스트, 제약 디코딩으로 고른 방향, 확신도) — 일반 디코딩이면 방향·확신도는 None
+Generated = Tuple[str, Optional[str], Optional[float]]
+
+# CoT(Chain-of-Thought) 프롬프트를 기사 부분(prefix)과 자산 부분(suffix)으로 분리
+def split_cot_prompt(entity: str, text: str) -> Tuple[str, str]:
     """
-    주어진 뉴스 텍스트와 자산명에 대해 단계별 사고 과정을 요청하는 CoT 프롬프트를 생성합니다.
+    같은 기사에 대한 프롬프트는 prefix(기사 본문)가 동일하므로,
+    prefix 는 한 번만 인코딩하고 자산별 suffix 만 따로 인코딩할 수 있습니다.
     """
-    prompt = (
-        f"뉴스 기사:\n{text}\n"
+    prefix = f"뉴스 기사:\n{text}\n"
+    suffix = (
         f"분석 대상 자산: {entity}\n"
         "위 자산의 가격 방향성을 'up', 'down', 'neutral' 중 하나로 예측하세요.\n"
         "또한, 예측 근거를 단계별로 서술해주세요.\n"
         "단계별 사고 과정:\n"
     )
-    return prompt
+    return prefix, suffix
+
+# CoT(Chain-of-Thought) 프롬프트 생성 함수
+def generate_cot_prompt(entity: str, text: str) -> str:
+    """
+    주어진 뉴스 텍스트와 자산명에 대해 단계별 사고 과정을 요청하는 CoT 프롬프트를 생성합니다.
+    """
+    prefix, suffix = split_cot_prompt(entity, text)
+    return prefix + suffix
 
 # CoT 결과에서 사고 과정(reasoning)과 최종 예측(direction)을 파싱
 def parse_cot_output(decoded: str, prompt: str) -> Tuple[str, str]:
@@ -32,39 +59,354 @@ def parse_cot_output(decoded: str, prompt: str) -> Tuple[str, str]:
     if sep in body:
         parts = body.split(sep, 1)
         reasoning = parts[0].strip()
-        direction = parts[1].split()[0].strip()
+        tail = parts[1].split()
+        direction = tail[0].strip() if tail else ''
     else:
         # 키워드가 없으면 전체를 사고 과정으로 처리
         reasoning = body.strip()
         direction = ''
     return reasoning, direction
 
+def _pad_id(tokenizer) -> int:
+    return tokenizer.pad_token_id if tokenizer.pad_token_id is not None else tokenizer.eos_token_id
+
+def generation_params(max_new_tokens: int) -> Dict:
+    """
+    generate 파라미터. COT_DETERMINISTIC 이면 greedy 디코딩이라 같은 입력에 같은 결과가 나오므로
+    예측 캐시를 사용할 수 있습니다. (캐시 키에도 이 값이 포함됨)
+    COT_CONSTRAINED 면 'constrained', COT_CONTEXT_TOKENS 가 있으면 'context_tokens' 가 추가됩니다.
+    (AnswerConstraint / ArticleContext 참고, generate 에는 전달하지 않음)
+    """
+    if settings.COT_DETERMINISTIC:
+        params = {"max_new_tokens": max_new_tokens, "do_sample": False}
+    else:
+        params = {"max_new_tokens": max_new_tokens, "do_sample": True, "temperature": 0.7, "top_p": 0.9}
+    if settings.COT_CONSTRAINED:
+        params["constrained"] = True
+    if settings.COT_CONTEXT_TOKENS > 0:
+        params["context_tokens"] = settings.COT_CONTEXT_TOKENS
+    return params
+
+@lru_cache(maxsize=8)
+def _direction_tokens(tokenizer) -> Dict[int, int]:
+    # 방향 단어의 첫 토큰 id → DIRECTIONS 인덱스 (앞 공백 유무 모두, 여러 방향에 걸치는 토큰은 제외)
+    owners: Dict[int, Set[int]] = {}
+    for d, word in enumerate(DIRECTIONS):
+        for variant in (word, " " + word):
+            ids = tokenizer(variant, add_special_tokens=False)["input_ids"]
+            if ids:
+                owners.setdefault(ids[0], set()).add(d)
+    return {token: ds.pop() for token, ds in owners.items() if len(ds) == 1}
+
+class AnswerConstraint:
+    """
+    제약 디코딩의 행별 상태. generate 에 logits_processor / stopping_criteria 로 함께 넘깁니다.
+
+    - 생성 구간이 '결과:' 로 끝나면 다음 토큰을 up / down / neutral 의 첫 토큰으로 제한하고,
+      세 방향 logit 의 softmax 로 확신도를 계산합니다.
+    - 방향 토큰이 나오면 그 행은 바로 종료됩니다. (다른 행은 계속 생성, 모든 행이 끝나면 generate 종료)
+    - 예산(max_new_tokens) 안에 '결과:' 가 나오지 않으면 마지막 토큰들로 '결과:' 를 강제해 항상 방향을 얻습니다.
+    - 방향이 나오기 전에는 EOS 를 막아 행이 답 없이 끝나지 않게 합니다.
+    """
+
+    def __init__(self, tokenizer, prompt_width: int, batch_size: int, max_new_tokens: int):
+        self.tokenizer = tokenizer
+        self.prompt_width = prompt_width
+        self.max_new_tokens = max_new_tokens
+        self.marker_ids = tokenizer(" " + ANSWER_MARKER, add_special_tokens=False)["input_ids"]
+        self.eos_token_id = tokenizer.eos_token_id
+        direction_tokens = _direction_tokens(tokenizer)
+        self._tokens = direction_tokens
+        self._candidates = torch.tensor(list(direction_tokens), dtype=torch.long)
+        self._candidate_dirs = torch.tensor(list(direction_tokens.values()), dtype=torch.long)
+        self._probs: Dict[int, torch.Tensor] = {}  # 방향 토큰을 기다리는 행 → 세 방향 확률
+        self.directions: List[Optional[str]] = [None] * batch_size
+        self.confidences: List[Optional[float]] = [None] * batch_size
+
+    def _answer_due(self, row_ids: torch.Tensor) -> bool:
+        generated = row_ids[self.prompt_width:]
+        if len(generated) == 0:
+            return False
+        tail = self.tokenizer.decode(generated[-(len(self.marker_ids) + 4):], skip_special_tokens=True)
+        return tail.rstrip().endswith(ANSWER_MARKER)
+
+    def process(self, input_ids: torch.Tensor, scores: torch.Tensor) -> torch.Tensor:
+        remaining = self.max_new_tokens - (input_ids.shape[1] - self.prompt_width)
+        # 남은 예산이 '결과:' + 방향 토큰 길이면 표시를 강제 (예산이 그보다 작으면 강제하지 않음)
+        forced = len(self.marker_ids) + 1 - remaining
+        can_force = self.max_new_tokens > len(self.marker_ids)
+        candidates = self._candidates.to(scores.device)
+        for row in range(input_ids.shape[0]):
+            if self.directions[row] is not None:
+                continue
+            if self._answer_due(input_ids[row]):
+                allowed = scores[row, candidates]
+                logits = torch.full((len(DIRECTIONS),), float("-inf"), device=scores.device)
+                logits = logits.scatter_reduce(0, self._candidate_dirs.to(scores.device), allowed, "amax")
+                self._probs[row] = torch.softmax(logits.float(), dim=-1)
+                masked = torch.full_like(scores[row], float("-inf"))
+                masked[candidates] = allowed
+                scores[row] = masked
+            elif can_force and 0 <= forced < len(self.marker_ids):
+                token = self.marker_ids[forced]
+                masked = torch.full_like(scores[row], float("-inf"))
+                masked[token] = 0.0
+                scores[row] = masked
+            elif self.eos_token_id is not None:
+                scores[row, self.eos_token_id] = float("-inf")
+        return scores
+
+    def stop(self, input_ids: torch.Tensor) -> torch.Tensor:
+        for row in list(self._probs):
+            direction = self._tokens.get(int(input_ids[row, -1]))
+            probs = self._probs.pop(row)
+            if direction is not None:
+                self.directions[row] = DIRECTIONS[direction]
+                self.confidences[row] = float(probs[direction])
+        return torch.tensor([d is not None for d in self.directions], device=input_ids.device)
+
+    def generate_kwargs(self) -> Dict:
+        constraint = self
+
+        class _Processor(LogitsProcessor):
+            def __call__(self, input_ids, scores):
+                return constraint.process(input_ids, scores)
+
+        class _Stopping(StoppingCriteria):
+            def __call__(self, input_ids, scores, **kwargs):
+                return constraint.stop(input_ids)
+
+        return {
+            "logits_processor": LogitsProcessorList([_Processor()]),
+            "stopping_criteria": StoppingCriteriaList([_Stopping()]),
+        }
+
+def _tokenize(tokenizer, texts: List[str]) -> List[List[int]]:
+    with span("tokenize", batch=len(texts)):
+        return [tokenizer(t, add_special_tokens=False)["input_ids"] for t in texts]
+
+def _generate(model, tokenizer, new_tokens_from: int, **kwargs):
+    # generate 호출 시간과 생성 토큰 수(패딩 제외), 초당 토큰 수 기록
+    with span("generate", batch=kwargs["input_ids"].shape[0]) as s:
+        start = time.perf_counter()
+        with torch.no_grad():
+            outputs = model.generate(**kwargs)
+        elapsed = time.perf_counter() - start
+        new_tokens = int((outputs[:, new_tokens_from:] != _pad_id(tokenizer)).sum())
+        s["new_tokens"] = new_tokens
+    _record_generation(kwargs["input_ids"].shape[0], new_tokens, elapsed)
+    return outputs
+
+def _record_generation(batch: int, new_tokens: int, elapsed: float) -> None:
+    BATCH_SIZE.labels("generate").observe(batch)
+    GENERATED_TOKENS.inc(new_tokens)
+    if elapsed > 0:
+        GENERATION_TOKENS_PER_SECOND.observe(new_tokens / elapsed)
+
+def _generation_kwargs(
+    tokenizer, max_new_tokens: int, constraint: Optional[AnswerConstraint] = None
+) -> Dict:
+    params = generation_params(max_new_tokens)
+    params.pop("constrained", None)
+    params.pop("context_tokens", None)
+    if constraint is not None:
+        params.update(constraint.generate_kwargs())
+    return dict(
+        **params,
+        eos_token_id=tokenizer.eos_token_id,
+        pad_token_id=_pad_id(tokenizer),
+    )
+
+def _constraint(tokenizer, prompt_width: int, batch_size: int, max_new_tokens: int) -> Optional[AnswerConstraint]:
+    if not settings.COT_CONSTRAINED:
+        return None
+    return AnswerConstraint(tokenizer, prompt_width, batch_size, max_new_tokens)
+
+def _decode(tokenizer, outputs, width: int, constraint: Optional[AnswerConstraint]) -> List[Generated]:
+    bodies = tokenizer.batch_decode(outputs[:, width:], skip_special_tokens=True)
+    if constraint is None:
+        return [(body, None, None) for body in bodies]
+    return list(zip(bodies, constraint.directions, constraint.confidences))
+
+def _generate_left_padded(prompts: List[str], max_new_tokens: int) -> List[Generated]:
+    # 프롬프트 전체를 왼쪽 패딩하여 한 번의 generate 로 처리
+    tokenizer, model, device = load_model()
+    encoded = _tokenize(tokenizer, prompts)
+    width = max(len(ids) for ids in encoded)
+    input_ids = torch.full((len(encoded), width), _pad_id(tokenizer), dtype=torch.long)
+    attention = torch.zeros((len(encoded), width), dtype=torch.long)
+    for i, ids in enumerate(encoded):
+        input_ids[i, width - len(ids):] = torch.tensor(ids)
+        attention[i, width - len(ids):] = 1
+    constraint = _constraint(tokenizer, width, len(encoded), max_new_tokens)
+    outputs = _generate(
+        model,
+        tokenizer,
+        width,
+        input_ids=input_ids.to(device),
+        attention_mask=attention.to(device),
+        **_generation_kwargs(tokenizer, max_new_tokens, constraint),
+    )
+    return _decode(tokenizer, outputs, width, constraint)
+
+def _generate_prefix_shared(
+    prefixes: List[str], suffixes: List[str], owners: List[int], max_new_tokens: int
+) -> List[Generated]:
+    """
+    서로 다른 기사(prefix)를 한 번의 forward 로 인코딩해 KV 캐시를 만든 뒤,
+    자산별 suffix 행에 해당 기사의 캐시를 복제해 한 번의 generate 로 디코딩합니다.
+
+    입력 레이아웃 (행 단위): [pad | prefix | pad | suffix]
+    가운데 패딩은 attention_mask=0 으로 가려지고, position_ids 는 mask 누적합으로 계산되므로
+    prefix/suffix 를 따로 인코딩한 것과 동일한 위치를 갖습니다.
+    """
+    tokenizer, model, device = load_model()
+    pad_id = _pad_id(tokenizer)
+    pre_ids = _tokenize(tokenizer, prefixes)
+    suf_ids = _tokenize(tokenizer, suffixes)
+    p_width = max(len(ids) for ids in pre_ids)
+    s_width = max(len(ids) for ids in suf_ids)
+
+    # 1) 기사 prefix 를 왼쪽 패딩하여 한 번에 인코딩 → KV 캐시
+    pre_input = torch.full((len(pre_ids), p_width), pad_id, dtype=torch.long)
+    pre_mask = torch.zeros((len(pre_ids), p_width), dtype=torch.long)
+    for i, ids in enumerate(pre_ids):
+        pre_input[i, p_width - len(ids):] = torch.tensor(ids)
+        pre_mask[i, p_width - len(ids):] = 1
+    pre_pos = (pre_mask.cumsum(-1) - 1).clamp(min=0)
+    cache = DynamicCache()
+    with span("forward", batch=len(pre_ids)), torch.no_grad():
+        model(
+            input_ids=pre_input.to(device),
+            attention_mask=pre_mask.to(device),
+            position_ids=pre_pos.to(device),
+            past_key_values=cache,
+            use_cache=True,
+        )
+    # 2) 자산별 행에 해당 기사 캐시를 복제
+    cache.batch_select_indices(torch.tensor(owners, device=device))
+
+    # 3) [prefix | suffix] 전체 입력 구성 (prefix 부분은 캐시로 건너뜀)
+    n = len(suf_ids)
+    input_ids = torch.full((n, p_width + s_width), pad_id, dtype=torch.long)
+    attention = torch.zeros((n, p_width + s_width), dtype=torch.long)
+    for row, (owner, ids) in enumerate(zip(owners, suf_ids)):
+        input_ids[row, :p_width] = pre_input[owner]
+        attention[row, :p_width] = pre_mask[owner]
+        input_ids[row, p_width + s_width - len(ids):] = torch.tensor(ids)
+        attention[row, p_width + s_width - len(ids):] = 1
+    constraint = _constraint(tokenizer, p_width + s_width, n, max_new_tokens)
+    outputs = _generate(
+        model,
+        tokenizer,
+        p_width + s_width,
+        input_ids=input_ids.to(device),
+        attention_mask=attention.to(device),
+        past_key_values=cache,
+        **_generation_kwargs(tokenizer, max_new_tokens, constraint),
+    )
+    return _decode(tokenizer, outputs, p_width + s_width, constraint)
+
+def _generate_speculative(prompts: List[str], max_new_tokens: int) -> List[Generated]:
+    """
+    draft 모델이 제안하고 본 모델이 검증하는 추측 디코딩으로 프롬프트를 하나씩 생성합니다.
+    (행마다 수락 길이가 달라 배치로 묶지 않음, 결과는 본 모델의 greedy 디코딩과 같음)
+    """
+    tokenizer, model, device = load_model()
+    draft = load_draft_model()
+    results: List[Generated] = []
+    for ids in _tokenize(tokenizer, prompts):
+        constraint = _constraint(tokenizer, len(ids), 1, max_new_tokens)
+        with span("generate", batch=1, speculative=True) as s:
+            start = time.perf_counter()
+            outputs, drafted, accepted = speculative_generate(
+                model,
+                draft,
+                torch.tensor([ids], device=device),
+                max_new_tokens=max_new_tokens,
+                draft_tokens=settings.COT_DRAFT_TOKENS,
+                eos_token_id=tokenizer.eos_token_id,
+                logits_processor=constraint.process if constraint else None,
+                stopping_criteria=constraint.stop if constraint else None,
+            )
+            elapsed = time.perf_counter() - start
+            s["new_tokens"] = outputs.shape[1] - len(ids)
+            s["drafted"], s["accepted"] = drafted, accepted
+        _record_generation(1, outputs.shape[1] - len(ids), elapsed)
+        results.extend(_decode(tokenizer, outputs, len(ids), constraint))
+    return results
+
+def _generate_chunk(jobs: List[Tuple[str, str]], max_new_tokens: int) -> List[Generated]:
+    # jobs: (entity, text) 목록 → (생성된 텍스트(프롬프트 제외), 방향, 확신도) 목록
+    if speculative_enabled() and settings.COT_DETERMINISTIC:
+        prompts = [generate_cot_prompt(entity, text) for entity, text in jobs]
+        return _generate_speculative(prompts, max_new_tokens)
+    if not settings.COT_PREFIX_CACHE:
+        prompts = [generate_cot_prompt(entity, text) for entity, text in jobs]
+        return _generate_left_padded(prompts, max_new_tokens)
+
+    prefixes: List[str] = []
+    prefix_index: Dict[str, int] = {}
+    suffixes: List[str] = []
+    owners: List[int] = []
+    for entity, text in jobs:
+        prefix, suffix = split_cot_prompt(entity, text)
+        if prefix not in prefix_index:
+            prefix_index[prefix] = len(prefixes)
+            prefixes.append(prefix)
+        owners.append(prefix_index[prefix])
+        suffixes.append(suffix)
+    return _generate_prefix_shared(prefixes, suffixes, owners, max_new_tokens)
+
+# 여러 기사에 대한 배치 CoT 예측
+def cot_predict_many(
+    items: List[Tuple[List[Dict], str]], max_new_tokens: int = 100
+) -> List[List[Dict]]:
+    """
+    (개체명 리스트, 뉴스 텍스트) 목록을 받아 모든 기사·개체에 대해
+    최대 COT_BATCH_SIZE 개씩 묶어 한 번의 generate 로 예측합니다.
+    같은 기사의 본문은 한 번만 인코딩되어 자산별 프롬프트가 KV 캐시를 공유합니다.
+    COT_CONTEXT_TOKENS 를 넘는 기사는 개체별로 고른 문맥만 사용합니다. (ArticleContext 참고)
+
+    Returns:
+        입력 순서대로, 기사별 [{'asset', 'direction', 'confidence', 'reasoning'}] 리스트
+    """
+    budget = settings.COT_CONTEXT_TOKENS
+    tokenizer = load_model()[0] if budget > 0 and any(entities for entities, _ in items) else None
+    jobs: List[Tuple[str, str]] = []
+    owners: List[int] = []
+    for idx, (entities, text) in enumerate(items):
+        # 긴 기사는 개체별로 제목 + 언급 문장 주변만 프롬프트에 넣음
+        context = ArticleContext(text, tokenizer) if tokenizer is not None and entities else None
+        for ent in entities:
+            jobs.append((ent['entity'], context.select(ent, budget) if context else text))
+            owners.append(idx)
+
+    generated: List[Generated] = []
+    step = max(1, settings.COT_BATCH_SIZE)
+    for start in range(0, len(jobs), step):
+        generated.extend(_generate_chunk(jobs[start:start + step], max_new_tokens))
+
+    results: List[List[Dict]] = [[] for _ in items]
+    with span("cot_parse", batch=len(generated)):
+        for (entity, _), owner, (body, constrained, confidence) in zip(jobs, owners, generated):
+            reasoning, direction = parse_cot_output(body, "")
+            results[owner].append({
+                'asset': entity,
+                # 제약 디코딩이면 방향 토큰 logit 에서 고른 방향과 확신도, 아니면 텍스트 파싱 결과 (확신도 없음)
+                'direction': constrained or direction,
+                'confidence': confidence,
+                'reasoning': reasoning
+            })
+    return results
+
 # CoT 기반 예측 함수
 def cot_predict(entities: List[Dict], text: str, max_new_tokens: int = 100) -> List[Dict]:
     """
     뉴스 텍스트에서 추출된 개체명 리스트에 대해 CoT 방식을 사용해 방향성을 예측합니다.
+    모든 개체를 한 번의 generate 로 처리합니다. (cot_predict_many 참고)
 
     Returns:
         List of {'asset': str, 'direction': str, 'confidence': float, 'reasoning': str}
     """
-    results: List[Dict] = []
-    for ent in entities:
-        prompt = generate_cot_prompt(ent['entity'], text)
-        inputs = tokenizer(prompt, return_tensors='pt').to(device)
-        outputs = model.generate(
-            **inputs,
-            max_new_tokens=max_new_tokens,
-            temperature=0.7,
-            do_sample=True,
-            top_p=0.9,
-            eos_token_id=tokenizer.eos_token_id,
-        )
-        decoded = tokenizer.decode(outputs[0], skip_special_tokens=True)
-        reasoning, direction = parse_cot_output(decoded, prompt)
-        results.append({
-            'asset': ent['entity'],
-            'direction': direction,
-            'confidence': None,  # 필요시 추후 confidence 산출
-            'reasoning': reasoning
-        })
-    return results
+    return cot_predict_many([(entities, text)], max_new_tokens=max_new_tokens)[0]
@@ -1,11 +1,19 @@
 
 # backend/app/services/crud.py
+import base64
+import json
+from datetime import datetime
+import re
+from sqlalchemy import column, delete, insert, literal_column, or_, select, table, text, tuple_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from backend.app.db.models import News
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from backend.app.db.models import Entity, News, NewsEntity, Prediction
 from backend.app.routers.schemas import NewsCreate
+from backend.app.services.trends import apply_rollups, rollup_deltas, subtract_stored
 import logging
-from typing import List
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -21,16 +29,366 @@ def create_news(db: Session, news_in: NewsCreate) -> News:
         raise
     return news
 
+# ON CONFLICT(link) DO UPDATE 시 갱신할 컬럼
+UPSERT_COLUMNS = ("title", "originallink", "description", "pub_date")
+# 값이 바뀌면 저장된 예측을 버려야 하는 컬럼 (예측 입력 텍스트 + 추이 구간)
+PREDICTION_INPUT_COLUMNS = ("title", "description", "pub_date")
+
+def _invalidate_predictions(db: Session, news_ids: List[int]) -> None:
+    # 저장된 예측·기사 개체명을 지우고 추이 집계에서 빼 둠 (다음 요청에서 다시 계산, 커밋은 호출자가)
+    if not news_ids:
+        return
+    subtract_stored(db, news_ids)
+    db.execute(delete(Prediction).where(Prediction.news_id.in_(news_ids)))
+    db.execute(delete(NewsEntity).where(NewsEntity.news_id.in_(news_ids)))
+
+def create_news_bulk(
+    db: Session,
+    news_list: Sequence[Union[NewsCreate, Dict]],
+    on_conflict: str = "skip",
+) -> Tuple[List[News], List[News], List[str]]:
+    """
+    여러 뉴스를 하나의 트랜잭션에서 배치 INSERT 합니다.
+
+    on_conflict="skip"   : 이미 있는 link 는 건너뜀 (ON CONFLICT DO NOTHING)
+    on_conflict="update" : 이미 있는 link 는 내용 갱신 (ON CONFLICT DO UPDATE)
+                           내용이 바뀐 기사의 저장된 예측은 지우고 추이 집계에서 뺌
+
+    Returns:
+        (새로 저장된 행, 갱신된 기존 행, 건너뛴 중복 link 목록)
+    """
+    if on_conflict not in ("skip", "update"):
+        raise ValueError(f"unknown on_conflict mode: {on_conflict}")
+
+    # 요청 안의 중복 link 는 미리 제거 (skip 은 첫 항목, update 는 마지막 항목 유지)
+    rows: Dict[str, Dict] = {}
+    for item in news_list:
+        row = item.dict() if isinstance(item, NewsCreate) else dict(item)
+        if on_conflict == "skip" and row["link"] in rows:
+            continue
+        rows[row["link"]] = row
+    if not rows:
+        return [], [], []
+
+    insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(News)
+    if on_conflict == "update":
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[News.link],
+            set_={col: getattr(stmt.excluded, col) for col in UPSERT_COLUMNS},
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=[News.link])
+
+    try:
+        # update 모드: 같은 트랜잭션에서 미리 있던 행을 읽어, RETURNING 결과를 신규/갱신으로 나누고
+        # 내용(제목·본문·발행 시각)이 바뀌는 기사는 저장된 예측과 그 추이 집계를 무효화
+        existing = set()
+        if on_conflict == "update":
+            changed: List[int] = []
+            for news_id, link, *stored in db.execute(
+                select(News.id, News.link, *(getattr(News, col) for col in PREDICTION_INPUT_COLUMNS))
+                .where(News.link.in_(list(rows)))
+            ):
+                existing.add(news_id)
+                if stored != [rows[link].get(col) for col in PREDICTION_INPUT_COLUMNS]:
+                    changed.append(news_id)
+            _invalidate_predictions(db, changed)
+        saved = list(db.scalars(stmt.returning(News), list(rows.values())))
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Failed to bulk create news: {e}")
+        raise
+
+    inserted = [news for news in saved if news.id not in existing]
+    updated = [news for news in saved if news.id in existing]
+
+    # DB 에 이미 있던 link + 요청 안에서 반복된 link 를 건너뛴 것으로 보고
+    saved_links = {news.link for news in saved}
+    skipped: List[str] = []
+    for item in news_list:
+        link = item.link if isinstance(item, NewsCreate) else item["link"]
+        if link in saved_links:
+            saved_links.discard(link)
+        else:
+            skipped.append(link)
+    return inserted, updated, skipped
+
+def encode_cursor(news: News) -> str:
+    # 마지막 행의 (pub_date, id) 를 URL-safe 문자열로
+    raw = json.dumps([news.pub_date.isoformat(), news.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        pub_date, news_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(pub_date), int(news_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"invalid cursor: {cursor!r}") from e
+
+def _filtered_news(
+    db: Session,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    source: Optional[str] = None,
+):
+    query = db.query(News)
+    if source is not None:
+        query = query.filter(News.source == source)
+    if date_from is not None:
+        query = query.filter(News.pub_date >= date_from)
+    if date_to is not None:
+        query = query.filter(News.pub_date < date_to)
+    return query.order_by(News.pub_date.desc(), News.id.desc())
+
+def get_news_page(
+    db: Session,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    source: Optional[str] = None,
+) -> Tuple[List[News], Optional[str]]:
+    """
+    최신순 (pub_date DESC, id DESC) keyset 페이지네이션.
+
+    cursor 는 이전 페이지 마지막 행 다음부터 읽으므로 OFFSET 처럼 앞 페이지를 건너뛰며
+    스캔하지 않습니다. date_to 는 제외(<) 경계입니다.
+
+    Returns:
+        (뉴스 목록, 다음 페이지 cursor — 마지막 페이지면 None)
+    """
+    query = _filtered_news(db, date_from, date_to, source)
+    if cursor:
+        pub_date, news_id = decode_cursor(cursor)
+        # 행 값 비교 — (pub_date, id) 인덱스에서 바로 cursor 위치로 이동 (OR 로 풀어 쓰면 인덱스 탐색이 안 됨)
+        query = query.filter(tuple_(News.pub_date, News.id) < tuple_(pub_date, news_id))
+    # 한 행을 더 읽어 다음 페이지 존재 여부 판단
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        return rows[:limit], encode_cursor(rows[limit - 1])
+    return rows, None
+
 def get_news(db: Session, skip: int = 0, limit: int = 100) -> List[News]:
-    return db.query(News).offset(skip).limit(limit).all()
+    # 하위 호환용 OFFSET 조회 (깊은 페이지는 get_news_page 의 cursor 사용)
+    return _filtered_news(db).offset(skip).limit(limit).all()
 
 def get_news_by_id(db: Session, news_id: int) -> News | None:
     return db.query(News).filter(News.id == news_id).first()
 
+def get_news_by_ids(db: Session, news_ids: Iterable[int]) -> Dict[int, News]:
+    # 여러 ID 를 WHERE id IN (...) 한 번으로 조회 (없는 ID 는 결과에서 빠짐)
+    ids = set(news_ids)
+    if not ids:
+        return {}
+    return {news.id: news for news in db.query(News).filter(News.id.in_(ids))}
+
 def delete_news(db: Session, news_id: int) -> bool:
     news = get_news_by_id(db, news_id)
     if not news:
         return False
+    # SQLite 는 기본적으로 외래 키(ON DELETE CASCADE)를 강제하지 않으므로 직접 정리
+    subtract_stored(db, [news_id])
+    db.execute(delete(Prediction).where(Prediction.news_id == news_id))
+    db.execute(delete(NewsEntity).where(NewsEntity.news_id == news_id))
     db.delete(news)
     db.commit()
-    return True
\ No newline at end of file
+    return True
+
+# ─── 예측 결과 저장 (entities / news_entities / predictions) ───
+
+def _entity_ids(db: Session, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+    # 없는 (name, label) 만 INSERT 한 뒤 id 를 한 번에 조회
+    keys = list(set(keys))
+    if not keys:
+        return {}
+    upsert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    db.execute(
+        upsert(Entity).on_conflict_do_nothing(index_elements=[Entity.name, Entity.label]),
+        [{"name": name, "label": label} for name, label in keys],
+    )
+    rows = db.execute(
+        select(Entity.name, Entity.label, Entity.id).where(tuple_(Entity.name, Entity.label).in_(keys))
+    )
+    return {(name, label): entity_id for name, label, entity_id in rows}
+
+def save_predictions(
+    db: Session,
+    results: Dict[int, Dict],
+    model_version: str,
+    latency_ms: Optional[float] = None,
+) -> int:
+    """
+    기사별 추론 결과 {news_id: {'entities', 'predictions'}} 를 한 트랜잭션에서 일괄 저장합니다.
+    같은 기사·모델 버전의 기존 예측과 기사 개체명은 새 결과로 교체합니다. (없는 news_id 는 무시)
+    자산별 추이 집계(asset_trends)도 같은 트랜잭션에서 증분 갱신합니다. (기존 결과만큼 빼고 새 결과를 더함)
+
+    Returns:
+        저장한 기사 수
+    """
+    pub_dates = dict(db.execute(select(News.id, News.pub_date).where(News.id.in_(set(results)))).all())
+    results = {news_id: res for news_id, res in results.items() if news_id in pub_dates}
+    if not results:
+        return 0
+
+    try:
+        entity_ids = _entity_ids(
+            db, ((e["entity"], e["label"]) for res in results.values() for e in res["entities"])
+        )
+        news_ids = list(results)
+        subtract_stored(db, news_ids, model_version)
+        db.execute(delete(NewsEntity).where(NewsEntity.news_id.in_(news_ids)))
+        db.execute(delete(Prediction).where(
+            Prediction.news_id.in_(news_ids), Prediction.model_version == model_version
+        ))
+
+        link_rows: List[Dict] = []
+        prediction_rows: List[Dict] = []
+        for news_id, res in results.items():
+            link_rows.extend(
+                {"news_id": news_id, "position": n, "entity_id": entity_ids[(e["entity"], e["label"])]}
+                for n, e in enumerate(res["entities"])
+            )
+            base = {"news_id": news_id, "model_version": model_version,
+                    "latency_ms": latency_ms, "pub_date": pub_dates[news_id]}
+            # 예측이 없으면 asset=NULL 표시 행 하나 (다음 요청에서 다시 계산하지 않도록)
+            for p in res["predictions"] or [{"asset": None, "direction": ""}]:
+                prediction_rows.append({
+                    **base,
+                    "asset": p["asset"],
+                    "direction": p["direction"] or "",
+                    "confidence": p.get("confidence"),
+                    "reasoning": p.get("reasoning") or "",
+                })
+        if link_rows:
+            db.execute(insert(NewsEntity), link_rows)
+        db.execute(insert(Prediction), prediction_rows)
+        apply_rollups(db, model_version, rollup_deltas(
+            (pub_dates[news_id], res["entities"], res["predictions"]) for news_id, res in results.items()
+        ))
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Failed to save predictions: {e}")
+        raise
+    return len(results)
+
+def get_saved_predictions(db: Session, news_ids: Iterable[int], model_version: str) -> Dict[int, Dict]:
+    """
+    저장된 예측을 {news_id: {'entities', 'predictions'}} 로 반환합니다. (파이프라인 결과와 같은 형태)
+    해당 모델 버전의 예측이 없는 기사는 결과에서 빠집니다.
+    """
+    ids = set(news_ids)
+    if not ids:
+        return {}
+    rows = db.scalars(
+        select(Prediction)
+        .where(Prediction.news_id.in_(ids), Prediction.model_version == model_version)
+        .order_by(Prediction.news_id, Prediction.id)
+    )
+    results: Dict[int, Dict] = {}
+    for p in rows:
+        res = results.setdefault(p.news_id, {"entities": [], "predictions": []})
+        if p.asset is not None:
+            res["predictions"].append({
+                "asset": p.asset, "direction": p.direction,
+                "confidence": p.confidence, "reasoning": p.reasoning,
+            })
+    if results:
+        entity_rows = db.execute(
+            select(NewsEntity.news_id, Entity.name, Entity.label)
+            .join(Entity, Entity.id == NewsEntity.entity_id)
+            .where(NewsEntity.news_id.in_(results))
+            .order_by(NewsEntity.news_id, NewsEntity.position)
+        )
+        for news_id, name, label in entity_rows:
+            results[news_id]["entities"].append({"entity": name, "label": label})
+    return results
+
+# 저장된 예측은 재계산을 줄이기 위한 것이므로, 요청 경로(REST / GraphQL)에서는 저장소 오류가 요청을 실패시키지 않음
+def try_get_saved_predictions(db: Session, news_ids: Iterable[int], model_version: str) -> Dict[int, Dict]:
+    """get_saved_predictions 와 같지만, DB 오류 시 롤백하고 빈 결과를 반환합니다. (모두 새로 계산)"""
+    try:
+        return get_saved_predictions(db, news_ids, model_version)
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning("Failed to load saved predictions", exc_info=True)
+        return {}
+
+def try_save_predictions(
+    db: Session, results: Dict[int, Dict], model_version: str, latency_ms: Optional[float] = None
+) -> int:
+    """save_predictions 와 같지만, DB 오류 시 롤백하고 0 을 반환합니다. (저장 없이 응답)"""
+    try:
+        return save_predictions(db, results, model_version, latency_ms)
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning("Failed to save predictions", exc_info=True)
+        return 0
+
+# ─── 로컬 전문 검색 (news_fts, db/models.ensure_news_fts 참고) ───
+
+news_fts = table("news_fts", column("rowid"))
+
+# trigram 토크나이저는 3글자 미만 검색어를 색인으로 찾을 수 없음 → LIKE 조건으로 보완
+FTS_MIN_TERM_LENGTH = 3
+SNIPPET_TOKENS = 16
+
+def _highlight(value: str, terms: List[str], width: int = 48) -> str:
+    # FTS 를 쓰지 못할 때의 snippet: 첫 일치 위치 주변만 잘라 <b></b> 로 강조
+    pattern = re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
+    match = pattern.search(value)
+    if not match:
+        return value[:width * 2]
+    start = max(0, match.start() - width)
+    end = min(len(value), match.end() + width)
+    clip = pattern.sub(lambda m: f"<b>{m.group(0)}</b>", value[start:end])
+    return ("…" if start else "") + clip + ("…" if end < len(value) else "")
+
+def search_news_local(db: Session, query: str, limit: int = 20, offset: int = 0) -> List[Dict]:
+    """
+    저장된 뉴스의 제목/본문 검색. 관련도(bm25, 제목 가중) 순으로
+    [{'news': News, 'snippet': 강조된 일부 문자열, 'score': 높을수록 관련}] 을 반환합니다.
+
+    SQLite 에서는 FTS5 trigram 색인을 사용하고, 3글자 미만 검색어나 다른 DB 에서는 LIKE 로 찾습니다.
+    """
+    terms = query.split()
+    if not terms:
+        return []
+    long_terms = [t for t in terms if len(t) >= FTS_MIN_TERM_LENGTH]
+    short_terms = [t for t in terms if len(t) < FTS_MIN_TERM_LENGTH]
+    use_fts = bool(long_terms) and db.bind.dialect.name == "sqlite"
+
+    like_terms = short_terms if use_fts else terms
+    conditions = [
+        or_(News.title.contains(t, autoescape=True), News.description.contains(t, autoescape=True))
+        for t in like_terms
+    ]
+
+    if use_fts:
+        # 각 검색어를 구문(phrase)으로 감싸 AND 검색 (FTS 쿼리 문법 문자 무력화)
+        match = " ".join('"' + t.replace('"', '""') + '"' for t in long_terms)
+        score = literal_column("bm25(news_fts, 10.0, 1.0)")
+        stmt = (
+            select(
+                News,
+                literal_column(f"snippet(news_fts, -1, '<b>', '</b>', '…', {SNIPPET_TOKENS})"),
+                score,
+            )
+            .join(news_fts, news_fts.c.rowid == News.id)
+            .where(text("news_fts MATCH :match").bindparams(match=match), *conditions)
+            .order_by(score, News.pub_date.desc())
+        )
+        rows = db.execute(stmt.offset(offset).limit(limit)).all()
+        return [{"news": news, "snippet": snippet, "score": -rank} for news, snippet, rank in rows]
+
+    stmt = select(News).where(*conditions).order_by(News.pub_date.desc(), News.id.desc())
+    rows = db.scalars(stmt.offset(offset).limit(limit)).all()
+    hits = []
+    for news in rows:
+        field = news.title if any(t.lower() in news.title.lower() for t in terms) else news.description
+        hits.append({"news": news, "snippet": _highlight(field or "", terms), "score": 0.0})
+    return hits
+
@@ -0,0 +1,159 @@
+# backend/app/services/executor.py
+import asyncio
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from backend.app.config import settings
+from backend.app.utils.exceptions import ExecutorClosedError, ExecutorSaturatedError
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+class InferenceExecutor:
+    """
+    블로킹 추론 작업(torch / spaCy)을 이벤트 루프 밖에서 실행하는 크기 제한 executor.
+
+    - max_workers 개가 동시에 실행되고, 최대 max_queue 개까지 대기
+    - 그 이상 들어오면 기다리지 않고 ExecutorSaturatedError 를 발생 (→ 429)
+    - kind="thread": torch 처럼 연산 중 GIL 을 놓는 작업용
+      kind="process": spaCy 처럼 순수 파이썬 비중이 큰 작업용 (함수/인자는 pickle 가능해야 함)
+
+    run() 은 이벤트 루프 스레드에서만 호출된다고 가정하므로 카운터에 락을 쓰지 않습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = 1,
+        max_queue: int = 16,
+        kind: str = "thread",
+        retry_after: int = 1,
+    ):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"unknown executor kind: {kind} (choose from {EXECUTOR_KINDS})")
+        if max_workers < 1 or max_queue < 0:
+            raise ValueError("max_workers must be >= 1 and max_queue >= 0")
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._pool: Optional[Executor] = None
+        self._closed = False
+        self.in_flight = 0
+        self.rejected = 0
+        self.completed = 0
+
+    @property
+    def pool(self) -> Executor:
+        # 프로세스 풀은 생성 비용이 크므로 첫 작업 때 만듦
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=f"{self.name}-executor"
+                )
+        return self._pool
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """fn(*args, **kwargs) 를 풀에서 실행하고 결과를 기다립니다."""
+        if self._closed:
+            raise ExecutorClosedError(self.name)
+        if self.in_flight >= self.capacity:
+            self.rejected += 1
+            raise ExecutorSaturatedError(self.name, self.retry_after)
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self.pool, functools.partial(fn, *args, **kwargs))
+            self.completed += 1
+            return result
+        finally:
+            self.in_flight -= 1
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._closed = True
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+_executors: Dict[str, InferenceExecutor] = {}
+# shutdown_executors() 이후 True: 새 executor 를 만들지 않고 ExecutorClosedError (→ 503)
+_shut_down = False
+
+
+def _check_open(name: str) -> None:
+    if _shut_down and name not in _executors:
+        raise ExecutorClosedError(name)
+
+
+def get_inference_executor() -> InferenceExecutor:
+    """CoT / 분류 모델(torch) 용 프로세스 전역 스레드 풀 executor"""
+    _check_open("inference")
+    if "inference" not in _executors:
+        _executors["inference"] = InferenceExecutor(
+            "inference",
+            max_workers=settings.INFERENCE_WORKERS,
+            max_queue=settings.INFERENCE_MAX_QUEUE,
+            kind="thread",
+            retry_after=settings.INFERENCE_RETRY_AFTER_SECONDS,
+        )
+    return _executors["inference"]
+
+
+def get_ner_executor() -> InferenceExecutor:
+    """spaCy NER 용 executor (NER_EXECUTOR=process 면 프로세스 풀, 각 프로세스가 모델을 따로 로드)"""
+    _check_open("ner")
+    if "ner" not in _executors:
+        _executors["ner"] = InferenceExecutor(
+            "ner",
+            max_workers=settings.NER_WORKERS,
+            max_queue=settings.INFERENCE_MAX_QUEUE,
+            kind=settings.NER_EXECUTOR,
+            retry_after=settings.INFERENCE_RETRY_AFTER_SECONDS,
+        )
+    return _executors["ner"]
+
+
+def executor_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: ex.stats() for name, ex in _executors.items()}
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """
+    lifespan 종료 시 호출. 닫힌 executor 는 등록된 채 남아, 종료 중에 들어온 요청은
+    새 executor 를 만들지 않고 ExecutorClosedError(→ 503) 를 받습니다.
+    """
+    global _shut_down
+    _shut_down = True
+    for ex in _executors.values():
+        ex.shutdown(wait=wait)
+
+
+def reset_executors() -> None:
+    """lifespan 시작 시 호출. 닫힌 executor 를 정리해 다음 get_*_executor() 가 새로 만들게 합니다."""
+    global _shut_down
+    _shut_down = False
+    for name in [name for name, ex in _executors.items() if ex.closed]:
+        del _executors[name]
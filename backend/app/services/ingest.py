@@ -0,0 +1,182 @@
+# backend/app/services/ingest.py
+import html
+import logging
+import re
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from backend.app.db.models import IngestState, News
+from backend.app.services.crud import create_news_bulk
+from backend.app.services.naver_client import NaverClient, get_naver_client
+from backend.app.services.scraper import parse_rss
+
+logger = logging.getLogger(__name__)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# News.source 값
+NEWS_SOURCE_SEARCH = "naver_search"
+NEWS_SOURCE_RSS = "naver_rss"
+
+# 이미 저장된 링크 조회 시 IN 절 하나에 넣을 최대 링크 수
+_LINK_LOOKUP_CHUNK = 500
+# 저장이 확인된 링크를 기억해 DB 조회 전에 거르는 메모리 집합의 최대 크기 (오래된 것부터 버림)
+SEEN_LINKS_MAX = 50_000
+
+
+def clean_text(value: Optional[str]) -> str:
+    # 네이버 검색 결과의 <b> 태그, &quot; 같은 HTML 엔티티 제거
+    return html.unescape(_TAG_RE.sub("", value or "")).strip()
+
+
+def parse_pub_date(value: Optional[str]) -> datetime:
+    """RFC 822(네이버 API/RSS) 또는 ISO 형식 날짜를 naive UTC datetime 으로 변환합니다."""
+    dt: Optional[datetime] = None
+    if value:
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            try:
+                dt = datetime.fromisoformat(value)
+            except ValueError:
+                dt = None
+    if dt is None:
+        return datetime.utcnow()
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def to_news_fields(item: Dict, source: Optional[str] = None) -> Dict:
+    """검색 API / RSS 아이템을 News 컬럼 딕셔너리로 변환합니다."""
+    return {
+        "title":        clean_text(item.get("title"))[:512],
+        "link":         item.get("link") or item.get("originallink"),
+        "originallink": item.get("originallink") or item.get("link"),
+        "description":  clean_text(item.get("description")),
+        "pub_date":     parse_pub_date(item.get("pubDate")),
+        "source":       source,
+    }
+
+
+class IncrementalIngester:
+    """
+    RSS 피드와 검색어를 주기적으로 폴링하며 새 기사만 저장합니다.
+
+    - RSS: ETag / Last-Modified 조건부 요청 (304 면 본문 파싱 없이 종료), high-water mark 이전 기사는 제외
+    - 검색: 날짜순 페이지를 차례로 받다가 high-water mark 이전 기사가 나오면 중단
+    - 최근 저장을 확인한 링크(메모리, 최대 seen_size 개)로 먼저 거르고, 나머지만 DB 에서 조회해 새 기사만 INSERT
+      (메모리 집합에는 커밋이 끝났거나 DB 에 있음을 확인한 링크만 넣음)
+    """
+
+    def __init__(self, db: Session, client: Optional[NaverClient] = None, seen_size: int = SEEN_LINKS_MAX):
+        self.db = db
+        self.client = client or get_naver_client()
+        self.seen_size = seen_size
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+
+    # ─── 상태 ───
+
+    def _state(self, source: str) -> IngestState:
+        state = self.db.query(IngestState).filter(IngestState.source == source).first()
+        if state is None:
+            state = IngestState(source=source)
+            self.db.add(state)
+            self.db.commit()
+        return state
+
+    # ─── 저장 ───
+
+    def _remember(self, links: Iterable[str]) -> None:
+        for link in links:
+            self._seen[link] = None
+            self._seen.move_to_end(link)
+        while len(self._seen) > self.seen_size:
+            self._seen.popitem(last=False)
+
+    def _stored_links(self, links: List[str]) -> Set[str]:
+        # 이번 묶음의 링크 중 DB 에 이미 있는 것만 조회 (link 유니크 인덱스 사용)
+        stored: Set[str] = set()
+        for i in range(0, len(links), _LINK_LOOKUP_CHUNK):
+            chunk = links[i:i + _LINK_LOOKUP_CHUNK]
+            stored.update(link for (link,) in self.db.query(News.link).filter(News.link.in_(chunk)))
+        return stored
+
+    def _new_rows(self, items: Iterable[Dict], source: str, since: Optional[datetime] = None) -> List[Dict]:
+        # since 가 있으면 그보다 오래된 기사는 이미 수집한 것으로 보고 제외 (같은 시각은 링크로 판단)
+        rows: Dict[str, Dict] = {}
+        for item in items:
+            fields = to_news_fields(item, source=source)
+            link = fields["link"]
+            if not link or link in rows or link in self._seen or (since is not None and fields["pub_date"] < since):
+                continue
+            rows[link] = fields
+        stored = self._stored_links(list(rows))
+        self._remember(stored)
+        return [fields for link, fields in rows.items() if link not in stored]
+
+    def _store(self, rows: List[Dict]) -> int:
+        # 다른 프로세스가 먼저 넣은 링크는 ON CONFLICT DO NOTHING 으로 건너뜀 (커밋이 끝난 뒤에만 기억)
+        inserted, _, _ = create_news_bulk(self.db, rows)
+        self._remember(row["link"] for row in rows)
+        return len(inserted)
+
+    def _advance(self, state: IngestState, rows: List[Dict]) -> None:
+        # rows: 발행 시각이 있는 기사만 (시각이 없어 수집 시각으로 채운 기사는 high-water mark 를 올리지 않음)
+        if rows:
+            newest = max(row["pub_date"] for row in rows)
+            if state.high_water is None or newest > state.high_water:
+                state.high_water = newest
+        self.db.commit()
+
+    # ─── 소스별 수집 ───
+
+    async def ingest_rss(self) -> int:
+        source = f"rss:{self.client.rss_url}"
+        state = self._state(source)
+        headers = {}
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+
+        resp = await self.client.fetch_rss(headers=headers)
+        if resp.status_code == 304:
+            logger.info(f"{source}: not modified")
+            return 0
+        resp.raise_for_status()
+
+        items = parse_rss(resp.text, max_articles=10_000, fill_missing_date=False)
+        rows = self._new_rows(items, NEWS_SOURCE_RSS, since=state.high_water)
+        inserted = self._store(rows)
+        state.etag = resp.headers.get("ETag")
+        state.last_modified = resp.headers.get("Last-Modified")
+        dated = {item["link"] for item in items if item.get("pubDate")}
+        self._advance(state, [row for row in rows if row["link"] in dated])
+        logger.info(f"{source}: {inserted} new articles")
+        return inserted
+
+    async def ingest_search(self, query: str, max_pages: int = 10, display: int = 100) -> int:
+        source = f"search:{query}"
+        state = self._state(source)
+        rows: List[Dict] = []
+        for page in range(max_pages):
+            start = 1 + page * display
+            if start > 1000:
+                break
+            items = await self.client.search_news(query, display=display, start=start, sort="date")
+            rows.extend(self._new_rows(items, NEWS_SOURCE_SEARCH))
+            # 날짜순 결과이므로, 지난번 최신 기사보다 오래된 기사가 보이면 이후 페이지는 모두 본 것
+            if len(items) < display or (
+                state.high_water is not None
+                and any(parse_pub_date(i.get("pubDate")) <= state.high_water for i in items)
+            ):
+                break
+        inserted = self._store(rows)
+        self._advance(state, rows)
+        logger.info(f"{source}: {inserted} new articles")
+        return inserted
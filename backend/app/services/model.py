@@ -1,6 +1,8 @@
 # backend/app/services/model.py
 
 import torch
+from functools import partial
+from typing import Optional
 from pathlib import Path
 from transformers import (
     AutoConfig,
@@ -9,6 +11,14 @@ from transformers import (
     AutoTokenizer
 )
 
+from backend.app.config import settings
+from backend.app.services.backends import apply_classifier_backend
+from backend.app.services.batcher import MicroBatcher, plan_token_batches
+from backend.app.services.executor import get_inference_executor
+from backend.app.services.registry import registry
+from backend.app.utils.logger import span
+from backend.app.utils.metrics import BATCH_SIZE
+
 _model = None
 _tokenizer = None
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
@@ -61,37 +71,79 @@ device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
     #     _model.eval()
     # return (_tokenizer, _model)
 
-def load_model():
-    tokenizer = AutoTokenizer.from_pretrained("kbmbrs/news_trend")
-    model     = AutoModelForSequenceClassification.from_pretrained("kbmbrs/news_trend")
+# 허브의 분류 모델 리포지터리 ID
+CLASSIFIER_NAME = "kbmbrs/news_trend"
+
+def load_base_classifier():
+    """백엔드 적용 전의 원본 fp32 분류 모델 (tokenizer, model) 을 로드합니다."""
+    tokenizer = AutoTokenizer.from_pretrained(CLASSIFIER_NAME)
+    model     = AutoModelForSequenceClassification.from_pretrained(CLASSIFIER_NAME)
+    # GPT 계열 토크나이저는 pad 토큰이 없어 배치 패딩이 불가능하므로 eos 로 대체
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+        model.config.pad_token_id = tokenizer.pad_token_id
     model.eval()
     return tokenizer, model
 
+def _load_classifier():
+    # CLASSIFIER_BACKEND 설정에 따라 int8 양자화 / TorchScript 그래프 적용
+    tokenizer, model = load_base_classifier()
+    return tokenizer, apply_classifier_backend(tokenizer, model, model_id=CLASSIFIER_NAME)
+
+def _warmup_classifier(tokenizer_model_pair):
+    model_predict(tokenizer_model_pair, ["워밍업 텍스트"])
+
+registry.register("classifier", _load_classifier, warmup=_warmup_classifier)
+
+def load_model():
+    """분류 모델 (tokenizer, model) 쌍을 반환합니다. (최초 호출 시 한 번만 로드)"""
+    return registry.get("classifier")
+
 def model_predict(tokenizer_model_pair, texts, assets=None):
+    """
+    텍스트별 {'asset', 'direction', 'confidence', 'reasoning'} 를 입력 순서대로 반환합니다.
+
+    PREDICT_MAX_SEQ_LENGTH 토큰으로 자른 뒤 길이가 비슷한 텍스트끼리 묶어,
+    패딩 포함 토큰 수가 PREDICT_MAX_TOKENS_PER_BATCH (개수는 PREDICT_MAX_BATCH_SIZE) 이내인 배치로 나눠 forward 합니다.
+    """
     tokenizer, model = tokenizer_model_pair
 
     if isinstance(texts, str):
         texts, assets = [texts], [assets]
     if assets is None or len(assets) != len(texts):
         assets = [None] * len(texts)
-
-    # 토크나이즈
-    enc = tokenizer(
-        texts,
-        padding=True,
-        truncation=True,
-        return_tensors="pt"
+    if not texts:
+        return []
+
+    # 토크나이즈 (패딩은 배치별로)
+    with span("tokenize", batch=len(texts)):
+        encoded = tokenizer(
+            list(texts),
+            truncation=True,
+            max_length=settings.PREDICT_MAX_SEQ_LENGTH,
+        )["input_ids"]
+
+    preds = [0] * len(texts)
+    confs = [0.0] * len(texts)
+    batches = plan_token_batches(
+        [len(ids) for ids in encoded],
+        max_tokens=settings.PREDICT_MAX_TOKENS_PER_BATCH,
+        max_batch_size=max(1, settings.PREDICT_MAX_BATCH_SIZE),
     )
-    # 장치로 이동
-    for k, v in enc.items():
-        enc[k] = v.to(device)
+    for batch in batches:
+        enc = tokenizer.pad({"input_ids": [encoded[i] for i in batch]}, return_tensors="pt")
+        # 장치로 이동
+        for k, v in enc.items():
+            enc[k] = v.to(device)
 
-    with torch.no_grad():
-        outputs = model(**enc)
-        logits = outputs.logits
+        BATCH_SIZE.labels("classify").observe(len(batch))
+        with span("forward", batch=len(batch), tokens=enc["input_ids"].numel()), torch.no_grad():
+            outputs = model(**enc)
+            logits = outputs.logits
 
-    preds = torch.argmax(logits, dim=-1).tolist()
-    confs = torch.softmax(logits, dim=-1).max(dim=-1).values.tolist()
+        probs = torch.softmax(logits, dim=-1)
+        for i, pred_idx, conf in zip(batch, probs.argmax(dim=-1).tolist(), probs.max(dim=-1).values.tolist()):
+            preds[i], confs[i] = pred_idx, conf
 
     results = []
     for asset, pred_idx, conf in zip(assets, preds, confs):
@@ -103,3 +155,45 @@ def model_predict(tokenizer_model_pair, texts, assets=None):
             "reasoning": ""
         })
     return results
+
+def _predict_items(tokenizer_model_pair, items):
+    # MicroBatcher 입력: (text, asset) 튜플 리스트 → 한 번의 padded forward pass
+    texts  = [text for text, _ in items]
+    assets = [asset for _, asset in items]
+    return model_predict(tokenizer_model_pair or load_model(), texts, assets)
+
+async def _run_on_inference_executor(fn, items):
+    # 배치도 추론 executor 에서 실행 (가득 차면 ExecutorSaturatedError, 종료 후엔 ExecutorClosedError)
+    return await get_inference_executor().run(fn, items)
+
+def make_predict_batcher(tokenizer_model_pair=None, max_batch_size=None, max_wait_ms=None) -> MicroBatcher:
+    """
+    동시에 들어오는 model_predict 요청을 모아 배치로 처리하는 MicroBatcher 를 생성합니다.
+    tokenizer_model_pair 를 생략하면 첫 배치 처리 시 레지스트리에서 분류 모델을 가져옵니다.
+    사용: `await batcher.submit((text, asset))` → model_predict 결과 딕셔너리 1개
+    """
+    return MicroBatcher(
+        partial(_predict_items, tokenizer_model_pair),
+        max_batch_size=max_batch_size or settings.PREDICT_MAX_BATCH_SIZE,
+        max_wait_ms=settings.PREDICT_MAX_WAIT_MS if max_wait_ms is None else max_wait_ms,
+        runner=_run_on_inference_executor,
+    )
+
+_batcher: Optional[MicroBatcher] = None
+
+def get_predict_batcher() -> MicroBatcher:
+    """API 경로의 분류 모델 요청이 공유하는 프로세스 전역 MicroBatcher (처음 호출 시 생성)"""
+    global _batcher
+    if _batcher is None:
+        _batcher = make_predict_batcher()
+    return _batcher
+
+def predict_batcher_queue_depth() -> int:
+    """공유 MicroBatcher 의 대기 요청 수 (아직 만들어지지 않았으면 0)"""
+    return _batcher.queue_depth if _batcher is not None else 0
+
+async def close_predict_batcher() -> None:
+    global _batcher
+    if _batcher is not None:
+        await _batcher.stop()
+        _batcher = None
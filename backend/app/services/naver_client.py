@@ -0,0 +1,174 @@
+# backend/app/services/naver_client.py
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+from backend.app.config import settings
+from backend.app.utils.logger import span
+from backend.app.utils.metrics import NAVER_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 응답 코드 (쿼터 초과 / 일시적 서버 오류)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# 네이버 검색 API 제약: display 최대 100, start 최대 1000
+MAX_DISPLAY = 100
+MAX_START = 1000
+
+
+class RateLimiter:
+    """초당 rate 개 요청을 허용하는 토큰 버킷 (burst 만큼 순간 허용)"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class NaverClient:
+    """
+    네이버 뉴스 검색 API / RSS 용 비동기 클라이언트.
+
+    - keep-alive 커넥션 풀 (httpx.AsyncClient 하나를 재사용)
+    - 동시 요청 수 제한(Semaphore) + 초당 요청 수 제한(토큰 버킷)
+    - 타임아웃, 429/5xx/네트워크 오류 시 지수 백오프 + 지터 재시도
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        base_url: str = "https://openapi.naver.com/v1/search/news.json",
+        rss_url: str = "https://news.naver.com/main/main.naver?mode=LSD&mid=shm&sid1=0&type=RSS",
+        max_connections: int = 20,
+        max_concurrency: int = 8,
+        rate_per_sec: float = 10.0,
+        timeout: float = 5.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.base_url = base_url
+        self.rss_url = rss_url
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._limiter = RateLimiter(rate_per_sec)
+        self._client = httpx.AsyncClient(
+            headers={
+                "X-Naver-Client-Id":     client_id,
+                "X-Naver-Client-Secret": client_secret,
+            },
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        # Retry-After 헤더가 있으면 우선, 없으면 지수 백오프 * [0.5, 1.5) 지터
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        return self.backoff_base * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """동시성·속도 제한과 재시도를 적용해 요청하고, 최종 실패 시 예외를 발생시킵니다."""
+        for attempt in range(self.max_retries + 1):
+            response: Optional[httpx.Response] = None
+            try:
+                async with self._semaphore:
+                    await self._limiter.acquire()
+                    # 대기(세마포어·속도 제한) 시간은 제외하고 실제 요청 시간만 기록
+                    with span("naver_request", attempt=attempt) as s:
+                        response = await self._client.request(method, url, **kwargs)
+                        s["status"] = response.status_code
+                NAVER_REQUESTS.labels(str(response.status_code)).inc()
+                if response.status_code not in RETRY_STATUS:
+                    return response
+                if attempt == self.max_retries:
+                    response.raise_for_status()
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                NAVER_REQUESTS.labels(type(e).__name__).inc()
+                if attempt == self.max_retries:
+                    raise
+            delay = self._backoff(attempt, response)
+            logger.warning(f"Naver request to {url} failed (attempt {attempt + 1}), retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+        raise RuntimeError("unreachable")
+
+    async def search_news(
+        self, query: str, display: int = 10, start: int = 1, sort: str = "date"
+    ) -> List[Dict]:
+        params = {"query": query, "display": display, "start": start, "sort": sort}
+        resp = await self.request("GET", self.base_url, params=params)
+        resp.raise_for_status()
+        return resp.json().get("items", [])
+
+    async def search_news_pages(
+        self, query: str, pages: int, display: int = MAX_DISPLAY, sort: str = "date", start: int = 1
+    ) -> List[Dict]:
+        """start, start+display, ... 페이지들을 동시에 가져와 순서대로 이어 붙입니다."""
+        display = min(display, MAX_DISPLAY)
+        starts = [start + i * display for i in range(pages) if start + i * display <= MAX_START]
+        pages_items = await asyncio.gather(
+            *(self.search_news(query, display=display, start=st, sort=sort) for st in starts)
+        )
+        return [item for items in pages_items for item in items]
+
+    async def fetch_rss(self, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self.request("GET", self.rss_url, headers=headers)
+
+
+_client: Optional[NaverClient] = None
+
+
+def get_naver_client() -> NaverClient:
+    """프로세스 전역 NaverClient (처음 호출 시 생성, lifespan 종료 시 close_naver_client)"""
+    global _client
+    if _client is None:
+        _client = NaverClient(
+            settings.NAVER_CLIENT_ID,
+            settings.NAVER_CLIENT_SECRET,
+            base_url=settings.NAVER_API_BASE_URL,
+            rss_url=settings.NAVER_RSS_URL,
+            max_connections=settings.NAVER_MAX_CONNECTIONS,
+            max_concurrency=settings.NAVER_MAX_CONCURRENCY,
+            rate_per_sec=settings.NAVER_RATE_LIMIT_PER_SEC,
+            timeout=settings.NAVER_TIMEOUT_SECONDS,
+            max_retries=settings.NAVER_MAX_RETRIES,
+        )
+    return _client
+
+
+async def close_naver_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -59,10 +59,31 @@
 
 # backend/app/services/ner.py
 import spacy
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Optional
 
-# load the Korean model once
-nlp = spacy.load("ko_core_news_sm")
+from backend.app.config import settings
+from backend.app.services.registry import registry
+from backend.app.utils.logger import span
+from backend.app.utils.metrics import BATCH_SIZE
+
+# only doc.ents is used, so keep just the components NER depends on
+NER_PIPES = ("tok2vec", "ner")
+
+def _load_nlp():
+    nlp = spacy.load(settings.NER_MODEL)
+    # parser / tagger / lemmatizer 등 사용하지 않는 컴포넌트는 실행하지 않음
+    nlp.select_pipes(enable=[p for p in NER_PIPES if p in nlp.pipe_names])
+    return nlp
+
+# load the Korean model once (lazily, on first use or during lifespan preload)
+registry.register(
+    "ner",
+    _load_nlp,
+    warmup=lambda nlp: nlp("삼성전자가 코스피 시장에서 상승했다."),
+)
+
+def get_nlp():
+    return registry.get("ner")
 
 # only these labels are actual assets we care about
 ALLOWED_LABELS = {"OG", "LC"}
@@ -70,19 +91,17 @@ ALLOWED_LABELS = {"OG", "LC"}
 # common single- and double-character Korean josa
 JOSA_LIST = ["으로", "로", "이", "가", "을", "를", "은", "는", "도", "와", "과"]
 
-def extract_entities(text: str) -> List[Dict]:
-    """
-    spaCy 한국어 모델을 사용해 텍스트에서 자산 개체명(Entity)을 추출합니다.
-    OG(기관), LC(지수) 라벨만 남기고, 
-    끝에 조사가 붙은 경우 조사를 제거한 엔트리도 함께 리턴합니다.
-    """
-    doc = nlp(text)
+MOVEMENT_KEYWORDS = ["급등", "하락"]
+
+def _entities_from_doc(doc, text: str) -> List[Dict]:
+    # start / end: 원문에서의 글자 위치 (CoT 문맥 선택에 사용)
     entities: List[Dict] = []
 
     # 1) keep only allowed labels
     for ent in doc.ents:
         if ent.label_ in ALLOWED_LABELS:
-            entities.append({"entity": ent.text, "label": ent.label_})
+            entities.append({"entity": ent.text, "label": ent.label_,
+                             "start": ent.start_char, "end": ent.end_char})
 
     # 2) for each, also add a josa-stripped variant
     final_entities: List[Dict] = []
@@ -93,10 +112,52 @@ def extract_entities(text: str) -> List[Dict]:
             if text0.endswith(j):
                 stripped = text0[:-len(j)]
                 if stripped:
-                    final_entities.append({"entity": stripped, "label": ent["label"]})
+                    final_entities.append({"entity": stripped, "label": ent["label"],
+                                           "start": ent["start"], "end": ent["end"] - len(j)})
                 break
-    MOVEMENT_KEYWORDS = ["급등", "하락"]
     for kw in MOVEMENT_KEYWORDS:
         if kw in text and not any(e["entity"] == kw for e in final_entities):
-            final_entities.append({"entity": kw, "label": "PRICE_MOVE"}) 
+            start = text.index(kw)
+            final_entities.append({"entity": kw, "label": "PRICE_MOVE", "start": start, "end": start + len(kw)})
     return final_entities
+
+def extract_entities(text: str) -> List[Dict]:
+    """
+    spaCy 한국어 모델을 사용해 텍스트에서 자산 개체명(Entity)을 추출합니다.
+    OG(기관), LC(지수) 라벨만 남기고, 
+    끝에 조사가 붙은 경우 조사를 제거한 엔트리도 함께 리턴합니다.
+    각 엔트리는 {'entity', 'label', 'start', 'end'} (start / end 는 text 안의 글자 위치) 입니다.
+    """
+    nlp = get_nlp()
+    with span("ner", batch=1):
+        return _entities_from_doc(nlp(text), text)
+
+def iter_entities(
+    texts: Iterable[str],
+    batch_size: Optional[int] = None,
+    n_process: Optional[int] = None,
+) -> Iterator[List[Dict]]:
+    """
+    nlp.pipe 로 여러 텍스트를 스트리밍 처리하며, 입력 순서대로 텍스트별 개체명 리스트를 내보냅니다.
+    batch_size / n_process 를 생략하면 NER_BATCH_SIZE / NER_N_PROCESS 설정을 사용합니다.
+    """
+    nlp = get_nlp()
+    docs = nlp.pipe(
+        ((text, text) for text in texts),
+        as_tuples=True,
+        batch_size=batch_size or settings.NER_BATCH_SIZE,
+        n_process=n_process or settings.NER_N_PROCESS,
+    )
+    for doc, text in docs:
+        yield _entities_from_doc(doc, text)
+
+def extract_entities_many(
+    texts: List[str],
+    batch_size: Optional[int] = None,
+    n_process: Optional[int] = None,
+) -> List[List[Dict]]:
+    """extract_entities 의 배치 버전. (iter_entities 참고)"""
+    get_nlp()  # 모델 로드 시간은 ner 구간에서 제외
+    BATCH_SIZE.labels("ner").observe(len(texts))
+    with span("ner", batch=len(texts)):
+        return list(iter_entities(texts, batch_size=batch_size, n_process=n_process))
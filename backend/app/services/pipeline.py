@@ -0,0 +1,285 @@
+# backend/app/services/pipeline.py
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from backend.app.config import settings
+from backend.app.services.cache import PredictionCache, prediction_cache
+from backend.app.services.cot import cot_predict_many, generation_params
+from backend.app.services.executor import get_inference_executor, get_ner_executor
+from backend.app.services.model import CLASSIFIER_NAME, get_predict_batcher, load_model, model_predict
+from backend.app.services.ner import extract_entities_many
+from backend.app.services.predict_ser import MODEL_NAME
+from backend.app.utils.logger import span
+from backend.app.utils.metrics import CASCADE_DECISIONS
+
+COT_MAX_NEW_TOKENS = 100
+
+# 예측 모드: cot(개체별 CoT 생성) | classifier(분류 모델만) | cascade(분류 모델 → 확신도 미달 기사만 CoT)
+PREDICT_MODES = ("cot", "classifier", "cascade")
+
+
+class PredictOptions(NamedTuple):
+    mode: str
+    threshold: Optional[float] = None  # cascade 전용: 분류 모델 확신도가 이 값 미만이면 CoT
+    explain: bool = False              # cascade 전용: 근거(reasoning) 요청 → 모든 기사 CoT
+
+
+def predict_options(
+    mode: Optional[str] = None, threshold: Optional[float] = None, explain: bool = False
+) -> PredictOptions:
+    """
+    요청별 옵션(없으면 설정값)을 정규화합니다. 결과가 같은 조합은 같은 값이 되어 캐시·저장 키를 공유합니다.
+    classifier 모드는 근거를 만들 수 없으므로 explain 이면 cot 로 처리합니다.
+    """
+    mode = mode or settings.PREDICT_MODE
+    if mode not in PREDICT_MODES:
+        raise ValueError(f"unknown predict mode: {mode} (choose from {PREDICT_MODES})")
+    if mode == "classifier" and explain:
+        mode = "cot"
+    if mode != "cascade":
+        return PredictOptions(mode)
+    threshold = settings.CASCADE_CONFIDENCE_THRESHOLD if threshold is None else threshold
+    if not 0.0 <= threshold <= 1.0:
+        raise ValueError(f"confidence threshold must be within [0, 1]: {threshold}")
+    return PredictOptions(mode, threshold, explain)
+
+
+def _deterministic(options: PredictOptions) -> bool:
+    # 샘플링 모드(COT_DETERMINISTIC=False)의 CoT 결과는 같은 입력이라도 매번 달라짐
+    return options.mode == "classifier" or settings.COT_DETERMINISTIC
+
+
+def cache_key(text: str, options: PredictOptions) -> Optional[str]:
+    """예측 결과의 캐시 키. 결과가 매번 달라질 수 있으면 캐시하지 않습니다. (None 반환)"""
+    if not settings.PREDICT_CACHE_ENABLED or not _deterministic(options):
+        return None
+    cot_id = f"{MODEL_NAME}:{settings.COT_BACKEND}"
+    classifier_id = f"{CLASSIFIER_NAME}:{settings.CLASSIFIER_BACKEND}"
+    if options.mode == "cot":
+        return PredictionCache.make_key(
+            text, model_id=cot_id, mode="cot", params=generation_params(COT_MAX_NEW_TOKENS)
+        )
+    if options.mode == "classifier":
+        return PredictionCache.make_key(text, model_id=classifier_id, mode="classifier")
+    return PredictionCache.make_key(
+        text,
+        model_id=f"{classifier_id}+{cot_id}",
+        mode="cascade",
+        params={
+            **generation_params(COT_MAX_NEW_TOKENS),
+            "threshold": options.threshold,
+            "explain": options.explain,
+        },
+    )
+
+
+# 저장된 예측(predictions / asset_trends)의 모델 버전: 버전이 바뀌면 저장된 결과를 재사용하지 않음
+KEYWORD_MODEL_VERSION = "predict_directions:keyword"
+
+
+def model_version(options: PredictOptions) -> str:
+    cot = f"{MODEL_NAME}:{settings.COT_BACKEND}:cot:{COT_MAX_NEW_TOKENS}"
+    if settings.COT_CONSTRAINED:
+        cot += ":constrained"
+    if settings.COT_CONTEXT_TOKENS > 0:
+        cot += f":ctx{settings.COT_CONTEXT_TOKENS}"
+    classifier = f"{CLASSIFIER_NAME}:{settings.CLASSIFIER_BACKEND}:classifier"
+    if options.mode == "cot":
+        return cot
+    if options.mode == "classifier":
+        return classifier
+    return f"{classifier}+{cot}:cascade@{options.threshold}" + (":explain" if options.explain else "")
+
+
+def stored_version(options: PredictOptions) -> Optional[str]:
+    """
+    DB 에 저장할 예측의 모델 버전. 저장이 꺼져 있으면 None (저장·재사용하지 않음)
+    내용 해시 캐시(cache_key)와 달리 샘플링 결과도 저장합니다. 기사(news_id)별로 한 번 계산한 결과를
+    그 기사의 예측으로 재사용하고 추이 집계에 쓰기 위함입니다.
+    """
+    if not settings.PREDICTION_STORE_ENABLED:
+        return None
+    return model_version(options)
+
+
+def stored_model_version(model: str) -> str:
+    # 추이 조회용: 예측 모드(cot / classifier / cascade, 기본 임계값) 또는 "keyword" (GraphQL predict)
+    if model == "keyword":
+        return KEYWORD_MODEL_VERSION
+    return model_version(predict_options(model))
+
+
+def _lookup(
+    texts: List[str], options: PredictOptions
+) -> Tuple[List[Optional[Dict]], List[Optional[str]], Dict[str, List[int]]]:
+    # 캐시 적중 결과와, 계산이 필요한 텍스트 → 입력 위치 목록
+    results: List[Optional[Dict]] = [None] * len(texts)
+    keys = [cache_key(text, options) for text in texts]
+
+    pending: Dict[str, List[int]] = {}
+    with span("cache_lookup", batch=len(texts)) as s:
+        for i, (text, key) in enumerate(zip(texts, keys)):
+            cached = prediction_cache.get(key) if key else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(text, []).append(i)
+        s["misses"] = len(pending)
+    return results, keys, pending
+
+
+def _fill(
+    results: List[Optional[Dict]],
+    keys: List[Optional[str]],
+    pending: Dict[str, List[int]],
+    entities_list: List[List[Dict]],
+    predictions_list: List[List[Dict]],
+) -> List[Dict]:
+    for text, entities, predictions in zip(pending, entities_list, predictions_list):
+        result = {"entities": entities, "predictions": predictions}
+        indices = pending[text]
+        if keys[indices[0]]:
+            prediction_cache.set(keys[indices[0]], result)
+        for n, i in enumerate(indices):
+            # 중복 입력은 서로 독립된 사본을 받도록 (호출자가 결과를 수정할 수 있음)
+            results[i] = result if n == 0 else {
+                "entities": [dict(e) for e in entities],
+                "predictions": [dict(p) for p in predictions],
+            }
+    return results
+
+
+def _cot_many(entities_list: List[List[Dict]], texts: List[str]) -> List[List[Dict]]:
+    return cot_predict_many(list(zip(entities_list, texts)), max_new_tokens=COT_MAX_NEW_TOKENS)
+
+
+def _classifier_targets(entities_list: List[List[Dict]]) -> List[int]:
+    # 개체명이 있는 기사만 분류 모델로 예측
+    return [i for i, entities in enumerate(entities_list) if entities]
+
+
+def _apply_classifier(
+    entities_list: List[List[Dict]], targets: List[int], preds: List[Dict]
+) -> List[List[Dict]]:
+    # 기사의 방향·확신도를 그 기사의 모든 개체에 적용 (CoT 와 같은 형태의 결과)
+    results: List[List[Dict]] = [[] for _ in entities_list]
+    for i, pred in zip(targets, preds):
+        results[i] = [
+            {"asset": e["entity"], "direction": pred["direction"],
+             "confidence": pred["confidence"], "reasoning": ""}
+            for e in entities_list[i]
+        ]
+    return results
+
+
+def _classify_many(entities_list: List[List[Dict]], texts: List[str]) -> List[List[Dict]]:
+    """
+    개체명이 있는 기사만 분류 모델로 예측하고 (배치 구성은 model_predict 의 길이별 스케줄링),
+    기사의 방향·확신도를 그 기사의 모든 개체에 적용합니다. (CoT 와 같은 형태의 결과)
+    """
+    targets = _classifier_targets(entities_list)
+    preds = model_predict(load_model(), [texts[i] for i in targets]) if targets else []
+    return _apply_classifier(entities_list, targets, preds)
+
+
+async def _aclassify_many(entities_list: List[List[Dict]], texts: List[str]) -> List[List[Dict]]:
+    # _classify_many 의 API 경로 버전: 동시 요청의 기사들과 함께 마이크로 배처로 묶어 예측
+    targets = _classifier_targets(entities_list)
+    preds = await get_predict_batcher().submit_many([(texts[i], None) for i in targets]) if targets else []
+    return _apply_classifier(entities_list, targets, preds)
+
+
+def _escalations(results: List[List[Dict]], threshold: float, explain: bool) -> List[int]:
+    # cascade: 분류 모델 확신도가 threshold 미만(또는 근거 요청)인 기사 위치
+    escalate: List[int] = []
+    for i, predictions in enumerate(results):
+        if not predictions:
+            continue
+        if explain:
+            outcome = "explain"
+        elif predictions[0]["confidence"] < threshold:
+            outcome = "escalated"
+        else:
+            outcome = "accepted"
+        CASCADE_DECISIONS.labels(outcome).inc()
+        if outcome != "accepted":
+            escalate.append(i)
+    return escalate
+
+
+def _escalate(
+    results: List[List[Dict]], escalate: List[int], cot_results: List[List[Dict]]
+) -> List[List[Dict]]:
+    for i, predictions in zip(escalate, cot_results):
+        results[i] = predictions
+    return results
+
+
+def _cascade_many(
+    entities_list: List[List[Dict]], texts: List[str], threshold: float, explain: bool = False
+) -> List[List[Dict]]:
+    # 분류 모델로 모든 기사를 먼저 예측하고, 확신도가 threshold 미만(또는 근거 요청)인 기사만 CoT 로 다시 예측
+    results = _classify_many(entities_list, texts)
+    escalate = _escalations(results, threshold, explain)
+    if escalate:
+        cot_results = _cot_many([entities_list[i] for i in escalate], [texts[i] for i in escalate])
+        _escalate(results, escalate, cot_results)
+    return results
+
+
+def _infer(entities_list: List[List[Dict]], texts: List[str], options: PredictOptions) -> List[List[Dict]]:
+    if options.mode == "classifier":
+        return _classify_many(entities_list, texts)
+    if options.mode == "cascade":
+        return _cascade_many(entities_list, texts, options.threshold, options.explain)
+    return _cot_many(entities_list, texts)
+
+
+async def _ainfer(entities_list: List[List[Dict]], texts: List[str], options: PredictOptions) -> List[List[Dict]]:
+    # _infer 의 API 경로 버전: 분류는 마이크로 배처, CoT 는 추론 executor
+    if options.mode == "cot":
+        return await get_inference_executor().run(_cot_many, entities_list, texts)
+    results = await _aclassify_many(entities_list, texts)
+    if options.mode == "classifier":
+        return results
+    escalate = _escalations(results, options.threshold, options.explain)
+    if escalate:
+        cot_results = await get_inference_executor().run(
+            _cot_many, [entities_list[i] for i in escalate], [texts[i] for i in escalate]
+        )
+        _escalate(results, escalate, cot_results)
+    return results
+
+
+def predict_texts(texts: List[str], options: Optional[PredictOptions] = None) -> List[Dict]:
+    """
+    텍스트별 {'entities', 'predictions'} 를 입력 순서대로 반환합니다.
+
+    캐시에 없는 텍스트만 모아 NER(nlp.pipe) → 모드별 추론(배치 generate / 분류)을 한 번씩 수행하고,
+    결과를 캐시에 저장합니다. 같은 텍스트가 여러 번 들어오면 한 번만 계산합니다.
+    options 를 생략하면 설정의 PREDICT_MODE 를 사용합니다.
+    """
+    options = options or predict_options()
+    results, keys, pending = _lookup(texts, options)
+    if pending:
+        miss_texts = list(pending)
+        entities_list = extract_entities_many(miss_texts)
+        results = _fill(results, keys, pending, entities_list, _infer(entities_list, miss_texts, options))
+    return results
+
+
+async def apredict_texts(texts: List[str], options: Optional[PredictOptions] = None) -> List[Dict]:
+    """
+    predict_texts 의 비동기 버전 (API 경로용).
+
+    NER 은 NER executor, CoT 는 추론 executor 에서 실행해 이벤트 루프를 막지 않고,
+    분류 모델은 동시 요청의 기사들과 마이크로 배처로 묶어 (역시 추론 executor 에서) 예측합니다.
+    executor 가 가득 차면 ExecutorSaturatedError 가 전파됩니다.
+    """
+    options = options or predict_options()
+    results, keys, pending = _lookup(texts, options)
+    if pending:
+        miss_texts = list(pending)
+        entities_list = await get_ner_executor().run(extract_entities_many, miss_texts)
+        predictions_list = await _ainfer(entities_list, miss_texts, options)
+        results = _fill(results, keys, pending, entities_list, predictions_list)
+    return results
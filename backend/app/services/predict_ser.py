@@ -16,32 +16,77 @@ def predict_directions(entities: List[Dict], text: str) -> List[Dict]:
     return predictions
 
 from transformers import AutoTokenizer, AutoModelForCausalLM
+import logging
 import torch
 import os
 
-# 1) 토크나이저 및 모델 초기화
-test_model_name = 'EleutherAI/gpt-neo-125M'
-real_model_name = "EleutherAI/gpt-j-6B"
-MODEL_NAME = test_model_name
+from backend.app.config import settings
+from backend.app.services.backends import apply_generation_backend, cpu_dtype
+from backend.app.services.registry import registry
+
+logger = logging.getLogger(__name__)
+
+# 1) 토크나이저 및 모델 설정 (COT_MODEL, 예: 테스트용 gpt-neo-125M / 운영용 gpt-j-6B)
+MODEL_NAME = settings.COT_MODEL
 CACHE_DIR = "~/.cache/huggingface/transformers"
 CACHE_DIR = os.path.expanduser(CACHE_DIR)
 
-tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, cache_dir = CACHE_DIR, local_files_only=False)
-model     = AutoModelForCausalLM.from_pretrained(
-    MODEL_NAME,
-    cache_dir=CACHE_DIR,
-    torch_dtype=torch.float16,
-    local_files_only=False
-)
-
 # 2) 디바이스 설정 (GPU/CPU)
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-model.to(device)
+
+def _load_cot_model():
+    # import 시점이 아니라 처음 사용할 때(또는 lifespan 프리로드 시) 한 번만 호출됨
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, cache_dir = CACHE_DIR, local_files_only=False)
+    model     = AutoModelForCausalLM.from_pretrained(
+        MODEL_NAME,
+        cache_dir=CACHE_DIR,
+        torch_dtype=cpu_dtype(device),  # CPU 에서는 fp32 (fp16 은 CPU 에서 느림)
+        local_files_only=False
+    )
+    model.to(device)
+    model.eval()
+    # COT_BACKEND 설정에 따라 int8 동적 양자화 적용
+    return tokenizer, apply_generation_backend(model), device
+
+def _warmup_cot_model(loaded):
+    tokenizer, model, device = loaded
+    inputs = tokenizer("뉴스 기사: 워밍업", return_tensors="pt").to(device)
+    with torch.no_grad():
+        model.generate(**inputs, max_new_tokens=2, do_sample=False,
+                       pad_token_id=tokenizer.eos_token_id)
+
+registry.register("cot", _load_cot_model, warmup=_warmup_cot_model)
+
+def _load_draft_model():
+    # 추측 디코딩용 draft 모델 (본 모델의 토크나이저·디바이스를 그대로 사용)
+    model = AutoModelForCausalLM.from_pretrained(
+        settings.COT_DRAFT_MODEL,
+        cache_dir=CACHE_DIR,
+        torch_dtype=cpu_dtype(device),
+        local_files_only=False
+    )
+    model.to(device)
+    model.eval()
+    return apply_generation_backend(model)
+
+def speculative_enabled() -> bool:
+    """추측 디코딩 사용 여부. draft 모델이 본 모델과 같으면 자기 자신을 검증하는 셈이라 사용하지 않습니다."""
+    return settings.COT_SPECULATIVE and settings.COT_DRAFT_MODEL != MODEL_NAME
+
+# 추측 디코딩을 켠 경우에만 등록 (꺼져 있으면 프리로드·readiness 대상이 아님)
+if settings.COT_SPECULATIVE and not speculative_enabled():
+    logger.warning(
+        f"COT_DRAFT_MODEL is the same as COT_MODEL ({MODEL_NAME}); speculative decoding is disabled"
+    )
+if speculative_enabled():
+    registry.register("cot_draft", _load_draft_model)
 
 # 3) 예시 함수
 
 def load_model():
-    """토크나이저와 모델 객체를 반환합니다."""
-    return tokenizer, model, device
+    """토크나이저와 모델 객체를 반환합니다. (최초 호출 시 로드)"""
+    return registry.get("cot")
 
-print(load_model())
\ No newline at end of file
+def load_draft_model():
+    """추측 디코딩용 draft 모델을 반환합니다. (최초 호출 시 로드)"""
+    return registry.get("cot_draft")
@@ -0,0 +1,121 @@
+# backend/app/services/registry.py
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRegistry:
+    """
+    모델(토크나이저·spaCy 파이프라인 포함)을 이름으로 등록해 두고,
+    처음 필요할 때 정확히 한 번만 로드하는 레지스트리입니다.
+
+    - get(name): 로드되지 않았다면 그 자리에서 로드 (동시 호출 시에도 1회만 로드)
+    - preload_in_background(): lifespan 에서 백그라운드 스레드로 미리 로드 + warm-up
+    - status()/ready: 준비 상태 확인 (readiness 엔드포인트용)
+    """
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._warmups: Dict[str, Callable[[Any], None]] = {}
+        self._models: Dict[str, Any] = {}
+        self._errors: Dict[str, str] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+        self._preload: Optional[threading.Thread] = None
+
+    def register(
+        self,
+        name: str,
+        loader: Callable[[], Any],
+        warmup: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        with self._guard:
+            self._loaders[name] = loader
+            if warmup is not None:
+                self._warmups[name] = warmup
+            self._locks.setdefault(name, threading.Lock())
+
+    def set(self, name: str, obj: Any) -> None:
+        """이미 만들어진 객체를 직접 등록합니다. (테스트·벤치마크용 대체 모델 주입)"""
+        with self._guard:
+            self._locks.setdefault(name, threading.Lock())
+            self._models[name] = obj
+            self._errors.pop(name, None)
+
+    def unload(self, name: str) -> None:
+        with self._guard:
+            self._models.pop(name, None)
+            self._errors.pop(name, None)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def get(self, name: str) -> Any:
+        if name in self._models:
+            return self._models[name]
+        if name not in self._loaders:
+            raise KeyError(f"unknown model: {name}")
+        with self._locks[name]:
+            # 다른 스레드가 먼저 로드했을 수 있으므로 한 번 더 확인
+            if name not in self._models:
+                logger.info(f"Loading model '{name}'")
+                try:
+                    self._models[name] = self._loaders[name]()
+                except Exception as e:
+                    self._errors[name] = str(e)
+                    raise
+                self._errors.pop(name, None)
+        return self._models[name]
+
+    def warmup(self, name: str) -> None:
+        """더미 입력으로 한 번 추론해 첫 요청의 초기화(할당·JIT) 비용을 미리 지불합니다."""
+        fn = self._warmups.get(name)
+        if fn is not None:
+            fn(self.get(name))
+
+    def preload(self, names: Optional[Iterable[str]] = None, warmup: bool = False) -> None:
+        for name in list(names or self._loaders):
+            try:
+                self.get(name)
+                if warmup:
+                    self.warmup(name)
+            except Exception as e:
+                # 한 모델의 실패가 나머지 로드를 막지 않도록 기록만 하고 계속 진행
+                self._errors[name] = str(e)
+                logger.error(f"Failed to preload model '{name}': {e}")
+
+    def preload_in_background(
+        self, names: Optional[Iterable[str]] = None, warmup: bool = False
+    ) -> threading.Thread:
+        names = list(names or self._loaders)
+        self._preload = threading.Thread(
+            target=self.preload, args=(names, warmup), name="model-preload", daemon=True
+        )
+        self._preload.start()
+        return self._preload
+
+    @property
+    def ready(self) -> bool:
+        """백그라운드 로드가 끝났고, 등록된 모든 모델이 에러 없이 로드되었는지 여부"""
+        if self._preload is not None and self._preload.is_alive():
+            return False
+        return all(name in self._models for name in self._loaders)
+
+    def status(self) -> Dict[str, str]:
+        result: Dict[str, str] = {}
+        for name in self._loaders:
+            if name in self._models:
+                result[name] = "loaded"
+            elif name in self._errors:
+                result[name] = f"error: {self._errors[name]}"
+            elif self._locks[name].locked():
+                result[name] = "loading"
+            else:
+                result[name] = "pending"
+        return result
+
+
+# 애플리케이션 전역 레지스트리
+registry = ModelRegistry()
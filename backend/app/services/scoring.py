@@ -0,0 +1,246 @@
+# backend/app/services/scoring.py
+import csv
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from backend.app.services.model import load_model, model_predict
+from backend.app.services.ner import extract_entities_many
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ("jsonl", "parquet")
+
+# 본문으로 이어 붙일 후보 컬럼 (제목 뒤에 붙임)
+_BODY_FIELDS = ("description", "body", "content")
+_ID_FIELDS = ("id", "link", "request_id")
+
+
+def iter_records(path: str) -> Iterator[Dict]:
+    """CSV(헤더 포함) / JSONL 말뭉치를 한 행씩 스트리밍합니다."""
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith((".jsonl", ".ndjson")):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def record_text(row: Dict, text_fields: Optional[Sequence[str]] = None) -> str:
+    if text_fields:
+        return "\n".join(str(row.get(field) or "") for field in text_fields).strip()
+    if row.get("text"):
+        return str(row["text"])
+    body = next((row[field] for field in _BODY_FIELDS if row.get(field)), "")
+    return f"{row.get('title') or ''}\n{body}".strip()
+
+
+def record_id(row: Dict, index: int, id_field: Optional[str] = None) -> str:
+    if id_field:
+        return str(row.get(id_field, index))
+    return str(next((row[field] for field in _ID_FIELDS if row.get(field)), index))
+
+
+def iter_shard(
+    path: str, shard: int, num_shards: int, skip: int = 0
+) -> Iterator[Tuple[int, Dict]]:
+    # 전체 순번 i 가 i % num_shards == shard 인 행만, 앞의 skip 개(이미 처리한 행)는 건너뜀
+    seen = 0
+    for index, row in enumerate(iter_records(path)):
+        if index % num_shards != shard:
+            continue
+        seen += 1
+        if seen > skip:
+            yield index, row
+
+
+def score_batch(texts: List[str], ids: List[str]) -> List[Dict]:
+    """NER + 분류 모델로 기사별 {'id', 'entities', 'direction', 'confidence'} 를 계산합니다."""
+    rows = [{"id": id_, "entities": [], "direction": None, "confidence": None} for id_ in ids]
+    scored = [i for i, text in enumerate(texts) if text.strip()]
+    if not scored:
+        return rows
+    batch_texts = [texts[i] for i in scored]
+    entities_list = extract_entities_many(batch_texts)
+    predictions = model_predict(load_model(), batch_texts)
+    for i, entities, pred in zip(scored, entities_list, predictions):
+        rows[i].update(entities=entities, direction=pred["direction"], confidence=pred["confidence"])
+    return rows
+
+
+# ─── 출력 (체크포인트와 함께 내구성 있게 기록) ───
+
+class JsonlSink:
+    """샤드별 JSONL 파일. 재시작 시 체크포인트의 바이트 오프셋 이후(미확정 기록)는 잘라냅니다."""
+
+    def __init__(self, path: Path, offset: int = 0):
+        self.path = path
+        self._file = open(path, "a+b")
+        self._file.truncate(offset)
+        self._file.seek(offset)
+
+    def write(self, rows: List[Dict]) -> bool:
+        for row in rows:
+            self._file.write((json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8"))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return True
+
+    def close(self) -> bool:
+        self._file.close()
+        return True
+
+    def state(self) -> Dict:
+        return {"offset": self.path.stat().st_size}
+
+
+class ParquetSink:
+    """rows_per_file 행마다 part 파일을 하나씩 씁니다. (pyarrow 필요, 파일 단위로 확정)"""
+
+    def __init__(self, prefix: Path, files: int = 0, rows_per_file: int = 50_000):
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as e:
+            raise RuntimeError("parquet output requires pyarrow (pip install pyarrow)") from e
+        self.prefix = prefix
+        self.files = files
+        self.rows_per_file = rows_per_file
+        self._buffer: List[Dict] = []
+
+    def write(self, rows: List[Dict]) -> bool:
+        self._buffer.extend(rows)
+        if len(self._buffer) >= self.rows_per_file:
+            self._flush()
+            return True
+        return False
+
+    def close(self) -> bool:
+        if self._buffer:
+            self._flush()
+        return True
+
+    def _flush(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = Path(f"{self.prefix}-{self.files:05d}.parquet")
+        tmp = path.with_suffix(".parquet.tmp")
+        pq.write_table(pa.Table.from_pylist(self._buffer), tmp)
+        os.replace(tmp, path)
+        self.files += 1
+        self._buffer = []
+
+    def state(self) -> Dict:
+        return {"files": self.files}
+
+
+class ShardCheckpoint:
+    """샤드 진행 상태 JSON (원자적 교체로 저장)"""
+
+    def __init__(self, path: Path, input_path: str, shard: int, num_shards: int, output_format: str):
+        self.path = path
+        self.identity = {
+            "input": os.path.abspath(input_path),
+            "shard": shard,
+            "num_shards": num_shards,
+            "format": output_format,
+        }
+        self.data: Dict = {**self.identity, "consumed": 0, "done": False, "sink": {}}
+        if path.exists():
+            saved = json.loads(path.read_text())
+            mismatch = {k: saved.get(k) for k in self.identity if saved.get(k) != self.identity[k]}
+            if mismatch:
+                raise ValueError(f"checkpoint {path} was written for a different run: {mismatch}")
+            self.data = saved
+
+    def save(self, **updates) -> None:
+        self.data.update(updates)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.data))
+        os.replace(tmp, self.path)
+
+
+def score_shard(
+    input_path: str,
+    output_dir: str,
+    shard: int = 0,
+    num_shards: int = 1,
+    batch_size: int = 64,
+    output_format: str = "jsonl",
+    text_fields: Optional[Sequence[str]] = None,
+    id_field: Optional[str] = None,
+    rows_per_file: int = 50_000,
+    log_every: int = 100,
+) -> int:
+    """
+    말뭉치의 한 샤드를 batch_size 씩 채점해 output_dir 에 기록하고, 확정된 만큼 체크포인트를 남깁니다.
+    중단 후 같은 인자로 다시 실행하면 마지막 체크포인트 이후부터 이어서 처리합니다.
+
+    Returns:
+        이번 실행에서 처리한 행 수
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"unknown output format: {output_format} (choose from {OUTPUT_FORMATS})")
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    name = f"shard-{shard:03d}-of-{num_shards:03d}"
+    checkpoint = ShardCheckpoint(out / f"{name}.checkpoint.json", input_path, shard, num_shards, output_format)
+    if checkpoint.data["done"]:
+        logger.info(f"{name}: already complete ({checkpoint.data['consumed']} rows)")
+        return 0
+
+    saved = checkpoint.data["sink"]
+    if output_format == "jsonl":
+        sink = JsonlSink(out / f"{name}.jsonl", offset=saved.get("offset", 0))
+    else:
+        sink = ParquetSink(out / name, files=saved.get("files", 0), rows_per_file=rows_per_file)
+
+    consumed = checkpoint.data["consumed"]
+    processed = 0
+    batches = 0
+    started = time.perf_counter()
+    texts: List[str] = []
+    ids: List[str] = []
+
+    def flush_batch() -> None:
+        nonlocal processed, batches
+        rows = score_batch(texts, ids)
+        processed += len(rows)
+        batches += 1
+        if sink.write(rows):
+            checkpoint.save(consumed=consumed + processed, sink=sink.state())
+        if batches % log_every == 0:
+            rate = processed / (time.perf_counter() - started)
+            logger.info(f"{name}: {consumed + processed} rows ({rate:.1f} rows/s)")
+        texts.clear()
+        ids.clear()
+
+    for index, row in iter_shard(input_path, shard, num_shards, skip=consumed):
+        texts.append(record_text(row, text_fields))
+        ids.append(record_id(row, index, id_field))
+        if len(texts) >= batch_size:
+            flush_batch()
+    if texts:
+        flush_batch()
+    sink.close()
+    checkpoint.save(consumed=consumed + processed, sink=sink.state(), done=True)
+    logger.info(f"{name}: done, {processed} rows this run, {consumed + processed} total")
+    return processed
+
+
+def shard_worker(shard_kwargs: Dict, threads: int = 0) -> int:
+    """
+    다중 프로세스 채점용 진입점 (spawn 된 워커 프로세스마다 모델을 한 벌씩 로드).
+    프로세스들이 코어를 나눠 쓰도록 threads 로 torch 스레드 수를 제한합니다.
+    """
+    import torch
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(processName)s %(message)s")
+    if threads > 0:
+        torch.set_num_threads(threads)
+    return score_shard(**shard_kwargs)
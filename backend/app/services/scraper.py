@@ -3,8 +3,10 @@ import feedparser
 from typing import List, Dict
 from datetime import datetime
 from backend.app.config import settings
+from backend.app.services.naver_client import get_naver_client
 
-BASE_URL = "https://openapi.naver.com/v1/search/news.json"
+BASE_URL = settings.NAVER_API_BASE_URL
+RSS_URL = settings.NAVER_RSS_URL
 
 # 네이버 뉴스 검색 API
 
@@ -28,21 +30,52 @@ def fetch_news(
 def fetch_news_by_rss(
     max_articles: int = 10
 ) -> List[Dict]:
-    rss_url = (
-        "https://news.naver.com/main/main.naver"
-        "?mode=LSD&mid=shm&sid1=0&type=RSS"
-    )
-    resp = requests.get(rss_url)
+    resp = requests.get(RSS_URL)
     resp.raise_for_status()
-    feed = feedparser.parse(resp.text)
+    return parse_rss(resp.text, max_articles)
+
+def parse_rss(body: str, max_articles: int = 10, fill_missing_date: bool = True) -> List[Dict]:
+    # 발행 시각이 없는 항목은 현재 UTC 시각으로 채움 (fill_missing_date=False 면 None 으로 둠)
+    feed = feedparser.parse(body)
 
     articles: List[Dict] = []
     for entry in feed.entries[:max_articles]:
+        published = getattr(entry, "published", None)
+        if published is None and fill_missing_date:
+            published = datetime.utcnow().isoformat()
         articles.append({
             "title":        entry.title,
             "link":         entry.link,
             "originallink": entry.link,
             "description":  getattr(entry, "summary", ""),
-            "pubDate":      getattr(entry, "published", datetime.now().isoformat()),
+            "pubDate":      published,
         })
-    return articles
\ No newline at end of file
+    return articles
+
+# ─── 비동기 버전 (FastAPI/GraphQL 핸들러에서 이벤트 루프를 막지 않음) ───
+
+async def afetch_news(
+    query: str,
+    display: int = 10,
+    start: int = 1,
+    sort: str = "date"
+) -> List[Dict]:
+    return await get_naver_client().search_news(query, display=display, start=start, sort=sort)
+
+async def afetch_news_pages(
+    query: str,
+    pages: int,
+    display: int = 100,
+    sort: str = "date",
+    start: int = 1
+) -> List[Dict]:
+    return await get_naver_client().search_news_pages(
+        query, pages=pages, display=display, sort=sort, start=start
+    )
+
+async def afetch_news_by_rss(
+    max_articles: int = 10
+) -> List[Dict]:
+    resp = await get_naver_client().fetch_rss()
+    resp.raise_for_status()
+    return parse_rss(resp.text, max_articles)
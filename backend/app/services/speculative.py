@@ -0,0 +1,100 @@
+# backend/app/services/speculative.py
+from typing import Callable, Optional, Tuple
+
+import torch
+from transformers import DynamicCache
+
+from backend.app.utils.metrics import (
+    SPECULATIVE_ACCEPTANCE_RATE,
+    SPECULATIVE_ACCEPTED_TOKENS,
+    SPECULATIVE_DRAFT_TOKENS,
+)
+
+# logits_processor(input_ids, scores) -> scores / stopping_criteria(input_ids) -> 행별 bool (generate 와 같은 형태)
+Processor = Callable[[torch.Tensor, torch.Tensor], torch.Tensor]
+Stopping = Callable[[torch.Tensor], torch.Tensor]
+
+
+def _forward(model, input_ids: torch.Tensor, cache: DynamicCache) -> torch.Tensor:
+    # 캐시 이후의 토큰만 넣고 위치별 logit 을 받음 (position_ids 는 캐시 길이에서 이어짐)
+    return model(input_ids=input_ids, past_key_values=cache, use_cache=True).logits
+
+
+def _draft(draft_model, seq: torch.Tensor, cache: DynamicCache, k: int) -> torch.Tensor:
+    # draft 모델로 k 개 토큰을 greedy 로 제안 (마지막 제안 토큰은 캐시에 넣지 않음)
+    proposed = []
+    pending = seq[:, cache.get_seq_length():]
+    for _ in range(k):
+        token = _forward(draft_model, pending, cache)[:, -1].argmax(-1, keepdim=True)
+        proposed.append(token)
+        pending = token
+    return torch.cat(proposed, dim=1)
+
+
+def speculative_generate(
+    model,
+    draft_model,
+    input_ids: torch.Tensor,
+    max_new_tokens: int,
+    draft_tokens: int,
+    eos_token_id: Optional[int] = None,
+    logits_processor: Optional[Processor] = None,
+    stopping_criteria: Optional[Stopping] = None,
+) -> Tuple[torch.Tensor, int, int]:
+    """
+    한 시퀀스(batch=1)에 대한 추측 디코딩(speculative decoding, greedy).
+
+    작은 draft 모델이 draft_tokens 개를 먼저 제안하면, 본 모델이 [아직 캐시에 없는 토큰 + 제안 토큰] 을
+    한 번의 forward 로 검증합니다. 본 모델의 greedy 토큰과 일치하는 앞부분은 그대로 받고,
+    처음 어긋난 위치에는 본 모델의 토큰을 넣습니다. (모두 맞으면 다음 토큰 하나를 덤으로 얻음)
+    따라서 결과는 본 모델 단독 greedy 디코딩과 같고, 본 모델 forward 횟수만 줄어듭니다.
+    두 모델은 토큰 id 가 같은 토크나이저를 써야 합니다. (어휘 크기는 달라도 됨)
+
+    logits_processor / stopping_criteria 는 본 모델의 각 검증 위치에 generate 와 같은 순서로 적용됩니다.
+
+    Returns:
+        (프롬프트 포함 출력 ids, 제안 토큰 수, 받아들인 제안 토큰 수)
+    """
+    seq = input_ids
+    prompt_len = input_ids.shape[1]
+    cache, draft_cache = DynamicCache(), DynamicCache()
+    drafted = accepted = 0
+
+    with torch.no_grad():
+        while seq.shape[1] - prompt_len < max_new_tokens:
+            remaining = max_new_tokens - (seq.shape[1] - prompt_len)
+            # 검증 후 본 모델 토큰 하나가 더 붙으므로 제안은 남은 예산 - 1 개까지
+            k = min(draft_tokens, remaining - 1)
+            proposal = _draft(draft_model, seq, draft_cache, k) if k > 0 else seq[:, :0]
+            base = seq.shape[1]
+            uncached = base - cache.get_seq_length()
+            logits = _forward(model, torch.cat([seq[:, cache.get_seq_length():], proposal], dim=1), cache)
+
+            matched, stopped = 0, False
+            for j in range(k + 1):
+                scores = logits[:, uncached - 1 + j].float()
+                if logits_processor is not None:
+                    scores = logits_processor(seq, scores)
+                token = scores.argmax(-1, keepdim=True)
+                seq = torch.cat([seq, token], dim=1)
+                if eos_token_id is not None and int(token) == eos_token_id:
+                    stopped = True
+                elif stopping_criteria is not None and bool(stopping_criteria(seq).all()):
+                    stopped = True
+                if stopped or j == k or int(token) != int(proposal[0, j]):
+                    break
+                matched += 1
+
+            drafted += k
+            accepted += matched
+            # 검증된 토큰까지만 캐시를 남김 (본 모델이 고친 마지막 토큰은 다음 forward 에서 넣음)
+            cache.crop(base + matched)
+            draft_cache.crop(min(draft_cache.get_seq_length(), base + matched))
+            if stopped:
+                break
+
+    SPECULATIVE_DRAFT_TOKENS.inc(drafted)
+    SPECULATIVE_ACCEPTED_TOKENS.inc(accepted)
+    if drafted:
+        SPECULATIVE_ACCEPTANCE_RATE.observe(accepted / drafted)
+    return seq, drafted, accepted
@@ -0,0 +1,166 @@
+# backend/app/services/trends.py
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from backend.app.db.models import AssetTrend, Entity, NewsEntity, Prediction
+
+BUCKETS = ("minute", "hour", "day")
+
+# 집계 컬럼 (증분 갱신 시 col = col + excluded.col)
+COUNTERS = ("mentions", "up", "down", "neutral", "confidence_sum", "confidence_count")
+
+# 자산 언급으로 세지 않는 개체명 라벨 (급등/하락 같은 가격 변동 키워드)
+NON_ASSET_LABELS = {"PRICE_MOVE"}
+
+# (pub_date, entities, predictions) — 기사 하나의 저장된 결과
+RollupItem = Tuple[datetime, List[Dict], List[Dict]]
+RollupKey = Tuple[str, str, datetime]
+
+
+def bucket_start(value: datetime, bucket: str) -> datetime:
+    if bucket == "minute":
+        return value.replace(second=0, microsecond=0)
+    if bucket == "hour":
+        return value.replace(minute=0, second=0, microsecond=0)
+    if bucket == "day":
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"unknown bucket: {bucket} (choose from {BUCKETS})")
+
+
+def rollup_deltas(items: Iterable[RollupItem], sign: int = 1) -> Dict[RollupKey, Dict[str, float]]:
+    """기사별 결과를 (asset, bucket, bucket_start) 별 증감량으로 모읍니다. (sign=-1 이면 차감)"""
+    deltas: Dict[RollupKey, Dict[str, float]] = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+    for pub_date, entities, predictions in items:
+        counts: Dict[str, Dict[str, float]] = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        for name in {e["entity"] for e in entities if e["label"] not in NON_ASSET_LABELS}:
+            counts[name]["mentions"] = 1
+        for p in predictions:
+            if not p.get("asset") or not p.get("direction"):
+                continue
+            c = counts[p["asset"]]
+            c[p["direction"] if p["direction"] in ("up", "down") else "neutral"] += 1
+            if p.get("confidence") is not None:
+                c["confidence_sum"] += p["confidence"]
+                c["confidence_count"] += 1
+        for bucket in BUCKETS:
+            start = bucket_start(pub_date, bucket)
+            for asset, c in counts.items():
+                total = deltas[(asset, bucket, start)]
+                for col in COUNTERS:
+                    total[col] += sign * c[col]
+    return deltas
+
+
+def apply_rollups(db: Session, model_version: str, deltas: Dict[RollupKey, Dict[str, float]]) -> None:
+    """증감량을 asset_trends 에 더합니다. (INSERT ... ON CONFLICT DO UPDATE, 커밋은 호출자가)"""
+    if not deltas:
+        return
+    upsert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    stmt = upsert(AssetTrend)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["model_version", "asset", "bucket", "bucket_start"],
+        set_={col: getattr(AssetTrend, col) + getattr(stmt.excluded, col) for col in COUNTERS},
+    )
+    db.execute(stmt, [
+        {"model_version": model_version, "asset": asset, "bucket": bucket, "bucket_start": start, **values}
+        for (asset, bucket, start), values in deltas.items()
+    ])
+
+
+def stored_rollup_items(
+    db: Session,
+    news_ids: Optional[Iterable[int]] = None,
+    model_version: Optional[str] = None,
+) -> Dict[str, List[RollupItem]]:
+    """저장된 예측을 모델 버전별 집계 입력으로 읽습니다. (news_ids / model_version 이 None 이면 전체)"""
+    query = select(Prediction).order_by(Prediction.news_id, Prediction.id)
+    if news_ids is not None:
+        query = query.where(Prediction.news_id.in_(set(news_ids)))
+    if model_version is not None:
+        query = query.where(Prediction.model_version == model_version)
+
+    grouped: Dict[Tuple[str, int], Tuple[datetime, List[Dict]]] = {}
+    for p in db.scalars(query):
+        _, predictions = grouped.setdefault((p.model_version, p.news_id), (p.pub_date, []))
+        predictions.append({"asset": p.asset, "direction": p.direction, "confidence": p.confidence})
+    if not grouped:
+        return {}
+
+    entities: Dict[int, List[Dict]] = defaultdict(list)
+    rows = db.execute(
+        select(NewsEntity.news_id, Entity.name, Entity.label)
+        .join(Entity, Entity.id == NewsEntity.entity_id)
+        .where(NewsEntity.news_id.in_({news_id for _, news_id in grouped}))
+    )
+    for news_id, name, label in rows:
+        entities[news_id].append({"entity": name, "label": label})
+
+    items: Dict[str, List[RollupItem]] = defaultdict(list)
+    for (version, news_id), (pub_date, predictions) in grouped.items():
+        items[version].append((pub_date, entities[news_id], predictions))
+    return dict(items)
+
+
+def subtract_stored(db: Session, news_ids: Iterable[int], model_version: Optional[str] = None) -> None:
+    # 예측을 교체·삭제하기 전에, 기존 결과가 집계에 더해 둔 만큼 빼 둠
+    for version, items in stored_rollup_items(db, news_ids, model_version).items():
+        apply_rollups(db, version, rollup_deltas(items, sign=-1))
+
+
+def rebuild_trends(db: Session, model_version: Optional[str] = None) -> int:
+    """저장된 예측 전체로 집계를 다시 만듭니다. (초기 채우기·복구용, GROUP BY 대신 한 번 훑음)"""
+    clear = delete(AssetTrend)
+    if model_version is not None:
+        clear = clear.where(AssetTrend.model_version == model_version)
+    db.execute(clear)
+    articles = 0
+    for version, items in stored_rollup_items(db, model_version=model_version).items():
+        apply_rollups(db, version, rollup_deltas(items))
+        articles += len(items)
+    db.commit()
+    return articles
+
+
+def get_trends(
+    db: Session,
+    asset: str,
+    model_version: str,
+    bucket: str = "hour",
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> List[Dict]:
+    """
+    자산의 구간별 추이 (bucket_start 오름차순). 집계 테이블만 읽으므로 구간 수에 비례합니다.
+    date_from 은 포함, date_to 는 제외 경계이며 구간 시작 시각 기준으로 비교합니다.
+    """
+    if bucket not in BUCKETS:
+        raise ValueError(f"unknown bucket: {bucket} (choose from {BUCKETS})")
+    query = select(AssetTrend).where(
+        AssetTrend.model_version == model_version,
+        AssetTrend.asset == asset,
+        AssetTrend.bucket == bucket,
+    )
+    if date_from is not None:
+        query = query.where(AssetTrend.bucket_start >= bucket_start(date_from, bucket))
+    if date_to is not None:
+        query = query.where(AssetTrend.bucket_start < date_to)
+
+    points = []
+    for row in db.scalars(query.order_by(AssetTrend.bucket_start)):
+        if not (row.mentions or row.up or row.down or row.neutral):
+            continue  # 예측이 모두 교체·삭제되어 0 이 된 구간
+        points.append({
+            "bucket_start": row.bucket_start,
+            "mentions": row.mentions,
+            "up": row.up,
+            "down": row.down,
+            "neutral": row.neutral,
+            "mean_confidence": row.confidence_sum / row.confidence_count if row.confidence_count else None,
+        })
+    return points
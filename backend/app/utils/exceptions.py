@@ -0,0 +1,18 @@
+# backend/app/utils/exceptions.py
+
+
+class ExecutorSaturatedError(Exception):
+    """추론 executor 의 실행 + 대기 슬롯이 가득 참 (HTTP 429 + Retry-After 로 응답)"""
+
+    def __init__(self, name: str, retry_after: int = 1):
+        super().__init__(f"{name} executor is saturated, retry after {retry_after}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class ExecutorClosedError(Exception):
+    """종료 중이거나 종료된 executor 에 작업을 제출함 (HTTP 503 으로 응답)"""
+
+    def __init__(self, name: str):
+        super().__init__(f"{name} executor is shut down")
+        self.name = name
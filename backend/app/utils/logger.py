@@ -0,0 +1,39 @@
+# backend/app/utils/logger.py
+import json
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+from backend.app.config import settings
+from backend.app.utils.metrics import STAGE_SECONDS
+
+# 구조화 span 로그 (LOG_SPANS=True 일 때만 출력)
+span_logger = logging.getLogger("news_trend.span")
+
+
+@contextmanager
+def span(stage: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+    """
+    구간 실행 시간을 news_trend_stage_seconds{stage} 히스토그램에 기록합니다.
+
+    LOG_SPANS 가 켜져 있으면 {"span", "ms", "ok", ...fields} 한 줄 JSON 로그도 남깁니다.
+    with 블록 안에서 반환된 dict 에 값을 추가하면 로그 필드로 함께 기록됩니다.
+
+        with span("generate", batch=len(prompts)) as s:
+            ...
+            s["new_tokens"] = n
+    """
+    start = time.perf_counter()
+    ok = True
+    try:
+        yield fields
+    except BaseException:
+        ok = False
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        STAGE_SECONDS.labels(stage).observe(elapsed)
+        if settings.LOG_SPANS and span_logger.isEnabledFor(logging.INFO):
+            record = {"span": stage, "ms": round(elapsed * 1000, 3), "ok": ok, **fields}
+            span_logger.info(json.dumps(record, ensure_ascii=False, default=str))
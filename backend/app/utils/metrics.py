@@ -0,0 +1,152 @@
+# backend/app/utils/metrics.py
+from typing import Callable, Dict, Iterable
+
+from prometheus_client import CollectorRegistry, Counter, Histogram, REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+
+# 단계별 지연시간 (초) — stage: db_fetch / ner / tokenize / forward / generate / cot_parse / naver_request / cache_lookup
+STAGE_SECONDS = Histogram(
+    "news_trend_stage_seconds",
+    "Duration of pipeline stages",
+    ["stage"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+# 한 번에 처리한 배치 크기 (텍스트 / 시퀀스 수)
+BATCH_SIZE = Histogram(
+    "news_trend_batch_size",
+    "Number of items processed in one batched call",
+    ["stage"],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+
+GENERATED_TOKENS = Counter(
+    "news_trend_generated_tokens_total",
+    "Tokens produced by CoT generate calls",
+)
+
+GENERATION_TOKENS_PER_SECOND = Histogram(
+    "news_trend_generation_tokens_per_second",
+    "Generated tokens per second for each generate call (all rows combined)",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500),
+)
+
+# CoT 프롬프트의 기사 문맥 토큰 수 — kind: original(기사 전체) / selected(개체 주변 문맥 선택 후), 개체(프롬프트)당 누적
+COT_CONTEXT_TOKENS = Counter(
+    "news_trend_cot_context_tokens_total",
+    "Article tokens before and after entity-centric context selection",
+    ["kind"],
+)
+
+COT_CONTEXT_TOKENS_SAVED = Counter(
+    "news_trend_cot_context_tokens_saved_total",
+    "Article tokens dropped from CoT prompts by context selection",
+)
+
+# 추측 디코딩: draft 모델이 제안한 토큰 수 / 본 모델 검증을 통과한 토큰 수, generate 호출별 수락률
+SPECULATIVE_DRAFT_TOKENS = Counter(
+    "news_trend_speculative_draft_tokens_total",
+    "Tokens proposed by the draft model in speculative decoding",
+)
+
+SPECULATIVE_ACCEPTED_TOKENS = Counter(
+    "news_trend_speculative_accepted_tokens_total",
+    "Draft tokens accepted by the target model in speculative decoding",
+)
+
+SPECULATIVE_ACCEPTANCE_RATE = Histogram(
+    "news_trend_speculative_acceptance_rate",
+    "Fraction of draft tokens accepted per speculative generate call",
+    buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
+)
+
+# cascade 모드의 기사별 결정 — outcome: accepted(분류 모델 결과 사용) / escalated(확신도 미달 → CoT) / explain(근거 요청 → CoT)
+CASCADE_DECISIONS = Counter(
+    "news_trend_cascade_decisions_total",
+    "Articles decided by the classifier or escalated to CoT in cascade mode",
+    ["outcome"],
+)
+
+NAVER_REQUESTS = Counter(
+    "news_trend_naver_requests_total",
+    "Naver API / RSS requests by outcome (HTTP status or error)",
+    ["status"],
+)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "news_trend_http_request_seconds",
+    "HTTP request latency by route",
+    ["method", "route", "status"],
+)
+
+
+class RuntimeStateCollector:
+    """
+    스크랩 시점의 상태 값(큐 깊이, 캐시 적중률, executor 누적 처리 수 등)을 내보내는 collector.
+    값을 들고 있지 않고 등록된 함수에서 그때그때 읽어 옵니다.
+    """
+
+    def __init__(self):
+        self._sources: Dict[str, Callable[[], Iterable[Metric]]] = {}
+
+    def add_source(self, name: str, fn: Callable[[], Iterable[Metric]]) -> None:
+        self._sources[name] = fn
+
+    def collect(self):
+        for fn in list(self._sources.values()):
+            yield from fn()
+
+
+runtime_state = RuntimeStateCollector()
+
+
+def _executor_metrics():
+    from backend.app.services.executor import executor_stats
+
+    stats = executor_stats()
+    # in_flight 는 현재 값(gauge), rejected / completed 는 누적 값(counter, 이름에 _total 이 붙음)
+    for field, doc, family_type in (
+        ("in_flight", "Jobs running or queued on the inference executor", GaugeMetricFamily),
+        ("rejected", "Jobs rejected because the executor was saturated", CounterMetricFamily),
+        ("completed", "Jobs completed by the inference executor", CounterMetricFamily),
+    ):
+        family = family_type(f"news_trend_executor_{field}", doc, labels=["executor"])
+        for name, values in stats.items():
+            family.add_metric([name], values[field])
+        yield family
+
+
+def _cache_metrics():
+    from backend.app.services.cache import prediction_cache
+
+    stats = prediction_cache.stats()
+    # hits / misses 는 누적 값(counter), hit_rate / size 는 현재 값(gauge)
+    for field, doc, family_type in (
+        ("hits", "Prediction cache hits", CounterMetricFamily),
+        ("misses", "Prediction cache misses", CounterMetricFamily),
+        ("hit_rate", "Prediction cache hit rate", GaugeMetricFamily),
+        ("size", "Entries in the in-memory prediction cache", GaugeMetricFamily),
+    ):
+        yield family_type(f"news_trend_prediction_cache_{field}", doc, value=stats[field])
+
+
+def _batcher_metrics():
+    from backend.app.services.model import predict_batcher_queue_depth
+
+    yield GaugeMetricFamily(
+        "news_trend_predict_batcher_queue_depth",
+        "Classifier requests waiting in the micro-batcher queue",
+        value=predict_batcher_queue_depth(),
+    )
+
+
+runtime_state.add_source("executor", _executor_metrics)
+runtime_state.add_source("cache", _cache_metrics)
+runtime_state.add_source("batcher", _batcher_metrics)
+
+
+def register_runtime_collector(registry: CollectorRegistry = REGISTRY) -> None:
+    # 중복 등록 방지 (테스트 등에서 여러 번 호출될 수 있음)
+    if not getattr(runtime_state, "_registered", False):
+        registry.register(runtime_state)
+        runtime_state._registered = True
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# benchmarks/compare.py
+#
+# 두 벤치마크 결과(JSON)를 비교합니다.
+#
+#   python benchmarks/compare.py base.json new.json --threshold 0.15 --fail-on-regression
+#
+# (name, batch_size, text_length) 별 p50 지연시간 변화율을 출력하고,
+# threshold 보다 느려진 항목이 있으면 --fail-on-regression 시 종료 코드 1 을 반환합니다.
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def load(path: str) -> dict:
+    report = json.loads(Path(path).read_text())
+    return {(r["name"], r["batch_size"], r["text_length"]): r for r in report["results"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.15, help="회귀로 볼 p50 증가율 (0.15 = 15%%)")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    base, new = load(args.base), load(args.new)
+    regressions = 0
+    print(f"{'name':<22}{'bs':>4}{'len':>7}{'base p50':>11}{'new p50':>11}{'change':>9}")
+    for key in sorted(base.keys() & new.keys()):
+        old_p50, new_p50 = base[key]["p50_ms"], new[key]["p50_ms"]
+        change = (new_p50 - old_p50) / old_p50 if old_p50 else 0.0
+        flag = ""
+        if change > args.threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{key[0]:<22}{key[1]:>4}{key[2]:>7}{old_p50:>11.2f}{new_p50:>11.2f}{change:>+9.1%}{flag}")
+    for key in sorted(base.keys() ^ new.keys()):
+        print(f"{key[0]:<22}{key[1]:>4}{key[2]:>7}  (only in {'base' if key in base else 'new'})")
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
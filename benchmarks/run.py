@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# benchmarks/run.py
+#
+# 예측 파이프라인 벤치마크 (오프라인, 랜덤 초기화 모델 사용)
+#
+#   python benchmarks/run.py --output benchmarks/results/$(git rev-parse --short HEAD).json
+#   python benchmarks/run.py --suites ner classifier --batch-sizes 1 8 --lengths 64 512
+#
+# 대상: extract_entities / extract_entities_many, model_predict, cot_predict_many,
+#       POST /predict, POST /predict/batch (캐시 비활성화)
+# 배치 크기 × 텍스트 길이마다 지연시간 p50/p95/p99 와 초당 처리 텍스트 수를 JSON 으로 저장하고,
+# benchmarks/compare.py 로 커밋 간 결과를 비교합니다.
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+# Settings 필수 값 (.env 없이 실행할 때의 기본값)
+os.environ.setdefault("NAVER_CLIENT_ID", "benchmark")
+os.environ.setdefault("NAVER_CLIENT_SECRET", "benchmark")
+os.environ.setdefault("DB_URL", "sqlite://")
+
+import torch
+
+from benchmarks import tiny_models
+from backend.app.config import settings
+from backend.app.services import pipeline
+from backend.app.services.registry import registry
+
+SUITES = ("ner", "classifier", "cot", "api")
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def measure(fn: Callable[[List[str]], object], batches: List[List[str]], warmup: int) -> Dict:
+    for batch in batches[:warmup]:
+        fn(batch)
+    latencies = []
+    for batch in batches:
+        start = time.perf_counter()
+        fn(batch)
+        latencies.append((time.perf_counter() - start) * 1000)
+    items = sum(len(b) for b in batches)
+    return {
+        "calls": len(batches),
+        "p50_ms": round(statistics.median(latencies), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "items_per_sec": round(items / (sum(latencies) / 1000), 2),
+    }
+
+
+def make_cases(suites, max_new_tokens: int) -> Dict[str, Callable[[List[str]], object]]:
+    from backend.app.services.cot import cot_predict_many
+    from backend.app.services.model import model_predict
+    from backend.app.services.ner import extract_entities, extract_entities_many
+
+    cases: Dict[str, Callable[[List[str]], object]] = {}
+    if "ner" in suites:
+        cases["extract_entities"] = lambda texts: [extract_entities(t) for t in texts]
+        cases["extract_entities_many"] = extract_entities_many
+    if "classifier" in suites:
+        cases["model_predict"] = lambda texts: model_predict(registry.get("classifier"), texts)
+    if "cot" in suites:
+        def cot(texts):
+            # 텍스트당 최대 2개 개체 (생성 작업량을 일정하게)
+            entities = [ents[:2] for ents in extract_entities_many(texts)]
+            return cot_predict_many(list(zip(entities, texts)), max_new_tokens=max_new_tokens)
+        cases["cot_predict"] = cot
+    if "api" in suites:
+        from fastapi.testclient import TestClient
+        from backend.app.main import app
+
+        client = TestClient(app)
+
+        def post(path, body):
+            response = client.post(path, json=body)
+            response.raise_for_status()
+            return response
+
+        cases["api_predict"] = lambda texts: [post("/predict/", {"text": t}) for t in texts]
+        cases["api_predict_batch"] = lambda texts: post("/predict/batch", [{"text": t} for t in texts])
+    return cases
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예측 파이프라인 지연시간·처리량 벤치마크 (오프라인)")
+    parser.add_argument("--suites", nargs="+", default=list(SUITES), choices=SUITES)
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=[1, 4, 16])
+    parser.add_argument("--lengths", nargs="+", type=int, default=[64, 256, 1024], help="텍스트 길이(글자 수)")
+    parser.add_argument("--repeats", type=int, default=5, help="설정별 측정 호출 수")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--max-new-tokens", type=int, default=16)
+    parser.add_argument("--constrained", action="store_true", help="CoT 답 토큰 제한·조기 종료 디코딩 사용")
+    parser.add_argument("--hidden-size", type=int, default=64)
+    parser.add_argument("--layers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=1, help="torch 스레드 수 (측정 재현성을 위해 기본 1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    torch.set_num_threads(args.threads)
+    # 계산 비용을 재려는 것이므로 예측 캐시는 끔, API 경로도 같은 생성 길이로 맞춤
+    settings.PREDICT_CACHE_ENABLED = False
+    pipeline.COT_MAX_NEW_TOKENS = args.max_new_tokens
+    settings.COT_CONSTRAINED = args.constrained
+    tiny_models.install(hidden_size=args.hidden_size, num_layers=args.layers, seed=args.seed)
+    cases = make_cases(args.suites, args.max_new_tokens)
+
+    results = []
+    print(f"{'name':<22}{'bs':>4}{'len':>7}{'p50(ms)':>11}{'p95(ms)':>11}{'texts/s':>11}")
+    for name, fn in cases.items():
+        # 단건 엔드포인트/함수는 배치 크기 1 만 의미가 있음
+        batch_sizes = [1] if name in ("extract_entities", "api_predict") else args.batch_sizes
+        for length in args.lengths:
+            for batch_size in batch_sizes:
+                texts = tiny_models.make_texts(batch_size * args.repeats, length, seed=args.seed)
+                batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+                row = {"name": name, "batch_size": batch_size, "text_length": length}
+                row.update(measure(fn, batches, args.warmup))
+                results.append(row)
+                print(
+                    f"{name:<22}{batch_size:>4}{length:>7}"
+                    f"{row['p50_ms']:>11.2f}{row['p95_ms']:>11.2f}{row['items_per_sec']:>11.1f}",
+                    flush=True,
+                )
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "torch": torch.__version__,
+            "platform": platform.platform(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
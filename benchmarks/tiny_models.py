@@ -0,0 +1,111 @@
+# benchmarks/tiny_models.py
+#
+# 벤치마크용 오프라인 모델: 허브 접속 없이 만드는 작은 BPE 토크나이저 + 랜덤 초기화 GPT-Neo,
+# ko_core_news_sm 대신 같은 라벨(OG/LC)을 내는 규칙 기반 spaCy 파이프라인.
+# 시드를 고정하므로 같은 커밋에서는 항상 같은 모델·같은 입력으로 측정됩니다.
+# 테스트(tests/conftest.py)도 같은 토크나이저 / config 팩토리를 더 작은 크기로 사용합니다.
+
+import random
+from typing import List, Optional
+
+import spacy
+import torch
+from tokenizers import Tokenizer, decoders, models, pre_tokenizers, trainers
+from transformers import (
+    GPTNeoConfig,
+    GPTNeoForCausalLM,
+    GPTNeoForSequenceClassification,
+    PreTrainedTokenizerFast,
+)
+
+from backend.app.services.registry import registry
+
+ASSETS = ["삼성전자", "SK하이닉스", "현대차", "카카오", "네이버", "코스피", "코스닥", "애플", "테슬라", "엔비디아"]
+JOSA = ["가", "는", "의", "이", ""]
+SENTENCES = [
+    "{a}{j} 어제 코스피 시장에서 급등했다.",
+    "{a}{j} 실적 발표 이후 주가가 하락했다.",
+    "외국인 매수세에 {a} 주가가 상승 마감했다.",
+    "{a}{j} 신제품 출시로 시장의 관심이 커지고 있다.",
+    "금리 동결 소식에 {a} 관련 종목은 보합세를 보였다.",
+    "증권가는 {a}의 다음 분기 실적을 긍정적으로 전망했다.",
+]
+PROMPT_WORDS = "뉴스 기사 분석 대상 자산 가격 방향성 up down neutral 예측 근거 단계별 사고 과정 결과"
+
+
+def make_texts(n: int, length: int, seed: int = 0) -> List[str]:
+    """자산명이 섞인 한국어 뉴스 문장을 이어 붙여 대략 length 글자의 텍스트 n 개를 만듭니다."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        parts: List[str] = []
+        while sum(len(p) + 1 for p in parts) < length:
+            parts.append(rng.choice(SENTENCES).format(a=rng.choice(ASSETS), j=rng.choice(JOSA)))
+        texts.append(" ".join(parts)[:max(length, 1)])
+    return texts
+
+
+def make_tokenizer(
+    vocab_size: int = 2048, max_length: int = 512, corpus: Optional[List[str]] = None
+) -> PreTrainedTokenizerFast:
+    """바이트 BPE 토크나이저를 corpus(기본: 합성 뉴스 문장 + 프롬프트 단어)로 학습합니다."""
+    if corpus is None:
+        corpus = make_texts(200, 200, seed=1) + [PROMPT_WORDS] * 20
+    tok = Tokenizer(models.BPE())
+    tok.pre_tokenizer = pre_tokenizers.ByteLevel(add_prefix_space=False)
+    tok.decoder = decoders.ByteLevel()
+    trainer = trainers.BpeTrainer(
+        vocab_size=vocab_size,
+        special_tokens=["<|endoftext|>"],
+        initial_alphabet=pre_tokenizers.ByteLevel.alphabet(),
+        show_progress=False,
+    )
+    tok.train_from_iterator(corpus, trainer)
+    return PreTrainedTokenizerFast(
+        tokenizer_object=tok,
+        eos_token="<|endoftext|>",
+        pad_token="<|endoftext|>",
+        # GPT 계열 토크나이저처럼 token_type_ids 는 만들지 않음
+        model_input_names=["input_ids", "attention_mask"],
+        model_max_length=max_length,
+    )
+
+
+def gpt_neo_config(tokenizer, hidden_size: int, num_layers: int, **overrides) -> GPTNeoConfig:
+    params = dict(
+        vocab_size=len(tokenizer),
+        hidden_size=hidden_size,
+        num_layers=num_layers,
+        num_heads=max(1, hidden_size // 32),
+        attention_types=[[["global", "local"], max(1, num_layers // 2)]],
+        intermediate_size=hidden_size * 4,
+        max_position_embeddings=4096,
+        window_size=256,
+        eos_token_id=tokenizer.eos_token_id,
+        pad_token_id=tokenizer.pad_token_id,
+    )
+    params.update(overrides)
+    return GPTNeoConfig(**params)
+
+
+def make_nlp():
+    nlp = spacy.blank("xx")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns(
+        [{"label": "OG", "pattern": asset + josa} for asset in ASSETS for josa in JOSA if asset + josa]
+    )
+    return nlp
+
+
+def install(hidden_size: int = 64, num_layers: int = 2, seed: int = 0) -> None:
+    """레지스트리의 ner / classifier / cot 모델을 오프라인 벤치마크 모델로 교체합니다."""
+    tokenizer = make_tokenizer()
+    torch.manual_seed(seed)
+    causal = GPTNeoForCausalLM(gpt_neo_config(tokenizer, hidden_size, num_layers)).eval()
+    torch.manual_seed(seed)
+    classifier = GPTNeoForSequenceClassification(
+        gpt_neo_config(tokenizer, hidden_size, num_layers, num_labels=2)
+    ).eval()
+    registry.set("ner", make_nlp())
+    registry.set("classifier", (tokenizer, classifier))
+    registry.set("cot", (tokenizer, causal, torch.device("cpu")))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# scripts/compare_backends.py
+#
+# 분류 모델의 추론 백엔드(eager / int8 / torchscript)별 지연시간과 정확도(eager 대비 일치율)를 비교합니다.
+#
+#   python scripts/compare_backends.py --input data/latest_news.csv --batch-size 8 --threads 4
+#
+# 결과 표를 출력하고, --output 을 주면 JSON 으로도 저장합니다.
+
+import argparse
+import csv
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import torch
+
+from backend.app.services.backends import (
+    BACKENDS,
+    TracedClassifier,
+    export_torchscript,
+    quantize_int8,
+)
+from backend.app.services.model import load_base_classifier
+
+SAMPLE_TEXTS = [
+    "삼성전자가 어제 코스피 시장에서 급등했다.",
+    "애플이 오늘 주가가 하락했다.",
+    "한국은행이 기준금리를 동결하면서 채권 시장은 보합세를 보였다.",
+    "국제 유가가 공급 우려로 큰 폭으로 상승했다.",
+]
+
+
+def load_texts(path: str | None, limit: int) -> list[str]:
+    # CSV(title/description 또는 text 컬럼) / JSONL 을 지원, 없으면 예시 문장 사용
+    texts: list[str] = []
+    if path and Path(path).exists() and Path(path).stat().st_size > 0:
+        with open(path, encoding="utf-8") as f:
+            if path.endswith(".jsonl"):
+                rows = (json.loads(line) for line in f if line.strip())
+            else:
+                rows = csv.DictReader(f)
+            for row in rows:
+                text = row.get("text") or f"{row.get('title', '')}\n{row.get('description', '')}"
+                if text.strip():
+                    texts.append(text)
+                if len(texts) >= limit:
+                    break
+    if not texts:
+        texts = (SAMPLE_TEXTS * (limit // len(SAMPLE_TEXTS) + 1))[:limit]
+    return texts
+
+
+def run_backend(tokenizer, model, texts, batch_size, repeats):
+    latencies, probs = [], []
+    for r in range(repeats):
+        for i in range(0, len(texts), batch_size):
+            enc = tokenizer(texts[i:i + batch_size], padding=True, truncation=True, return_tensors="pt")
+            start = time.perf_counter()
+            with torch.no_grad():
+                logits = model(input_ids=enc["input_ids"], attention_mask=enc["attention_mask"]).logits
+            latencies.append((time.perf_counter() - start) * 1000)
+            if r == 0:
+                probs.append(torch.softmax(logits.float(), dim=-1))
+    return latencies, torch.cat(probs)
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분류 모델 추론 백엔드별 지연시간·정확도 비교")
+    parser.add_argument("--input", default="data/latest_news.csv")
+    parser.add_argument("--limit", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    if args.threads > 0:
+        torch.set_num_threads(args.threads)
+
+    tokenizer, base = load_base_classifier()
+    texts = load_texts(args.input, args.limit)
+
+    # 워밍업 후 eager 결과를 기준값으로 사용
+    run_backend(tokenizer, base, texts[:args.batch_size], args.batch_size, 1)
+    _, reference = run_backend(tokenizer, base, texts, args.batch_size, 1)
+
+    report = []
+    for name in args.backends:
+        if name == "eager":
+            model = base
+        elif name == "int8":
+            model = quantize_int8(base)
+        else:
+            with tempfile.TemporaryDirectory() as tmp:
+                traced = export_torchscript(tokenizer, base, Path(tmp) / "classifier.pt")
+            model = TracedClassifier(traced, config=base.config)
+
+        run_backend(tokenizer, model, texts[:args.batch_size], args.batch_size, 1)
+        latencies, probs = run_backend(tokenizer, model, texts, args.batch_size, args.repeats)
+        agreement = (probs.argmax(-1) == reference.argmax(-1)).float().mean().item()
+        report.append({
+            "backend": name,
+            "batch_size": args.batch_size,
+            "p50_ms": round(statistics.median(latencies), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "texts_per_sec": round(len(texts) * args.repeats / (sum(latencies) / 1000), 1),
+            "agreement": round(agreement, 4),
+            "max_prob_diff": round((probs - reference).abs().max().item(), 4),
+        })
+
+    print(f"{'backend':<12}{'p50(ms)':>10}{'p95(ms)':>10}{'texts/s':>10}{'agree':>8}{'maxΔp':>8}")
+    for row in report:
+        print(
+            f"{row['backend']:<12}{row['p50_ms']:>10}{row['p95_ms']:>10}"
+            f"{row['texts_per_sec']:>10}{row['agreement']:>8}{row['max_prob_diff']:>8}"
+        )
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# scripts/ingest_data.py
+#
+# 네이버 RSS / 검색 API 를 폴링해 새 기사만 DB 에 저장합니다.
+#
+#   python scripts/ingest_data.py --rss --query 삼성전자 --query 코스피 --interval 300
+#
+# --interval 을 주지 않으면 한 번만 수집하고 종료합니다.
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.app.db.models import init_db
+from backend.app.db.session import SessionLocal
+from backend.app.services.ingest import IncrementalIngester
+from backend.app.services.naver_client import close_naver_client
+
+
+async def run_once(ingester: IncrementalIngester, args) -> int:
+    total = 0
+    if args.rss:
+        total += await ingester.ingest_rss()
+    for query in args.query:
+        total += await ingester.ingest_search(query, max_pages=args.pages, display=args.display)
+    return total
+
+
+async def main(args) -> None:
+    init_db()
+    db = SessionLocal()
+    try:
+        ingester = IncrementalIngester(db)
+        while True:
+            total = await run_once(ingester, args)
+            print(f"✅ {total} new articles")
+            if not args.interval:
+                break
+            await asyncio.sleep(args.interval)
+    finally:
+        db.close()
+        await close_naver_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="증분 뉴스 수집 (RSS / 검색 API)")
+    parser.add_argument("--rss", action="store_true", help="네이버 전체 뉴스 RSS 수집")
+    parser.add_argument("--query", action="append", default=[], help="검색어 (여러 번 지정 가능)")
+    parser.add_argument("--pages", type=int, default=10, help="검색어별 최대 페이지 수")
+    parser.add_argument("--display", type=int, default=100, help="페이지당 기사 수 (최대 100)")
+    parser.add_argument("--interval", type=float, default=0, help="폴링 주기(초), 0 이면 1회 실행")
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# scripts/score_corpus.py
+#
+# CSV / JSONL 말뭉치 전체를 NER + 분류 모델로 오프라인 채점합니다.
+#
+#   python scripts/score_corpus.py --input data/latest_news.csv --output-dir data/scores \
+#       --workers 4 --threads-per-worker 2 --batch-size 64
+#
+# 행 i 는 i % workers 번 샤드가 처리하며, 워커 프로세스마다 모델을 한 벌씩 올립니다.
+# 결과는 output-dir/shard-XXX-of-YYY.jsonl (또는 .parquet) 로 배치마다 기록되고,
+# 중단 후 같은 인자로 다시 실행하면 체크포인트 이후부터 이어서 처리합니다.
+
+import argparse
+import logging
+import multiprocessing
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.app.services.scoring import OUTPUT_FORMATS, shard_worker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="말뭉치 오프라인 일괄 채점 (NER + 분류)")
+    parser.add_argument("--input", required=True, help="CSV(헤더 포함) 또는 JSONL 파일")
+    parser.add_argument("--output-dir", required=True)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--threads-per-worker", type=int, default=0, help="0 이면 torch 기본값")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--format", default="jsonl", choices=OUTPUT_FORMATS, help="parquet 은 pyarrow 필요")
+    parser.add_argument("--rows-per-file", type=int, default=50_000, help="parquet part 파일당 행 수")
+    parser.add_argument("--text-field", action="append", help="본문으로 쓸 컬럼 (여러 번 지정 시 이어 붙임)")
+    parser.add_argument("--id-field", help="결과 id 로 쓸 컬럼 (기본: id / link / request_id / 행 번호)")
+    parser.add_argument("--log-every", type=int, default=100, help="진행 로그를 남길 배치 간격")
+    args = parser.parse_args()
+
+    def shard_kwargs(shard: int) -> dict:
+        return dict(
+            input_path=args.input,
+            output_dir=args.output_dir,
+            shard=shard,
+            num_shards=args.workers,
+            batch_size=args.batch_size,
+            output_format=args.format,
+            text_fields=args.text_field,
+            id_field=args.id_field,
+            rows_per_file=args.rows_per_file,
+            log_every=args.log_every,
+        )
+
+    if args.workers == 1:
+        total = shard_worker(shard_kwargs(0), args.threads_per_worker)
+    else:
+        # fork 하면 부모의 torch 스레드 풀 상태를 물려받아 멈출 수 있으므로 spawn 사용
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(args.workers) as pool:
+            results = [
+                pool.apply_async(shard_worker, (shard_kwargs(shard), args.threads_per_worker))
+                for shard in range(args.workers)
+            ]
+            total = sum(result.get() for result in results)
+    logging.getLogger(__name__).info(f"scored {total} rows")
+    print(f"✅ {total} rows scored → {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,8 @@ setup(
         "uvicorn[standard]",
         "pydantic-settings",
         "requests",
+        "httpx",
+        "prometheus-client",
         "feedparser",
         "SQLAlchemy",
         "graphene",
@@ -0,0 +1,71 @@
+# tests/backend/test_backends.py
+import pytest
+import torch
+
+from backend.app.config import settings
+from backend.app.services.backends import apply_classifier_backend, quantize_int8
+from backend.app.services.model import model_predict
+
+TEXTS = ["삼성전자가 어제 코스피 시장에서 급등했다.", "애플", "단계별 사고 과정: 실적 개선, 수요 증가"]
+
+
+def _logits(tokenizer, model, texts):
+    enc = tokenizer(texts, padding=True, return_tensors="pt")
+    with torch.no_grad():
+        return model(**enc).logits
+
+
+def test_torchscript_export_is_saved_and_matches_eager(tiny_tokenizer, tiny_classifier, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_DIR", str(tmp_path))
+    traced = apply_classifier_backend(tiny_tokenizer, tiny_classifier, backend="torchscript")
+    assert len(list(tmp_path.glob("classifier-*.pt"))) == 1
+
+    # trace 때와 다른 배치 크기·길이에서도 eager 와 같은 결과
+    for texts in (TEXTS, TEXTS[:1]):
+        expected = _logits(tiny_tokenizer, tiny_classifier, texts)
+        assert torch.allclose(_logits(tiny_tokenizer, traced, texts), expected, atol=1e-4)
+
+    # 저장된 그래프를 다시 불러와 model_predict 에 그대로 사용
+    reloaded = apply_classifier_backend(tiny_tokenizer, tiny_classifier, backend="torchscript")
+    results = model_predict((tiny_tokenizer, reloaded), TEXTS)
+    assert [r["direction"] for r in results] == [
+        r["direction"] for r in model_predict((tiny_tokenizer, tiny_classifier), TEXTS)
+    ]
+
+
+def test_torchscript_export_is_retraced_when_model_changes(tiny_tokenizer, tiny_classifier, tmp_path, monkeypatch):
+    import copy
+
+    monkeypatch.setattr(settings, "EXPORT_DIR", str(tmp_path))
+    apply_classifier_backend(tiny_tokenizer, tiny_classifier, backend="torchscript", model_id="a")
+    [first] = tmp_path.glob("classifier-*.pt")
+
+    # 다른 모델 이름, 또는 같은 이름의 가중치가 바뀌면 예전 그래프를 쓰지 않고 다시 trace
+    apply_classifier_backend(tiny_tokenizer, tiny_classifier, backend="torchscript", model_id="b")
+    [renamed] = tmp_path.glob("classifier-*.pt")
+    assert renamed != first
+
+    changed = copy.deepcopy(tiny_classifier)
+    with torch.no_grad():
+        next(changed.parameters()).add_(1.0)
+    traced = apply_classifier_backend(tiny_tokenizer, changed, backend="torchscript", model_id="b")
+    [retraced] = tmp_path.glob("classifier-*.pt")
+    assert retraced != renamed
+    assert torch.allclose(_logits(tiny_tokenizer, traced, TEXTS), _logits(tiny_tokenizer, changed, TEXTS), atol=1e-4)
+
+
+def test_int8_quantizes_linear_layers(tiny_tokenizer, tiny_classifier):
+    quantized = quantize_int8(tiny_classifier)
+    assert any(
+        isinstance(m, torch.ao.nn.quantized.dynamic.Linear) for m in quantized.modules()
+    )
+    # 원본 모델은 그대로 유지
+    assert not any(
+        isinstance(m, torch.ao.nn.quantized.dynamic.Linear) for m in tiny_classifier.modules()
+    )
+    assert _logits(tiny_tokenizer, quantized, TEXTS).shape == (3, 2)
+
+
+def test_unknown_backend(tiny_tokenizer, tiny_classifier):
+    with pytest.raises(ValueError):
+        apply_classifier_backend(tiny_tokenizer, tiny_classifier, backend="onnx")
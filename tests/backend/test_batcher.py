@@ -0,0 +1,110 @@
+# tests/backend/test_batcher.py
+import asyncio
+import threading
+
+import pytest
+
+from backend.app.services.batcher import MicroBatcher, plan_token_batches
+
+
+def test_concurrent_requests_are_batched():
+    seen_batches = []
+
+    def process(items):
+        seen_batches.append(list(items))
+        return [x * 2 for x in items]
+
+    async def run():
+        batcher = MicroBatcher(process, max_batch_size=4, max_wait_ms=50)
+        try:
+            return await asyncio.gather(*(batcher.submit(i) for i in range(6)))
+        finally:
+            await batcher.stop()
+
+    results = asyncio.run(run())
+
+    # 결과는 요청 순서대로 돌아와야 함
+    assert results == [0, 2, 4, 6, 8, 10]
+    # 최대 배치 크기를 넘지 않고, 6개 요청이 2번의 forward 로 처리됨
+    assert [len(b) for b in seen_batches] == [4, 2]
+
+
+def test_process_error_propagates_to_all_waiters():
+    def process(items):
+        raise ValueError("boom")
+
+    async def run():
+        batcher = MicroBatcher(process, max_batch_size=8, max_wait_ms=10)
+        try:
+            return await asyncio.gather(
+                *(batcher.submit(i) for i in range(3)), return_exceptions=True
+            )
+        finally:
+            await batcher.stop()
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_queue_depth_counts_requests_waiting_for_a_batch():
+    release = threading.Event()
+
+    def process(items):
+        release.wait(5)
+        return items
+
+    async def scenario():
+        batcher = MicroBatcher(process, max_batch_size=1, max_wait_ms=0)
+        assert batcher.queue_depth == 0
+        tasks = [asyncio.ensure_future(batcher.submit(i)) for i in range(3)]
+        for _ in range(100):  # 첫 요청이 처리 중(블록)이 되고 나머지 2개가 큐에 남을 때까지
+            await asyncio.sleep(0.01)
+            if batcher.queue_depth == 2:
+                break
+        depth = batcher.queue_depth
+        release.set()
+        results = await asyncio.gather(*tasks)
+        await batcher.stop()
+        return depth, results
+
+    depth, results = asyncio.run(scenario())
+    assert depth == 2
+    assert results == [0, 1, 2]
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError):
+        MicroBatcher(lambda items: items, max_batch_size=0)
+
+
+def test_plan_token_batches_buckets_by_length_within_budget():
+    lengths = [5, 100, 6, 90, 4, 300]
+    batches = plan_token_batches(lengths, max_tokens=200, max_batch_size=8)
+
+    # 모든 입력이 한 번씩, 긴 입력부터 비슷한 길이끼리 묶임
+    assert sorted(i for b in batches for i in b) == list(range(len(lengths)))
+    assert batches == [[5], [1, 3], [2, 0, 4]]
+    # 단독 배치가 아닌 경우 패딩 포함 토큰 수가 예산 이내
+    assert all(len(b) * max(lengths[i] for i in b) <= 200 for b in batches if len(b) > 1)
+    assert plan_token_batches(lengths, max_tokens=10_000, max_batch_size=2) == [[5, 1], [3, 2], [0, 4]]
+
+
+def test_model_predict_schedules_batches_and_keeps_order(use_tiny_models, monkeypatch):
+    from backend.app.config import settings
+    from backend.app.services.model import load_model, model_predict
+    from backend.app.utils import metrics
+
+    monkeypatch.setattr(settings, "PREDICT_MAX_TOKENS_PER_BATCH", 64)
+    monkeypatch.setattr(settings, "PREDICT_MAX_SEQ_LENGTH", 48)
+    texts = ["삼성전자가 급등했다.", "코스피 " * 80, "애플 하락", "단계별 사고 과정: 실적 개선 " * 10]
+    single = [model_predict(load_model(), [t])[0] for t in texts]
+
+    batch_sizes = []
+    monkeypatch.setattr(metrics.BATCH_SIZE.labels("classify"), "observe", batch_sizes.append)
+    batched = model_predict(load_model(), texts, assets=["a", "b", "c", "d"])
+
+    # 길이별로 나눠 처리해도 결과는 입력 순서대로, 단건 예측과 같음
+    assert [r["asset"] for r in batched] == ["a", "b", "c", "d"]
+    assert [r["direction"] for r in batched] == [r["direction"] for r in single]
+    assert [r["confidence"] for r in batched] == pytest.approx([r["confidence"] for r in single], abs=1e-5)
+    assert len(batch_sizes) > 1
@@ -0,0 +1,69 @@
+# tests/backend/test_cache.py
+from backend.app.services import pipeline
+from backend.app.services.cache import PredictionCache
+
+
+def test_key_uses_exact_text_and_includes_params():
+    key = PredictionCache.make_key("삼성전자 급등", "m", "cot", {"do_sample": False})
+    assert key == PredictionCache.make_key("삼성전자 급등", "m", "cot", {"do_sample": False})
+    # 공백·줄바꿈만 달라도 오프셋과 제목/본문 분할이 달라지므로 다른 키
+    assert key != PredictionCache.make_key("삼성전자  급등", "m", "cot", {"do_sample": False})
+    assert key != PredictionCache.make_key("삼성전자\n급등", "m", "cot", {"do_sample": False})
+    assert key != PredictionCache.make_key("삼성전자 급등", "m", "cot", {"do_sample": True})
+    assert key != PredictionCache.make_key("삼성전자 급등", "other", "cot", {"do_sample": False})
+
+
+def test_lru_eviction_ttl_and_counters(monkeypatch):
+    cache = PredictionCache(max_entries=2, ttl_seconds=10)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}       # a 가 최근 사용됨
+    cache.set("c", {"v": 3})                # 가장 오래된 b 제거
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    # 반환값을 수정해도 캐시 내용은 바뀌지 않음
+    cache.get("a")["v"] = 100
+    assert cache.get("a") == {"v": 1}
+
+    now = __import__("time").time()
+    monkeypatch.setattr("backend.app.services.cache.time.time", lambda: now + 60)
+    assert cache.get("a") is None
+
+
+def test_sqlite_tier_survives_new_instance(tmp_path):
+    path = str(tmp_path / "cache.db")
+    PredictionCache(sqlite_path=path).set("k", {"predictions": []})
+
+    fresh = PredictionCache(sqlite_path=path)
+    assert fresh.get("k") == {"predictions": []}
+    assert fresh.stats()["persistent_hits"] == 1
+
+
+def test_sampled_cot_results_are_not_cached(monkeypatch):
+    # 기본값(샘플링)의 CoT 결과는 매번 달라지므로 캐시하지 않고, 분류 모델 결과만 캐시
+    monkeypatch.setattr(pipeline.settings, "COT_DETERMINISTIC", False)
+    assert pipeline.cache_key("a", pipeline.predict_options("cot")) is None
+    assert pipeline.cache_key("a", pipeline.predict_options("classifier")) is not None
+
+
+def test_predict_texts_hits_cache_on_repeat(monkeypatch):
+    calls = []
+    monkeypatch.setattr(pipeline.settings, "COT_DETERMINISTIC", True)
+    monkeypatch.setattr(pipeline, "prediction_cache", PredictionCache())
+    monkeypatch.setattr(pipeline, "extract_entities_many", lambda texts: [[{"entity": t, "label": "OG"}] for t in texts])
+
+    def fake_cot(items, max_new_tokens):
+        calls.append([text for _, text in items])
+        return [[{"asset": e[0]["entity"], "direction": "up", "confidence": None, "reasoning": ""}] for e, _ in items]
+
+    monkeypatch.setattr(pipeline, "cot_predict_many", fake_cot)
+
+    first = pipeline.predict_texts(["a", "b", "a"])
+    assert calls == [["a", "b"]]            # 배치 내 중복은 한 번만 계산
+    first[0]["predictions"][0]["asset"] = "changed"
+    assert first[2]["predictions"][0]["asset"] == "a"
+
+    second = pipeline.predict_texts(["b", "a"])
+    assert calls == [["a", "b"]]            # 두 번째 호출은 모두 캐시 적중
+    assert [r["predictions"][0]["asset"] for r in second] == ["b", "a"]
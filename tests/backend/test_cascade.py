@@ -0,0 +1,128 @@
+# tests/backend/test_cascade.py
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from backend.app.services import pipeline
+from backend.app.services.cache import PredictionCache
+from backend.app.services.pipeline import PredictOptions, predict_options
+
+
+@pytest.fixture
+def cot_calls(use_tiny_models, monkeypatch):
+    calls = []
+    monkeypatch.setattr(pipeline, "prediction_cache", PredictionCache())
+    monkeypatch.setattr(pipeline, "extract_entities_many", lambda texts: [
+        [{"entity": t.split()[0], "label": "OG"}] if t.strip() else [] for t in texts
+    ])
+
+    def fake_cot(items, max_new_tokens):
+        calls.append([text for _, text in items])
+        return [
+            [{"asset": e["entity"], "direction": "neutral", "confidence": None, "reasoning": "cot"} for e in ents]
+            for ents, _ in items
+        ]
+
+    monkeypatch.setattr(pipeline, "cot_predict_many", fake_cot)
+    return calls
+
+
+def _decisions(outcome):
+    return REGISTRY.get_sample_value("news_trend_cascade_decisions_total", {"outcome": outcome}) or 0.0
+
+
+TEXTS = ["삼성전자 급등", "애플 하락", " "]
+
+
+def test_predict_options_normalization():
+    assert predict_options("classifier", threshold=0.3, explain=True) == PredictOptions("cot")
+    assert predict_options("cot", threshold=0.3) == PredictOptions("cot")
+    assert predict_options("cascade", threshold=0.5).threshold == 0.5
+    with pytest.raises(ValueError):
+        predict_options("cascade", threshold=1.5)
+    with pytest.raises(ValueError):
+        predict_options("beam")
+
+
+def test_classifier_mode_never_generates(cot_calls):
+    results = pipeline.predict_texts(TEXTS, predict_options("classifier"))
+    assert cot_calls == []
+    first = results[0]["predictions"][0]
+    assert first["asset"] == "삼성전자" and first["direction"] in ("up", "down")
+    assert 0.5 <= first["confidence"] <= 1 and first["reasoning"] == ""
+    # 개체명이 없는 기사는 분류 모델도 건너뜀
+    assert results[2]["predictions"] == []
+
+
+def test_cascade_escalates_only_uncertain_articles(cot_calls):
+    before = {o: _decisions(o) for o in ("accepted", "escalated", "explain")}
+
+    # 확신도는 항상 0.5 이상 → 임계값 0.5 면 전부 분류 모델 결과 사용
+    accepted = pipeline.predict_texts(TEXTS, predict_options("cascade", threshold=0.5))
+    assert cot_calls == []
+    assert all(p["reasoning"] == "" for r in accepted for p in r["predictions"])
+
+    escalated = pipeline.predict_texts(TEXTS, predict_options("cascade", threshold=1.0))
+    assert cot_calls == [TEXTS[:2]]
+    assert [r["predictions"][0]["reasoning"] for r in escalated[:2]] == ["cot", "cot"]
+
+    pipeline.predict_texts(TEXTS[:1], predict_options("cascade", threshold=0.5, explain=True))
+    assert cot_calls[-1] == TEXTS[:1]
+
+    assert _decisions("accepted") - before["accepted"] == 2
+    assert _decisions("escalated") - before["escalated"] == 2
+    assert _decisions("explain") - before["explain"] == 1
+
+
+def test_concurrent_async_requests_share_classifier_batches(cot_calls, monkeypatch):
+    from backend.app.services import model
+
+    batches = []
+    real_predict = model.model_predict
+    monkeypatch.setattr(
+        model, "model_predict", lambda pair, texts, assets=None: batches.append(list(texts)) or real_predict(pair, texts, assets)
+    )
+    monkeypatch.setattr(model, "_batcher", model.make_predict_batcher(max_wait_ms=50))
+
+    async def run():
+        try:
+            return await asyncio.gather(*(
+                pipeline.apredict_texts([text], predict_options(mode))
+                for text, mode in (("삼성전자 급등", "classifier"), ("애플 하락", "cascade"))
+            ))
+        finally:
+            await model.close_predict_batcher()
+
+    single, cascade = asyncio.run(run())
+    # 서로 다른 요청의 기사가 한 번의 분류 모델 배치로 처리됨
+    assert [sorted(b) for b in batches] == [["삼성전자 급등", "애플 하락"]]
+    assert single[0]["predictions"][0]["asset"] == "삼성전자"
+    assert cascade[0]["predictions"][0]["asset"] == "애플"
+
+
+def test_request_mode_is_validated_and_forwarded(monkeypatch):
+    from backend.app.routers import predict_rout
+
+    seen = []
+
+    async def fake_apredict_texts(texts, options=None):
+        seen.append(options)
+        return [{"entities": [], "predictions": []} for _ in texts]
+
+    monkeypatch.setattr(predict_rout, "apredict_texts", fake_apredict_texts)
+    app = FastAPI()
+    app.include_router(predict_rout.router)
+    client = TestClient(app)
+
+    assert client.post("/predict/", json={"text": "x", "mode": "beam"}).status_code == 422
+    assert client.post("/predict/", json={"text": "x", "mode": "cascade", "confidence_threshold": 2}).status_code == 422
+    response = client.post("/predict/batch", json=[
+        {"text": "a", "mode": "cascade", "confidence_threshold": 0.6},
+        {"text": "b", "mode": "classifier"},
+        {"text": "c", "mode": "cascade", "confidence_threshold": 0.6},
+    ])
+    assert response.status_code == 200
+    assert sorted(seen, key=str) == [PredictOptions("cascade", 0.6, False), PredictOptions("classifier")]
@@ -0,0 +1,82 @@
+# tests/backend/test_context.py
+from backend.app.services.context import ArticleContext, split_sentences
+from backend.app.utils.metrics import COT_CONTEXT_TOKENS_SAVED
+
+FILLER = "금리 동결 소식에 시장은 보합세를 보였다."
+
+
+def _article(mention_at: int, n: int = 12) -> str:
+    sentences = [FILLER] * n
+    sentences[mention_at] = "삼성전자가 실적 개선으로 급등했다."
+    return "반도체 업황 점검\n" + " ".join(sentences)
+
+
+def test_split_sentences_keeps_decimal_numbers():
+    text = "제목\n금리가 3.5% 로 올랐다. 시장은 하락했다!\n다음 문단"
+    spans = split_sentences(text, start=3)
+    assert [text[s:e] for s, e in spans] == ["금리가 3.5% 로 올랐다.", "시장은 하락했다!", "다음 문단"]
+
+
+def test_short_article_is_used_as_is(tiny_tokenizer):
+    text = "제목\n삼성전자가 급등했다."
+    assert ArticleContext(text, tiny_tokenizer).select({"entity": "삼성전자"}, 512) == text
+
+
+def test_long_article_keeps_title_and_mention_neighbourhood(tiny_tokenizer):
+    text = _article(mention_at=6)
+    context = ArticleContext(text, tiny_tokenizer)
+    start = text.index("삼성전자")
+    budget = context.total_tokens // 3
+    saved = COT_CONTEXT_TOKENS_SAVED._value.get()
+
+    selected = context.select({"entity": "삼성전자", "start": start, "end": start + 4}, budget)
+
+    title, body = selected.split("\n", 1)
+    assert title == "반도체 업황 점검"
+    assert "삼성전자가 실적 개선으로 급등했다." in body
+    assert body.count(FILLER) >= 1
+    assert len(tiny_tokenizer(selected, add_special_tokens=False)["input_ids"]) < context.total_tokens
+    assert COT_CONTEXT_TOKENS_SAVED._value.get() > saved
+
+
+def test_entity_without_offsets_and_oversized_sentence(tiny_tokenizer):
+    # 위치 정보가 없는 개체(DB 에서 읽은 개체)도 이름으로 찾고, 예산을 넘는 문장은 언급 주변만 남김
+    text = "제목\n" + " ".join([FILLER.rstrip(".")] * 20) + " 코스피 지수가 하락했다."
+    context = ArticleContext(text, tiny_tokenizer)
+    selected = context.select({"entity": "코스피"}, 24)
+    assert selected.startswith("제목\n")
+    assert "코스피" in selected
+    assert len(selected) < len(text)
+
+
+def test_cot_predict_many_uses_selected_context(use_tiny_models, monkeypatch):
+    from backend.app.config import settings
+    from backend.app.services import cot
+
+    captured = []
+    monkeypatch.setattr(settings, "COT_CONTEXT_TOKENS", 32)
+    monkeypatch.setattr(
+        cot, "_generate_chunk", lambda jobs, max_new_tokens: captured.extend(jobs) or [("", None, None)] * len(jobs)
+    )
+    text = _article(mention_at=10)
+    cot.cot_predict_many([([{"entity": "삼성전자"}], text)], max_new_tokens=4)
+
+    [(entity, context)] = captured
+    assert entity == "삼성전자"
+    assert "삼성전자가" in context and len(context) < len(text)
+
+
+def test_context_selection_is_off_by_default(use_tiny_models, monkeypatch):
+    from backend.app.config import Settings
+    from backend.app.services import cot, pipeline
+
+    assert Settings.__fields__["COT_CONTEXT_TOKENS"].default == 0
+    captured = []
+    monkeypatch.setattr(
+        cot, "_generate_chunk", lambda jobs, max_new_tokens: captured.extend(jobs) or [("", None, None)] * len(jobs)
+    )
+    text = _article(mention_at=10)
+    cot.cot_predict_many([([{"entity": "삼성전자"}], text)], max_new_tokens=4)
+
+    assert captured == [("삼성전자", text)]
+    assert ":ctx" not in pipeline.model_version(pipeline.predict_options("cot"))
@@ -0,0 +1,162 @@
+# tests/backend/test_cot.py
+import pytest
+
+from backend.app.services.cot import cot_predict, cot_predict_many, parse_cot_output
+from backend.app.services.registry import registry
+
+
+def test_parse_cot_output_splits_reasoning_and_direction():
+    reasoning, direction = parse_cot_output("프롬프트 실적 개선 결과: up 입니다", "프롬프트")
+    assert reasoning == "실적 개선"
+    assert direction == "up"
+    # 결과 키워드 뒤가 비어 있어도 에러 없이 빈 방향성
+    assert parse_cot_output("근거 결과:", "") == ("근거", "")
+
+
+def test_cot_predict_many_keeps_article_and_entity_order(use_tiny_models):
+    items = [
+        ([{"entity": "삼성전자"}, {"entity": "코스피"}], "삼성전자가 코스피 시장에서 급등했다."),
+        ([], "내용 없는 기사"),
+        ([{"entity": "애플"}], "애플이 오늘 주가가 하락했다."),
+    ]
+    results = cot_predict_many(items, max_new_tokens=4)
+
+    assert [[p["asset"] for p in preds] for preds in results] == [["삼성전자", "코스피"], [], ["애플"]]
+    for preds in results:
+        for p in preds:
+            assert set(p) == {"asset", "direction", "confidence", "reasoning"}
+
+    single = cot_predict([{"entity": "애플"}], "애플이 오늘 주가가 하락했다.", max_new_tokens=4)
+    assert [p["asset"] for p in single] == ["애플"]
+
+
+def test_prefix_cache_matches_plain_left_padding(use_tiny_models, monkeypatch):
+    from backend.app.config import settings
+
+    items = [
+        ([{"entity": "삼성전자"}, {"entity": "코스피 지수"}], "삼성전자가 코스피 시장에서 급등했다."),
+        ([{"entity": "애플"}], "애플이 오늘 주가가 하락했다. 결과"),
+    ]
+    monkeypatch.setattr(settings, "COT_DETERMINISTIC", True)
+    monkeypatch.setattr(settings, "COT_PREFIX_CACHE", True)
+    shared = cot_predict_many(items, max_new_tokens=6)
+    monkeypatch.setattr(settings, "COT_PREFIX_CACHE", False)
+    plain = cot_predict_many(items, max_new_tokens=6)
+    assert shared == plain
+
+
+def test_prefix_shared_generation_matches_each_prompt_alone(use_tiny_models, monkeypatch):
+    # 기사 prefix 캐시를 공유한 배치 생성이 프롬프트를 하나씩 생성한 결과와 같아야 함
+    # (길이가 다른 기사, 한 기사의 여러 자산 행, 가운데 패딩 포함)
+    from backend.app.config import settings
+    from backend.app.services.cot import (
+        _generate_left_padded, _generate_prefix_shared, generate_cot_prompt, split_cot_prompt,
+    )
+
+    monkeypatch.setattr(settings, "COT_DETERMINISTIC", True)
+    monkeypatch.setattr(settings, "COT_CONSTRAINED", False)
+    jobs = [
+        ("삼성전자", "삼성전자가 코스피 시장에서 급등했다."),
+        ("코스피 지수", "삼성전자가 코스피 시장에서 급등했다."),
+        ("애플", "애플이 오늘 주가가 하락했다. 실적 발표를 앞두고 투자자들이 관망했다."),
+    ]
+    prefixes = list(dict.fromkeys(split_cot_prompt(entity, text)[0] for entity, text in jobs))
+    shared = _generate_prefix_shared(
+        prefixes,
+        [split_cot_prompt(entity, text)[1] for entity, text in jobs],
+        [prefixes.index(split_cot_prompt(entity, text)[0]) for entity, text in jobs],
+        max_new_tokens=6,
+    )
+    alone = [_generate_left_padded([generate_cot_prompt(entity, text)], 6)[0] for entity, text in jobs]
+    assert shared == alone
+
+
+def test_answer_constraint_limits_direction_and_stops_row(tiny_tokenizer):
+    import torch
+
+    from backend.app.services.cot import DIRECTIONS, AnswerConstraint, _direction_tokens
+
+    tokens = _direction_tokens(tiny_tokenizer)
+    assert sorted(set(tokens.values())) == [0, 1, 2]
+
+    prompt = tiny_tokenizer("단계별 사고 과정:\n", add_special_tokens=False)["input_ids"]
+    answered = tiny_tokenizer(" 실적 개선 결과:", add_special_tokens=False)["input_ids"]
+    thinking = tiny_tokenizer(" 실적 개선 수요", add_special_tokens=False)["input_ids"]
+    width = max(len(answered), len(thinking))
+    rows = [prompt + [0] * (width - len(answered)) + answered, prompt + [0] * (width - len(thinking)) + thinking]
+    input_ids = torch.tensor(rows)
+
+    constraint = AnswerConstraint(tiny_tokenizer, len(prompt), 2, max_new_tokens=50)
+    scores = torch.zeros(2, len(tiny_tokenizer))
+    down_token = next(t for t, d in tokens.items() if d == 1)
+    scores[0, down_token] = 2.0
+    out = constraint.process(input_ids, scores.clone())
+
+    # 답 표시가 나온 행만 방향 토큰으로 제한
+    allowed = torch.isfinite(out[0]).nonzero().flatten().tolist()
+    assert sorted(allowed) == sorted(tokens)
+    # 아직 답하지 않은 행은 EOS 만 막힘
+    assert torch.isinf(out[1]).nonzero().flatten().tolist() == [tiny_tokenizer.eos_token_id]
+
+    step = torch.cat([input_ids, torch.tensor([[int(out[0].argmax())], [5]])], dim=1)
+    assert constraint.stop(step).tolist() == [True, False]
+    assert constraint.directions == [DIRECTIONS[1], None]
+    expected = torch.softmax(torch.tensor([0.0, 2.0, 0.0]), dim=-1)[1].item()
+    assert constraint.confidences[0] == pytest.approx(expected)
+
+
+def test_constrained_decoding_fills_direction_and_confidence(use_tiny_models, monkeypatch):
+    from backend.app.config import settings
+    from backend.app.services.cot import DIRECTIONS
+
+    items = [
+        ([{"entity": "삼성전자"}, {"entity": "코스피"}], "삼성전자가 코스피 시장에서 급등했다."),
+        ([{"entity": "애플"}], "애플이 오늘 주가가 하락했다."),
+    ]
+    monkeypatch.setattr(settings, "COT_DETERMINISTIC", True)
+    monkeypatch.setattr(settings, "COT_CONSTRAINED", True)
+    monkeypatch.setattr(settings, "COT_PREFIX_CACHE", True)
+    shared = cot_predict_many(items, max_new_tokens=12)
+    # 예산 안에 '결과:' 가 없어도 마지막에 강제되므로 모든 개체가 방향·확신도를 가짐
+    for preds in shared:
+        for p in preds:
+            assert p["direction"] in DIRECTIONS
+            assert 1 / 3 <= p["confidence"] <= 1
+    monkeypatch.setattr(settings, "COT_PREFIX_CACHE", False)
+    plain = cot_predict_many(items, max_new_tokens=12)
+    assert [[p["direction"] for p in preds] for preds in plain] == [[p["direction"] for p in preds] for preds in shared]
+    assert [p["confidence"] for preds in plain for p in preds] == pytest.approx(
+        [p["confidence"] for preds in shared for p in preds], abs=1e-4
+    )
+
+
+@pytest.fixture
+def eos_biased_lm(tiny_tokenizer, tiny_causal_lm):
+    # 매 위치에서 EOS 를 강하게 선호하는 모델 (lm_head 를 떼어내 EOS logit 에 큰 bias)
+    import copy
+
+    import torch
+
+    model = copy.deepcopy(tiny_causal_lm)
+    head = torch.nn.Linear(model.config.hidden_size, model.config.vocab_size, bias=True)
+    with torch.no_grad():
+        head.weight.copy_(model.lm_head.weight)
+        head.bias.zero_()
+        head.bias[tiny_tokenizer.eos_token_id] = 100.0
+    model.lm_head = head
+    registry.set("cot", (tiny_tokenizer, model, torch.device("cpu")))
+    yield model
+    registry.unload("cot")
+
+
+@pytest.mark.parametrize("prefix_cache", [True, False])
+def test_constrained_decoding_does_not_stop_before_direction(use_tiny_models, eos_biased_lm, monkeypatch, prefix_cache):
+    from backend.app.config import settings
+    from backend.app.services.cot import DIRECTIONS
+
+    monkeypatch.setattr(settings, "COT_DETERMINISTIC", True)
+    monkeypatch.setattr(settings, "COT_CONSTRAINED", True)
+    monkeypatch.setattr(settings, "COT_PREFIX_CACHE", prefix_cache)
+    [preds] = cot_predict_many([([{"entity": "삼성전자"}], "삼성전자가 코스피 시장에서 급등했다.")], max_new_tokens=8)
+    assert preds[0]["direction"] in DIRECTIONS
+    assert preds[0]["confidence"] is not None
@@ -0,0 +1,178 @@
+# tests/backend/test_crud.py
+from datetime import datetime
+
+import pytest
+
+from backend.app.db.models import Entity, News, NewsEntity, Prediction
+from backend.app.routers.schemas import NewsCreate
+from backend.app.services.crud import (
+    create_news, create_news_bulk, delete_news, get_news_page, get_saved_predictions,
+    save_predictions, search_news_local,
+)
+
+
+def _news(link, title="기사", day=1):
+    return NewsCreate(title=title, link=link, pub_date=datetime(2026, 10, day))
+
+
+def test_bulk_insert_skips_existing_and_repeated_links(db_session):
+    create_news(db_session, _news("http://n.test/1"))
+
+    inserted, updated, skipped = create_news_bulk(db_session, [
+        _news("http://n.test/1"),
+        _news("http://n.test/2"),
+        _news("http://n.test/3"),
+        _news("http://n.test/2", title="중복"),
+    ])
+
+    assert sorted(n.link for n in inserted) == ["http://n.test/2", "http://n.test/3"]
+    assert all(n.id is not None and n.created_at is not None for n in inserted)
+    assert updated == []
+    assert skipped == ["http://n.test/1", "http://n.test/2"]
+    assert db_session.query(News).count() == 3
+
+
+def test_bulk_upsert_updates_existing_rows(db_session):
+    create_news(db_session, _news("http://n.test/1", title="예전 제목"))
+
+    inserted, updated, skipped = create_news_bulk(
+        db_session,
+        [_news("http://n.test/1", title="새 제목", day=2), _news("http://n.test/2", title="신규")],
+        on_conflict="update",
+    )
+
+    assert skipped == []
+    # 기존 link 는 갱신, 새 link 는 신규로 따로 보고
+    assert [n.title for n in updated] == ["새 제목"]
+    assert [n.title for n in inserted] == ["신규"]
+    row = db_session.query(News).filter(News.link == "http://n.test/1").one()
+    assert (row.title, row.pub_date) == ("새 제목", datetime(2026, 10, 2))
+
+
+def test_bulk_upsert_invalidates_predictions_of_changed_rows(db_session):
+    from backend.app.services.trends import get_trends
+
+    same = create_news(db_session, _news("http://n.test/same", title="그대로"))
+    edited = create_news(db_session, _news("http://n.test/edited", title="예전 제목"))
+    result = {
+        "entities": [{"entity": "삼성전자", "label": "OG"}],
+        "predictions": [{"asset": "삼성전자", "direction": "up", "confidence": 0.9, "reasoning": ""}],
+    }
+    save_predictions(db_session, {same.id: result, edited.id: result}, "m:v1")
+    assert [p["mentions"] for p in get_trends(db_session, "삼성전자", "m:v1", "day")] == [2]
+
+    create_news_bulk(db_session, [
+        _news("http://n.test/same", title="그대로"),
+        _news("http://n.test/edited", title="새 제목", day=3),
+    ], on_conflict="update")
+
+    # 내용이 바뀐 기사만 예측·추이에서 빠지고, 그대로인 기사의 예측은 유지
+    assert set(get_saved_predictions(db_session, [same.id, edited.id], "m:v1")) == {same.id}
+    assert db_session.query(NewsEntity).filter(NewsEntity.news_id == edited.id).count() == 0
+    assert [(p["bucket_start"].day, p["mentions"]) for p in get_trends(db_session, "삼성전자", "m:v1", "day")] == [
+        (1, 1)
+    ]
+
+
+def test_keyset_pages_cover_all_rows_in_order(db_session):
+    create_news_bulk(db_session, [
+        _news(f"http://n.test/{i}", day=1 + i % 3).copy(update={"source": "naver_rss" if i % 2 else None})
+        for i in range(7)
+    ])
+    expected = db_session.query(News).order_by(News.pub_date.desc(), News.id.desc()).all()
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = get_news_page(db_session, limit=3, cursor=cursor)
+        seen.extend(page)
+        if cursor is None:
+            break
+    assert [n.id for n in seen] == [n.id for n in expected]
+
+    rss, _ = get_news_page(db_session, source="naver_rss", date_from=datetime(2026, 10, 2))
+    assert {n.link for n in rss} == {"http://n.test/1", "http://n.test/5"}
+
+
+def test_keyset_pages_across_equal_pub_date_ties(db_session):
+    create_news_bulk(db_session, [_news(f"http://n.test/{i}") for i in range(5)])
+    create_news_bulk(db_session, [_news("http://n.test/older", day=1).copy(update={"pub_date": datetime(2026, 9, 30)})])
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        page, cursor = get_news_page(db_session, limit=2, cursor=cursor)
+        seen.extend(page)
+        pages += 1
+        if cursor is None:
+            break
+    # 같은 pub_date 끼리는 id 내림차순, 페이지 경계에서 빠지거나 겹치는 행 없음
+    ties = sorted((n.id for n in seen if n.pub_date == datetime(2026, 10, 1)), reverse=True)
+    assert [n.id for n in seen] == ties + [n.id for n in seen if n.link == "http://n.test/older"]
+    assert len(seen) == len({n.id for n in seen}) == 6 and pages == 3
+
+
+def test_invalid_cursor_raises_value_error(db_session):
+    with pytest.raises(ValueError):
+        get_news_page(db_session, cursor="not-a-cursor")
+
+
+def test_local_search_ranks_and_highlights(db_session):
+    create_news_bulk(db_session, [
+        NewsCreate(title="반도체 수출 급증", link="http://n.test/a", description="삼성전자 실적 개선",
+                   pub_date=datetime(2026, 10, 1)),
+        NewsCreate(title="유가 하락", link="http://n.test/b", description="반도체 업황과 무관한 기사",
+                   pub_date=datetime(2026, 10, 2)),
+        NewsCreate(title="금리 동결", link="http://n.test/c", description="채권 시장 보합",
+                   pub_date=datetime(2026, 10, 3)),
+    ])
+
+    hits = search_news_local(db_session, "반도체")
+    # 제목 일치가 본문 일치보다 앞
+    assert [h["news"].link for h in hits] == ["http://n.test/a", "http://n.test/b"]
+    assert "<b>반도체</b>" in hits[0]["snippet"]
+    assert hits[0]["score"] > hits[1]["score"]
+
+    # 3글자 미만 검색어는 LIKE 로 보완
+    assert [h["news"].link for h in search_news_local(db_session, "금리")] == ["http://n.test/c"]
+    assert [h["news"].link for h in search_news_local(db_session, "반도체 유가")] == ["http://n.test/b"]
+
+
+def test_local_search_index_follows_update_and_delete(db_session):
+    create_news(db_session, _news("http://n.test/1", title="코스피 반등"))
+    create_news_bulk(db_session, [_news("http://n.test/1", title="코스닥 급락")], on_conflict="update")
+    assert search_news_local(db_session, "코스피") == []
+    assert len(search_news_local(db_session, "코스닥")) == 1
+
+    delete_news(db_session, db_session.query(News).one().id)
+    assert search_news_local(db_session, "코스닥") == []
+
+
+def test_saved_predictions_round_trip_and_replace(db_session):
+    a = create_news(db_session, _news("http://n.test/a", day=2))
+    b = create_news(db_session, _news("http://n.test/b", day=3))
+    samsung = [{"entity": "삼성전자가", "label": "OG"}, {"entity": "삼성전자", "label": "OG"}]
+    result_a = {
+        "entities": samsung + [{"entity": "삼성전자", "label": "OG"}],
+        "predictions": [{"asset": "삼성전자", "direction": "up", "confidence": 0.8, "reasoning": "실적"}],
+    }
+    result_b = {"entities": samsung, "predictions": []}
+
+    assert save_predictions(db_session, {a.id: result_a, b.id: result_b, 999: result_a}, "m:v1", 12.5) == 2
+    saved = get_saved_predictions(db_session, [a.id, b.id, 999], "m:v1")
+    # 개체명 순서·중복까지 그대로, 예측이 없던 기사도 "계산됨"으로 조회
+    assert saved == {a.id: result_a, b.id: result_b}
+    assert get_saved_predictions(db_session, [a.id], "m:v2") == {}
+    assert db_session.query(Entity).count() == 2
+
+    row = db_session.query(Prediction).filter(Prediction.asset == "삼성전자").one()
+    assert (row.pub_date, row.latency_ms) == (datetime(2026, 10, 2), 12.5)
+
+    # 같은 모델 버전으로 다시 저장하면 교체
+    result_a2 = {"entities": samsung[:1], "predictions": [
+        {"asset": "삼성전자", "direction": "down", "confidence": 0.6, "reasoning": ""}
+    ]}
+    save_predictions(db_session, {a.id: result_a2}, "m:v1")
+    assert get_saved_predictions(db_session, [a.id], "m:v1") == {a.id: result_a2}
+
+    assert delete_news(db_session, a.id)
+    assert db_session.query(Prediction).filter(Prediction.news_id == a.id).count() == 0
+    assert db_session.query(NewsEntity).filter(NewsEntity.news_id == a.id).count() == 0
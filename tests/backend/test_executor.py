@@ -0,0 +1,87 @@
+# tests/backend/test_executor.py
+import asyncio
+import threading
+
+import pytest
+
+from backend.app.services.executor import InferenceExecutor
+from backend.app.utils.exceptions import ExecutorClosedError, ExecutorSaturatedError
+
+
+def test_run_does_not_block_event_loop():
+    release = threading.Event()
+
+    async def run():
+        executor = InferenceExecutor("test", max_workers=1, max_queue=0)
+        try:
+            job = asyncio.create_task(executor.run(lambda: release.wait(5) and "done"))
+            await asyncio.sleep(0.01)
+            # 워커가 블로킹 작업 중이어도 이벤트 루프는 다른 코루틴을 계속 처리
+            ticks = 0
+            for _ in range(3):
+                await asyncio.sleep(0)
+                ticks += 1
+            release.set()
+            return ticks, await job
+        finally:
+            executor.shutdown()
+
+    assert asyncio.run(run()) == (3, "done")
+
+
+def test_saturated_executor_rejects_immediately():
+    release = threading.Event()
+
+    async def run():
+        executor = InferenceExecutor("test", max_workers=1, max_queue=1, retry_after=3)
+        try:
+            jobs = [asyncio.create_task(executor.run(release.wait, 5)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            with pytest.raises(ExecutorSaturatedError) as info:
+                await executor.run(release.wait, 5)
+            release.set()
+            await asyncio.gather(*jobs)
+            return info.value.retry_after, executor.stats()
+        finally:
+            executor.shutdown()
+
+    retry_after, stats = asyncio.run(run())
+    assert retry_after == 3
+    assert (stats["in_flight"], stats["completed"], stats["rejected"]) == (0, 2, 1)
+
+
+def test_errors_propagate_and_closed_executor_refuses_work():
+    async def run():
+        executor = InferenceExecutor("test")
+        with pytest.raises(ZeroDivisionError):
+            await executor.run(lambda: 1 / 0)
+        assert executor.in_flight == 0
+        executor.shutdown()
+        with pytest.raises(ExecutorClosedError):
+            await executor.run(lambda: None)
+
+    asyncio.run(run())
+
+
+def test_requests_after_shutdown_get_closed_error_until_reset():
+    from backend.app.services import executor as executor_module
+
+    async def run():
+        return await executor_module.get_inference_executor().run(lambda: "ok")
+
+    assert asyncio.run(run()) == "ok"
+    inference = executor_module.get_inference_executor()
+    completed = inference.completed
+    executor_module.shutdown_executors()
+    try:
+        # 닫힌 executor 는 그대로 남아 늦게 들어온 요청도 503 대상, 아직 없던 executor 도 새로 만들지 않음
+        assert executor_module.get_inference_executor() is inference
+        assert executor_module.executor_stats()["inference"]["completed"] == completed
+        with pytest.raises(ExecutorClosedError):
+            asyncio.run(run())
+        with pytest.raises(ExecutorClosedError):
+            asyncio.run(executor_module.get_ner_executor().run(lambda: "ok"))
+    finally:
+        executor_module.reset_executors()
+    assert executor_module.get_inference_executor() is not inference
+    assert asyncio.run(run()) == "ok"
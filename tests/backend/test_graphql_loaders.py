@@ -0,0 +1,133 @@
+# tests/backend/test_graphql_loaders.py
+import asyncio
+from datetime import datetime
+
+import pytest
+from ariadne import graphql
+
+from backend.app.graphql import loaders as loaders_mod
+from backend.app.graphql.context import SessionCleanupExtension
+from backend.app.graphql.loaders import DataLoader, Loaders
+from backend.app.graphql.schema import graphql_schema
+from backend.app.routers.schemas import NewsCreate
+from backend.app.services.cache import prediction_cache
+from backend.app.services.crud import create_news_bulk
+
+
+def test_dataloader_batches_same_tick_and_caches_keys():
+    batches = []
+
+    async def batch_fn(keys):
+        batches.append(list(keys))
+        return [KeyError(k) if k < 0 else k * 10 for k in keys]
+
+    async def run():
+        loader = DataLoader(batch_fn)
+        values = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+        with pytest.raises(KeyError):
+            await loader.load(-1)
+        return values, await loader.load(2)
+
+    values, again = asyncio.run(run())
+    assert values == [10, 20, 10]
+    assert again == 20
+    assert batches == [[1, 2], [-1]]
+
+
+@pytest.fixture
+def count_ner_calls(monkeypatch):
+    calls = []
+
+    def fake_extract_entities_many(texts):
+        calls.append(list(texts))
+        return [[{"entity": t.split()[0], "label": "OG"}] for t in texts]
+
+    monkeypatch.setattr(loaders_mod, "extract_entities_many", fake_extract_entities_many)
+    prediction_cache.clear()
+    yield calls
+    prediction_cache.clear()
+
+
+def test_aliased_predictions_share_one_db_query_and_one_ner_call(db_session, count_ner_calls):
+    rows, _, _ = create_news_bulk(db_session, [
+        NewsCreate(title=f"기사{i} 상승", link=f"http://n.test/{i}", description="본문",
+                   pub_date=datetime(2026, 10, 1))
+        for i in range(3)
+    ])
+    aliases = " ".join(
+        f'p{n.id}: predict(newsId: {n.id}) {{ entities {{ entity }} predictions {{ direction }} }}'
+        for n in rows
+    )
+    query = "{ " + aliases + ' t: predict(text: "환율 하락") { entities { entity } } }'
+
+    context = {"db": db_session, "loaders": Loaders(db_session)}
+    ok, result = asyncio.run(graphql(graphql_schema, {"query": query}, context_value=context))
+
+    data = result["data"]
+    assert [data[f"p{n.id}"]["entities"][0]["entity"] for n in rows] == ["기사0", "기사1", "기사2"]
+    assert data[f"p{rows[0].id}"]["predictions"][0]["direction"] == "up"
+    assert data["t"]["entities"] == [{"entity": "환율"}]
+    # 별칭 4개 → 뉴스 조회 1배치, NER 1회
+    assert context["loaders"].news.batches == 1
+    assert len(count_ner_calls) == 1 and len(count_ner_calls[0]) == 4
+
+
+def test_news_predictions_are_stored_and_reused(db_session, count_ner_calls):
+    rows, _, _ = create_news_bulk(db_session, [
+        NewsCreate(title="환율 상승", link="http://n.test/s", description="본문", pub_date=datetime(2026, 10, 1))
+    ])
+    query = f"{{ predict(newsId: {rows[0].id}) {{ entities {{ entity }} predictions {{ direction }} }} }}"
+    results = []
+    for _ in range(2):
+        prediction_cache.clear()
+        context = {"db": db_session, "loaders": Loaders(db_session)}
+        results.append(asyncio.run(graphql(graphql_schema, {"query": query}, context_value=context))[1])
+    assert results[0] == results[1]
+    assert results[0]["data"]["predict"]["predictions"][0]["direction"] == "up"
+    # 두 번째 요청은 캐시가 비어 있어도 DB 에 저장된 결과 사용
+    assert len(count_ner_calls) == 1
+
+
+def test_prediction_store_errors_do_not_fail_the_batch(db_session, count_ner_calls, monkeypatch):
+    from sqlalchemy.exc import OperationalError
+
+    from backend.app.services import crud
+
+    def broken(*args, **kwargs):
+        raise OperationalError("SELECT", {}, Exception("database is locked"))
+
+    monkeypatch.setattr(crud, "get_saved_predictions", broken)
+    monkeypatch.setattr(crud, "save_predictions", broken)
+    rows, _, _ = create_news_bulk(db_session, [
+        NewsCreate(title=f"기사{i} 상승", link=f"http://n.test/e{i}", description="본문",
+                   pub_date=datetime(2026, 10, 1))
+        for i in range(2)
+    ])
+    query = "{ " + " ".join(f"p{n.id}: predict(newsId: {n.id}) {{ predictions {{ direction }} }}" for n in rows) + " }"
+    context = {"db": db_session, "loaders": Loaders(db_session)}
+    ok, result = asyncio.run(graphql(graphql_schema, {"query": query}, context_value=context))
+
+    # 저장된 결과를 읽거나 저장하지 못해도 모든 predict 필드는 새로 계산한 결과를 반환
+    assert "errors" not in result
+    assert [result["data"][f"p{n.id}"]["predictions"][0]["direction"] for n in rows] == ["up", "up"]
+
+
+def test_missing_news_is_reported_as_error(db_session, count_ner_calls):
+    context = {"db": db_session, "loaders": Loaders(db_session)}
+    query = "{ predict(newsId: 999) { entities { entity } } }"
+    ok, result = asyncio.run(graphql(graphql_schema, {"query": query}, context_value=context))
+    assert result["data"] is None
+    assert "News not found" in result["errors"][0]["message"]
+    assert count_ner_calls == []
+
+
+def test_session_cleanup_extension_closes_session():
+    class FakeSession:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    db = FakeSession()
+    SessionCleanupExtension().request_finished({"db": db})
+    assert db.closed
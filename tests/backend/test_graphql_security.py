@@ -0,0 +1,101 @@
+# tests/backend/test_graphql_security.py
+import asyncio
+
+import pytest
+from ariadne import graphql
+from ariadne.asgi import GraphQL
+from starlette.testclient import TestClient
+
+from backend.app.graphql import security
+from backend.app.graphql.schema import graphql_schema
+from backend.app.graphql.security import (
+    PersistedQueryHTTPHandler,
+    persisted_queries,
+    query_hash,
+    query_validator,
+    validation_rules,
+)
+
+
+def _errors(query, variables=None):
+    data = {"query": query, "variables": variables}
+    ok, result = asyncio.run(graphql(
+        graphql_schema, data, validation_rules=validation_rules, query_validator=query_validator
+    ))
+    return [] if ok else [e["message"] for e in result["errors"]]
+
+
+def test_cost_weights_predict_over_listing(monkeypatch):
+    monkeypatch.setattr(security.settings, "GRAPHQL_MAX_ALIASES", 100)
+    cheap = "{ getNews(limit: 10) { id } }"
+    many_predicts = "{ " + " ".join(
+        f'p{i}: predict(text: "t{i}") {{ entities {{ entity }} }}' for i in range(31)
+    ) + " }"
+
+    assert _errors(cheap) == []
+    assert any("cost" in message for message in _errors(many_predicts))
+    # 변수로 전달한 limit 도 비용에 반영
+    assert _errors("query($n: Int) { getNews(limit: $n) { id } }", {"n": 100}) == []
+    monkeypatch.setattr(security.settings, "GRAPHQL_MAX_COST", 50)
+    assert _errors("query($n: Int) { getNews(limit: $n) { id } }", {"n": 100})
+    # searchNews 는 display 건수에 비례
+    assert _errors('{ searchNews(query: "x", display: 10) { title } }') == []
+    assert any("cost" in m for m in _errors('{ searchNews(query: "x", display: 100) { title } }'))
+
+
+def test_depth_and_alias_limits(monkeypatch):
+    monkeypatch.setattr(security.settings, "GRAPHQL_MAX_DEPTH", 2)
+    monkeypatch.setattr(security.settings, "GRAPHQL_MAX_ALIASES", 2)
+
+    assert _errors('{ predict(text: "x") { entities { entity } } }') == [
+        "Query depth 3 exceeds maximum allowed depth 2."
+    ]
+    via_fragment = 'query { predict(text: "x") { ...E } } fragment E on PredictResponse { entities { entity } }'
+    assert _errors(via_fragment) == ["Query depth 3 exceeds maximum allowed depth 2."]
+    assert _errors("{ a: __typename b: __typename c: __typename }") == [
+        "Query uses 3 aliases, maximum allowed is 2."
+    ]
+
+
+@pytest.fixture
+def client():
+    persisted_queries.clear()
+    app = GraphQL(
+        graphql_schema,
+        validation_rules=validation_rules,
+        query_validator=query_validator,
+        http_handler=PersistedQueryHTTPHandler(),
+    )
+    yield TestClient(app)
+    persisted_queries.clear()
+
+
+def test_persisted_queries_run_by_hash(client, monkeypatch):
+    query = "query Ping { __typename }"
+    digest = persisted_queries.register(graphql_schema, query)
+    assert digest == query_hash(query)
+
+    apq = {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": digest}}}
+    assert client.post("/", json=apq).json() == {"data": {"__typename": "Query"}}
+    assert client.post("/", json={"id": "0" * 64}).json()["errors"][0]["message"] == "PersistedQueryNotFound"
+
+    monkeypatch.setattr(security.settings, "GRAPHQL_PERSISTED_ONLY", True)
+    assert client.post("/", json={"query": query}).json()["errors"][0]["message"] == "PersistedQueryRequired"
+    assert client.post("/", json={"id": digest}).json() == {"data": {"__typename": "Query"}}
+
+
+def test_persisted_queries_still_check_cost_with_request_variables(client, monkeypatch):
+    monkeypatch.setattr(security.settings, "GRAPHQL_MAX_COST", 50)
+    digest = persisted_queries.register(graphql_schema, "query Latest($n: Int) { getNews(limit: $n) { id } }")
+
+    too_expensive = client.post("/", json={"id": digest, "variables": {"n": 1000}}).json()
+    assert "cost" in too_expensive["errors"][0]["message"]
+    cheap = client.post("/", json={"id": digest, "variables": {"n": 0}}).json()
+    assert all("cost" not in e["message"] for e in cheap.get("errors", []))
+
+
+def test_invalid_persisted_query_is_rejected_at_registration(client):
+    with pytest.raises(ValueError):
+        persisted_queries.register(graphql_schema, "{ noSuchField }")
+    with pytest.raises(ValueError):
+        persisted_queries.register(graphql_schema, "{ __typename }", expected_hash="deadbeef")
@@ -0,0 +1,162 @@
+# tests/backend/test_ingest.py
+import asyncio
+from datetime import datetime
+
+import httpx
+
+from backend.app.db.models import IngestState, News
+from backend.app.services.ingest import IncrementalIngester, parse_pub_date
+from backend.app.services.naver_client import NaverClient
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>news</title>
+<item><title>첫 기사</title><link>http://n.test/1</link><pubDate>Mon, 05 Oct 2026 10:00:00 +0900</pubDate></item>
+<item><title>둘째 기사</title><link>http://n.test/2</link><pubDate>Mon, 05 Oct 2026 11:00:00 +0900</pubDate></item>
+</channel></rss>"""
+
+
+def _client(handler):
+    return NaverClient(
+        "id", "secret",
+        base_url="http://naver.test/news.json",
+        rss_url="http://naver.test/rss",
+        rate_per_sec=0,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_parse_pub_date_converts_to_naive_utc():
+    assert parse_pub_date("Mon, 05 Oct 2026 10:00:00 +0900") == datetime(2026, 10, 5, 1, 0)
+    assert parse_pub_date("2026-10-05T01:00:00") == datetime(2026, 10, 5, 1, 0)
+
+
+def test_rss_uses_conditional_get_and_skips_seen_links(db_session):
+    db_session.add(News(title="기존", link="http://n.test/1", pub_date=datetime(2026, 1, 1)))
+    db_session.commit()
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=RSS, headers={"ETag": '"v1"'})
+
+    async def run():
+        client = _client(handler)
+        try:
+            ingester = IncrementalIngester(db_session, client)
+            return await ingester.ingest_rss(), await ingester.ingest_rss()
+        finally:
+            await client.aclose()
+
+    first, second = asyncio.run(run())
+    assert (first, second) == (1, 0)
+    assert db_session.query(News).count() == 2
+    assert "If-None-Match" not in requests[0].headers
+    state = db_session.query(IngestState).one()
+    assert state.etag == '"v1"'
+    assert state.high_water == datetime(2026, 10, 5, 2, 0)
+
+
+def test_search_stops_paging_at_high_water_mark(db_session):
+    pages = {
+        1: [{"title": "<b>새</b> 기사", "link": "http://n.test/new", "pubDate": "Tue, 06 Oct 2026 09:00:00 +0900"},
+            {"title": "지난 기사", "link": "http://n.test/old", "pubDate": "Mon, 05 Oct 2026 09:00:00 +0900"}],
+        3: [{"title": "더 오래된 기사", "link": "http://n.test/older", "pubDate": "Sun, 04 Oct 2026 09:00:00 +0900"}],
+    }
+    starts = []
+
+    def handler(request):
+        start = int(request.url.params["start"])
+        starts.append(start)
+        return httpx.Response(200, json={"items": pages.get(start, [])})
+
+    db_session.add(IngestState(source="search:삼성", high_water=datetime(2026, 10, 5, 0, 0)))
+    db_session.commit()
+
+    async def run():
+        client = _client(handler)
+        try:
+            return await IncrementalIngester(db_session, client).ingest_search("삼성", display=2)
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == 2
+    assert starts == [1]
+    assert {n.title for n in db_session.query(News)} == {"새 기사", "지난 기사"}
+
+
+def test_rss_skips_items_older_than_high_water_mark(db_session):
+    db_session.add(IngestState(source="rss:http://naver.test/rss", high_water=datetime(2026, 10, 5, 1, 30)))
+    db_session.commit()
+
+    async def run():
+        client = _client(lambda request: httpx.Response(200, text=RSS))
+        try:
+            return await IncrementalIngester(db_session, client).ingest_rss()
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == 1
+    assert [n.link for n in db_session.query(News)] == ["http://n.test/2"]
+
+
+def test_failed_store_does_not_hide_links_from_next_run(db_session, monkeypatch):
+    from backend.app.services import ingest
+
+    def fail(db, rows):
+        raise RuntimeError("db down")
+
+    async def run():
+        client = _client(lambda request: httpx.Response(200, text=RSS))
+        try:
+            ingester = IncrementalIngester(db_session, client)
+            monkeypatch.setattr(ingest, "create_news_bulk", fail)
+            try:
+                await ingester.ingest_rss()
+            except RuntimeError:
+                pass
+            monkeypatch.undo()
+            return await ingester.ingest_rss()
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == 2
+    assert db_session.query(News).count() == 2
+
+
+def test_seen_links_skip_the_db_lookup_and_stay_bounded(db_session, monkeypatch):
+    looked_up = []
+
+    async def run():
+        client = _client(lambda request: httpx.Response(200, text=RSS))
+        try:
+            ingester = IncrementalIngester(db_session, client, seen_size=1)
+            stored_links = ingester._stored_links
+            monkeypatch.setattr(ingester, "_stored_links", lambda links: looked_up.append(links) or stored_links(links))
+            return await ingester.ingest_rss(), await ingester.ingest_rss(), list(ingester._seen)
+        finally:
+            await client.aclose()
+
+    first, second, seen = asyncio.run(run())
+    assert (first, second) == (2, 0)
+    # 두 번째 폴링의 최신 기사는 메모리 집합에서 걸러져 DB 조회 없음, 집합은 최근 1개만 유지
+    assert looked_up == [["http://n.test/1", "http://n.test/2"], []]
+    assert seen == ["http://n.test/2"]
+
+
+def test_undated_rss_items_do_not_advance_high_water_mark(db_session):
+    undated = RSS.replace("</channel>", "<item><title>날짜 없음</title><link>http://n.test/3</link></item></channel>")
+
+    async def run():
+        client = _client(lambda request: httpx.Response(200, text=undated))
+        try:
+            return await IncrementalIngester(db_session, client).ingest_rss()
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == 3
+    assert db_session.query(IngestState).one().high_water == datetime(2026, 10, 5, 2, 0)
+    # 날짜 없는 기사는 수집 시각(UTC)으로 저장
+    stored = db_session.query(News).filter(News.link == "http://n.test/3").one().pub_date
+    assert abs((stored - datetime.utcnow()).total_seconds()) < 60
@@ -0,0 +1,79 @@
+# tests/backend/test_metrics.py
+import json
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from backend.app.routers.metrics import router
+from backend.app.services.cot import cot_predict_many
+from backend.app.utils import logger as logger_mod
+from backend.app.utils.logger import span
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_span_records_histogram_and_structured_log(monkeypatch, caplog):
+    monkeypatch.setattr(logger_mod.settings, "LOG_SPANS", True)
+    before = _sample("news_trend_stage_seconds_count", stage="unit_test")
+
+    with caplog.at_level(logging.INFO, logger="news_trend.span"):
+        with span("unit_test", batch=3) as s:
+            s["extra"] = "x"
+        with pytest.raises(ValueError):
+            with span("unit_test"):
+                raise ValueError("boom")
+
+    assert _sample("news_trend_stage_seconds_count", stage="unit_test") == before + 2
+    records = [json.loads(r.getMessage()) for r in caplog.records]
+    assert records[0]["span"] == "unit_test" and records[0]["batch"] == 3 and records[0]["extra"] == "x"
+    assert records[1]["ok"] is False
+
+
+def test_generation_stages_are_recorded(use_tiny_models):
+    stages = ("tokenize", "forward", "generate", "cot_parse")
+    before = {stage: _sample("news_trend_stage_seconds_count", stage=stage) for stage in stages}
+    tokens_before = _sample("news_trend_generated_tokens_total")
+
+    cot_predict_many([([{"entity": "삼성전자"}, {"entity": "코스피"}], "삼성전자 주가 상승")], max_new_tokens=4)
+
+    for stage in stages:
+        assert _sample("news_trend_stage_seconds_count", stage=stage) > before[stage], stage
+    assert _sample("news_trend_generated_tokens_total") > tokens_before
+
+
+def test_metrics_endpoint_exposes_runtime_state():
+    app = FastAPI()
+    app.include_router(router)
+    body = TestClient(app).get("/metrics").text
+    assert "news_trend_stage_seconds_bucket" in body
+    assert "news_trend_prediction_cache_hit_rate" in body
+
+
+def test_executor_totals_are_exported_as_counters():
+    import asyncio
+
+    from backend.app.services.executor import get_inference_executor
+
+    asyncio.run(get_inference_executor().run(lambda: None))
+    app = FastAPI()
+    app.include_router(router)
+    body = TestClient(app).get("/metrics").text
+    assert "# TYPE news_trend_executor_completed_total counter" in body
+    assert "# TYPE news_trend_executor_rejected_total counter" in body
+    assert "# TYPE news_trend_executor_in_flight gauge" in body
+
+
+def test_cache_totals_and_batcher_queue_depth_are_exported():
+    app = FastAPI()
+    app.include_router(router)
+    body = TestClient(app).get("/metrics").text
+    assert "# TYPE news_trend_prediction_cache_hits_total counter" in body
+    assert "# TYPE news_trend_prediction_cache_misses_total counter" in body
+    assert "# TYPE news_trend_prediction_cache_size gauge" in body
+    assert "# TYPE news_trend_predict_batcher_queue_depth gauge" in body
+
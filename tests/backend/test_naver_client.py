@@ -0,0 +1,83 @@
+# tests/backend/test_naver_client.py
+import asyncio
+
+import httpx
+import pytest
+
+from backend.app.services.naver_client import NaverClient
+
+
+class FakeNaver:
+    """네이버 검색 API 흉내: 지정한 횟수만큼 429 를 돌려준 뒤 start 별 아이템을 응답"""
+
+    def __init__(self, fail_first: int = 0, delay: float = 0.0):
+        self.fail_first = fail_first
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(dict(request.url.params))
+        assert request.headers["X-Naver-Client-Id"] == "id"
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if len(self.calls) <= self.fail_first:
+            return httpx.Response(429, json={"errorMessage": "quota"})
+        start = int(request.url.params["start"])
+        return httpx.Response(200, json={"items": [{"title": f"news-{start}"}]})
+
+
+def _client(fake, **kwargs):
+    params = dict(backoff_base=0.001, rate_per_sec=0, transport=httpx.MockTransport(fake))
+    params.update(kwargs)
+    return NaverClient("id", "secret", base_url="http://naver.test/news.json", **params)
+
+
+def test_retries_on_quota_errors_then_succeeds():
+    fake = FakeNaver(fail_first=2)
+
+    async def run():
+        client = _client(fake, max_retries=3)
+        try:
+            return await client.search_news("삼성전자", display=10, start=1)
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == [{"title": "news-1"}]
+    assert len(fake.calls) == 3
+
+
+def test_gives_up_after_max_retries():
+    fake = FakeNaver(fail_first=10)
+
+    async def run():
+        client = _client(fake, max_retries=1)
+        try:
+            await client.search_news("삼성전자")
+        finally:
+            await client.aclose()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
+    assert len(fake.calls) == 2
+
+
+def test_pages_are_fetched_concurrently_within_limit():
+    fake = FakeNaver(delay=0.02)
+
+    async def run():
+        client = _client(fake, max_concurrency=2)
+        try:
+            return await client.search_news_pages("코스피", pages=5, display=100)
+        finally:
+            await client.aclose()
+
+    items = asyncio.run(run())
+    # 결과는 페이지 순서대로, start 는 1, 101, 201 ...
+    assert [i["title"] for i in items] == ["news-1", "news-101", "news-201", "news-301", "news-401"]
+    assert fake.max_in_flight == 2
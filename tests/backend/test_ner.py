@@ -0,0 +1,38 @@
+# tests/backend/test_ner.py
+import pytest
+import spacy
+
+from backend.app.services.ner import extract_entities, extract_entities_many
+from backend.app.services.registry import registry
+
+
+@pytest.fixture
+def rule_based_nlp():
+    # ko_core_news_sm 대신, 같은 라벨을 내는 규칙 기반 파이프라인을 주입
+    nlp = spacy.blank("xx")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "OG", "pattern": "삼성전자가"},
+        {"label": "LC", "pattern": "코스피"},
+        {"label": "DT", "pattern": "어제"},
+    ])
+    registry.set("ner", nlp)
+    yield nlp
+    registry.unload("ner")
+
+
+def test_extract_entities_filters_labels_and_strips_josa(rule_based_nlp):
+    entities = extract_entities("삼성전자가 어제 코스피 시장에서 급등했다.")
+    assert [e["entity"] for e in entities] == ["삼성전자가", "삼성전자", "코스피", "급등"]
+    assert all(e["label"] != "DT" for e in entities)
+
+
+def test_extract_entities_reports_character_offsets(rule_based_nlp):
+    text = "삼성전자가 어제 코스피 시장에서 급등했다."
+    for e in extract_entities(text):
+        assert text[e["start"]:e["end"]] == e["entity"]
+
+
+def test_extract_entities_many_matches_single_calls(rule_based_nlp):
+    texts = ["삼성전자가 어제 코스피 시장에서 급등했다.", "애플이 오늘 주가가 하락했다.", ""]
+    assert extract_entities_many(texts, batch_size=2) == [extract_entities(t) for t in texts]
@@ -0,0 +1,164 @@
+# tests/backend/test_predict_stream.py
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+from ariadne import graphql
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.db.session import get_db
+from backend.app.graphql.loaders import Loaders
+from backend.app.graphql.schema import graphql_schema
+from backend.app.routers import predict_rout
+from backend.app.routers import trends as trends_rout
+from backend.app.routers.schemas import NewsCreate
+from backend.app.services.crud import create_news
+from backend.app.utils.exceptions import ExecutorClosedError
+
+
+@pytest.fixture
+def client(db_session, monkeypatch):
+    calls = []
+
+    async def fake_apredict_texts(texts, options=None):
+        calls.append(list(texts))
+        return [
+            {"entities": [{"entity": t[:3], "label": "OG"}],
+             "predictions": [{"asset": t[:3], "direction": "up", "confidence": 0.9, "reasoning": "r"}]}
+            for t in texts
+        ]
+
+    monkeypatch.setattr(predict_rout, "apredict_texts", fake_apredict_texts)
+    monkeypatch.setattr(predict_rout.settings, "PREDICT_STREAM_CHUNK_SIZE", 2)
+
+    app = FastAPI()
+    app.include_router(predict_rout.router)
+    app.include_router(trends_rout.router)
+    app.dependency_overrides[get_db] = lambda: db_session
+    # 스트리밍 응답은 요청 종속성과 별도로 세션을 엶
+    monkeypatch.setattr(predict_rout, "SessionLocal", lambda: db_session)
+    test_client = TestClient(app)
+    test_client.calls = calls
+    return test_client
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+def test_stream_dedupes_and_resolves_news_ids(client, db_session):
+    news = create_news(db_session, NewsCreate(
+        title="테스트 기사", link="http://n.test/p", description="본문", pub_date=datetime(2026, 10, 1)
+    ))
+    payloads = [
+        {"text": "삼성전자 급등"},
+        {"news_id": news.id},
+        {"text": "삼성전자 급등"},
+        {"news_id": news.id},
+        {"news_id": 9999},
+        {"text": "애플 하락"},
+    ]
+    response = client.post("/predict/batch/stream", json=payloads)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = {line["index"]: line for line in _lines(response)}
+    assert sorted(lines) == list(range(len(payloads)))
+    assert lines[4]["error"]["status"] == 404
+    # news_id 항목은 기사 제목이 asset 으로 들어감
+    assert lines[1]["result"]["predictions"][0]["asset"] == "테스트 기사"
+    assert lines[0]["result"] == lines[2]["result"]
+    # 고유 텍스트 3개만 계산 (묶음 크기 2)
+    assert sorted(t for call in client.calls for t in call) == sorted(
+        ["삼성전자 급등", "테스트 기사\n본문", "애플 하락"]
+    )
+    assert all(len(call) <= 2 for call in client.calls)
+
+
+def test_batch_returns_404_for_missing_news(client):
+    response = client.post("/predict/batch", json=[{"text": "x"}, {"news_id": 12345}])
+    assert response.status_code == 404
+
+
+def test_news_predictions_are_stored_and_reused(client, db_session):
+    # 기본 설정(cot 모드, 샘플링 디코딩)에서도 기사별 예측은 저장되어 재사용됨
+    assert predict_rout.settings.PREDICT_MODE == "cot" and not predict_rout.settings.COT_DETERMINISTIC
+    news = create_news(db_session, NewsCreate(
+        title="저장 기사", link="http://n.test/s", description="본문", pub_date=datetime(2026, 10, 2)
+    ))
+    first = client.post("/predict/", json={"news_id": news.id})
+    assert first.status_code == 200
+    assert client.calls == [["저장 기사\n본문"]]
+
+    # 같은 기사는 단건·배치·스트리밍 모두 저장된 결과를 읽음 (모델 재실행 없음)
+    assert client.post("/predict/", json={"news_id": news.id}).json() == first.json()
+    batch = client.post("/predict/batch", json=[{"news_id": news.id}, {"text": "새 텍스트"}])
+    assert batch.json()[0] == first.json()
+    lines = _lines(client.post("/predict/batch/stream", json=[{"news_id": news.id}]))
+    assert lines[0]["result"] == first.json()
+    assert client.calls == [["저장 기사\n본문"], ["새 텍스트"]]
+
+
+def test_stream_stores_every_news_id_sharing_a_text(client, db_session):
+    first, second = (
+        create_news(db_session, NewsCreate(
+            title="같은 기사", link=f"http://n.test/dup{n}", description="본문", pub_date=datetime(2026, 10, 3)
+        )).id
+        for n in range(2)
+    )
+    lines = _lines(client.post("/predict/batch/stream", json=[{"news_id": first}, {"news_id": second}]))
+    assert sorted(line["index"] for line in lines) == [0, 1]
+    assert client.calls == [["같은 기사\n본문"]]
+
+    # 두 기사 모두 저장되어 다시 요청해도 모델을 실행하지 않음
+    client.post("/predict/batch/stream", json=[{"news_id": second}, {"news_id": first}])
+    assert client.calls == [["같은 기사\n본문"]]
+
+
+def test_stream_reports_closed_executor_as_503(client, monkeypatch):
+    async def closed(texts, options=None):
+        raise ExecutorClosedError("inference")
+
+    monkeypatch.setattr(predict_rout, "apredict_texts", closed)
+    [line] = _lines(client.post("/predict/batch/stream", json=[{"text": "종료 후 요청"}]))
+    assert line["error"]["status"] == 503
+
+
+def test_default_predictions_feed_trends(client, db_session):
+    news = create_news(db_session, NewsCreate(
+        title="삼성전자 실적", link="http://n.test/t", description="본문", pub_date=datetime(2026, 10, 4, 9, 30)
+    ))
+    assert client.post("/predict/", json={"news_id": news.id}).status_code == 200
+
+    # 기본 모델(cot) 추이에 방금 저장한 예측이 집계됨 (가짜 예측의 자산명은 텍스트 앞 세 글자)
+    buckets = client.get("/trends", params={"asset": "삼성전", "bucket": "day"}).json()
+    assert [(b["mentions"], b["up"]) for b in buckets] == [(1, 1)]
+
+    query = '{ trends(asset: "삼성전", bucket: "day") { mentions up } }'
+    context = {"db": db_session, "loaders": Loaders(db_session)}
+    ok, result = asyncio.run(graphql(graphql_schema, {"query": query}, context_value=context))
+    assert result["data"]["trends"] == [{"mentions": 1, "up": 1}]
+
+
+def test_stream_opens_and_closes_its_own_session(client, db_session, monkeypatch):
+    from sqlalchemy.orm import sessionmaker
+
+    factory = sessionmaker(bind=db_session.get_bind())
+    opened, closed = [], []
+
+    def session_local():
+        session = factory()
+        close = session.close
+        session.close = lambda: (closed.append(session), close())[-1]
+        opened.append(session)
+        return session
+
+    monkeypatch.setattr(predict_rout, "SessionLocal", session_local)
+    news = create_news(db_session, NewsCreate(
+        title="세션 기사", link="http://n.test/session", description="본문", pub_date=datetime(2026, 10, 5)
+    ))
+    lines = _lines(client.post("/predict/batch/stream", json=[{"news_id": news.id}, {"text": "직접 입력"}]))
+    assert sorted(line["index"] for line in lines) == [0, 1]
+    assert len(opened) == 1 and closed == opened
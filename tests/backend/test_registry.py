@@ -0,0 +1,76 @@
+# tests/backend/test_registry.py
+import threading
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.services.registry import ModelRegistry
+
+
+def test_model_is_loaded_exactly_once_under_concurrency():
+    registry = ModelRegistry()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    registry.register("m", loader)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get("m"))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_background_preload_runs_warmup_and_reports_ready():
+    registry = ModelRegistry()
+    release = threading.Event()
+    warmed = []
+    registry.register("slow", lambda: release.wait(5) and "model", warmup=warmed.append)
+
+    thread = registry.preload_in_background(warmup=True)
+    assert registry.ready is False
+    assert registry.status() == {"slow": "loading"}
+
+    release.set()
+    thread.join(5)
+    assert registry.ready is True
+    assert registry.status() == {"slow": "loaded"}
+    assert warmed == ["model"]
+
+
+def test_failed_load_is_reported_not_raised_in_preload():
+    registry = ModelRegistry()
+
+    def broken():
+        raise OSError("no network")
+
+    registry.register("broken", broken)
+    registry.preload()
+    assert registry.ready is False
+    assert registry.status()["broken"].startswith("error:")
+
+
+def test_readiness_endpoint(monkeypatch):
+    from backend.app.routers import health
+
+    fake = ModelRegistry()
+    fake.register("m", lambda: "model")
+    monkeypatch.setattr(health, "registry", fake)
+    app = FastAPI()
+    app.include_router(health.router)
+    client = TestClient(app)
+
+    assert client.get("/health/live").status_code == 200
+    assert client.get("/health/ready").status_code == 503
+    fake.get("m")
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["models"] == {"m": "loaded"}
@@ -0,0 +1,85 @@
+# tests/backend/test_scoring.py
+import json
+
+import pytest
+import spacy
+
+from backend.app.services import scoring
+from backend.app.services.registry import registry
+from backend.app.services.scoring import iter_shard, score_shard
+
+
+@pytest.fixture
+def scoring_models(use_tiny_models):
+    nlp = spacy.blank("xx")
+    nlp.add_pipe("entity_ruler").add_patterns([{"label": "OG", "pattern": "삼성전자"}])
+    registry.set("ner", nlp)
+    yield
+    registry.unload("ner")
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = tmp_path / "corpus.jsonl"
+    rows = [{"link": f"https://n.news/{i}", "title": f"삼성전자 기사 {i}", "description": "주가 급등"} for i in range(10)]
+    rows[3]["title"] = rows[3]["description"] = ""
+    path.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in rows) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def read_jsonl(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_iter_shard_partitions_rows(corpus):
+    shards = [[i for i, _ in iter_shard(corpus, k, 3)] for k in range(3)]
+    assert shards == [[0, 3, 6, 9], [1, 4, 7], [2, 5, 8]]
+    assert [i for i, _ in iter_shard(corpus, 0, 3, skip=2)] == [6, 9]
+
+
+def test_score_shards_cover_corpus(scoring_models, corpus, tmp_path):
+    out = tmp_path / "out"
+    assert score_shard(corpus, str(out), 0, 2, batch_size=2) + score_shard(corpus, str(out), 1, 2, batch_size=2) == 10
+
+    rows = read_jsonl(out / "shard-000-of-002.jsonl") + read_jsonl(out / "shard-001-of-002.jsonl")
+    assert sorted(r["id"] for r in rows) == sorted(f"https://n.news/{i}" for i in range(10))
+    blank = next(r for r in rows if r["id"] == "https://n.news/3")
+    assert blank["direction"] is None and blank["entities"] == []
+    scored = [r for r in rows if r["id"] != "https://n.news/3"]
+    assert all(r["direction"] in ("up", "down") and 0 <= r["confidence"] <= 1 for r in scored)
+    assert all(any(e["entity"] == "삼성전자" for e in r["entities"]) for r in scored)
+
+    # 완료된 샤드는 다시 실행해도 건너뜀
+    assert score_shard(corpus, str(out), 0, 2, batch_size=2) == 0
+
+
+def test_resume_after_interrupt_has_no_duplicates(scoring_models, corpus, tmp_path, monkeypatch):
+    out = tmp_path / "out"
+    real_score_batch = scoring.score_batch
+    calls = {"n": 0}
+
+    def flaky(texts, ids):
+        calls["n"] += 1
+        if calls["n"] == 3:
+            raise KeyboardInterrupt
+        return real_score_batch(texts, ids)
+
+    monkeypatch.setattr(scoring, "score_batch", flaky)
+    with pytest.raises(KeyboardInterrupt):
+        score_shard(corpus, str(out), batch_size=3)
+    # 확정되지 않은 꼬리 기록이 남아 있어도 재시작 시 잘려 나감
+    with open(out / "shard-000-of-001.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"id": "partial"')
+
+    monkeypatch.setattr(scoring, "score_batch", real_score_batch)
+    assert score_shard(corpus, str(out), batch_size=3) == 4
+    ids = [r["id"] for r in read_jsonl(out / "shard-000-of-001.jsonl")]
+    assert ids == [f"https://n.news/{i}" for i in range(10)]
+
+
+def test_checkpoint_rejects_different_sharding(scoring_models, corpus, tmp_path):
+    out = tmp_path / "out"
+    score_shard(corpus, str(out), 0, 1, batch_size=4)
+    (out / "shard-000-of-001.checkpoint.json").rename(out / "shard-000-of-002.checkpoint.json")
+    with pytest.raises(ValueError):
+        score_shard(corpus, str(out), 0, 2, batch_size=4)
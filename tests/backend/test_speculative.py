@@ -0,0 +1,91 @@
+# tests/backend/test_speculative.py
+import pytest
+import torch
+
+from backend.app.services.registry import registry
+from backend.app.services.speculative import speculative_generate
+
+
+@pytest.fixture
+def use_tiny_draft(use_tiny_models, tiny_draft_lm):
+    registry.set("cot_draft", tiny_draft_lm)
+    yield
+    registry.unload("cot_draft")
+
+
+def _greedy(model, tokenizer, ids, max_new_tokens):
+    with torch.no_grad():
+        return model.generate(
+            input_ids=ids,
+            attention_mask=torch.ones_like(ids),
+            max_new_tokens=max_new_tokens,
+            do_sample=False,
+            eos_token_id=tokenizer.eos_token_id,
+            pad_token_id=tokenizer.pad_token_id,
+        )
+
+
+@pytest.mark.parametrize("draft_tokens", [1, 3, 5])
+def test_speculative_matches_target_greedy(tiny_tokenizer, tiny_causal_lm, tiny_draft_lm, draft_tokens):
+    ids = torch.tensor([tiny_tokenizer("뉴스 기사: 삼성전자가 급등했다.\n", add_special_tokens=False)["input_ids"]])
+    expected = _greedy(tiny_causal_lm, tiny_tokenizer, ids, 12)
+
+    out, drafted, accepted = speculative_generate(
+        tiny_causal_lm, tiny_draft_lm, ids, max_new_tokens=12, draft_tokens=draft_tokens,
+        eos_token_id=tiny_tokenizer.eos_token_id,
+    )
+    assert out.tolist() == expected.tolist()
+    assert 0 <= accepted <= drafted
+
+
+def test_identical_draft_accepts_every_token(tiny_tokenizer, tiny_causal_lm):
+    ids = torch.tensor([tiny_tokenizer("애플이 오늘 주가가 하락했다.", add_special_tokens=False)["input_ids"]])
+    out, drafted, accepted = speculative_generate(
+        tiny_causal_lm, tiny_causal_lm, ids, max_new_tokens=10, draft_tokens=4,
+    )
+    assert out.shape[1] == ids.shape[1] + 10
+    # 제안이 모두 맞으면 검증마다 덤 토큰이 붙어 본 모델 forward 는 10 / (4 + 1) 번
+    assert drafted == accepted == 8
+
+
+@pytest.mark.parametrize("constrained", [False, True])
+def test_cot_speculative_matches_plain_decoding(use_tiny_draft, monkeypatch, constrained):
+    from backend.app.config import settings
+    from backend.app.services.cot import cot_predict_many
+
+    items = [
+        ([{"entity": "삼성전자"}, {"entity": "코스피"}], "삼성전자가 코스피 시장에서 급등했다."),
+        ([{"entity": "애플"}], "애플이 오늘 주가가 하락했다."),
+    ]
+    monkeypatch.setattr(settings, "COT_DETERMINISTIC", True)
+    monkeypatch.setattr(settings, "COT_CONSTRAINED", constrained)
+    monkeypatch.setattr(settings, "COT_PREFIX_CACHE", False)
+    monkeypatch.setattr(settings, "COT_SPECULATIVE", False)
+    plain = cot_predict_many(items, max_new_tokens=12)
+    monkeypatch.setattr(settings, "COT_SPECULATIVE", True)
+    speculative = cot_predict_many(items, max_new_tokens=12)
+
+    key = lambda results: [[(p["asset"], p["direction"], p["reasoning"]) for p in preds] for preds in results]
+    assert key(speculative) == key(plain)
+    assert [p["confidence"] for preds in speculative for p in preds] == pytest.approx(
+        [p["confidence"] for preds in plain for p in preds], abs=1e-4
+    )
+
+
+def test_speculative_is_disabled_when_draft_is_the_target(monkeypatch):
+    from backend.app.config import settings
+    from backend.app.services import cot
+    from backend.app.services.predict_ser import MODEL_NAME, speculative_enabled
+
+    monkeypatch.setattr(settings, "COT_SPECULATIVE", True)
+    monkeypatch.setattr(settings, "COT_DETERMINISTIC", True)
+    assert speculative_enabled()
+
+    # draft 가 본 모델과 같으면 추측 디코딩 대신 일반 생성 경로 사용
+    monkeypatch.setattr(settings, "COT_DRAFT_MODEL", MODEL_NAME)
+    assert not speculative_enabled()
+    used = []
+    monkeypatch.setattr(cot, "_generate_speculative", lambda prompts, n: used.append("speculative"))
+    monkeypatch.setattr(cot, "_generate_prefix_shared", lambda *args: used.append("plain") or [])
+    cot._generate_chunk([("애플", "애플이 하락했다.")], max_new_tokens=4)
+    assert used == ["plain"]
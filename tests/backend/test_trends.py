@@ -0,0 +1,103 @@
+# tests/backend/test_trends.py
+import asyncio
+from datetime import datetime
+
+import pytest
+from ariadne import graphql
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.db.models import AssetTrend
+from backend.app.db.session import get_db
+from backend.app.graphql.loaders import Loaders
+from backend.app.graphql.schema import graphql_schema
+from backend.app.routers import trends as trends_rout
+from backend.app.routers.schemas import NewsCreate
+from backend.app.services.crud import create_news, delete_news, save_predictions
+from backend.app.services.pipeline import stored_model_version
+from backend.app.services.trends import get_trends, rebuild_trends
+
+VERSION = stored_model_version("cot")
+
+
+def _result(direction, confidence, asset="삼성전자"):
+    return {
+        "entities": [{"entity": asset, "label": "OG"}, {"entity": "급등", "label": "PRICE_MOVE"}],
+        "predictions": [{"asset": asset, "direction": direction, "confidence": confidence, "reasoning": ""}],
+    }
+
+
+@pytest.fixture
+def stored(db_session):
+    times = [datetime(2026, 10, 1, 9, 5), datetime(2026, 10, 1, 9, 40), datetime(2026, 10, 1, 11, 0)]
+    news = [
+        create_news(db_session, NewsCreate(title=f"기사{i}", link=f"http://n.test/{i}", pub_date=t))
+        for i, t in enumerate(times)
+    ]
+    save_predictions(db_session, {
+        news[0].id: _result("up", 0.9),
+        news[1].id: _result("down", 0.5),
+        news[2].id: _result("up", 0.7),
+    }, VERSION)
+    return news
+
+
+def _snapshot(db):
+    return sorted(
+        (r.model_version, r.asset, r.bucket, r.bucket_start, r.mentions, r.up, r.down, r.neutral,
+         round(r.confidence_sum, 6), r.confidence_count)
+        for r in db.query(AssetTrend)
+        if r.mentions or r.up or r.down or r.neutral
+    )
+
+
+def test_rollups_by_bucket(db_session, stored):
+    hourly = get_trends(db_session, "삼성전자", VERSION, "hour")
+    assert [(p["bucket_start"].hour, p["mentions"], p["up"], p["down"]) for p in hourly] == [
+        (9, 2, 1, 1), (11, 1, 1, 0)
+    ]
+    assert hourly[0]["mean_confidence"] == pytest.approx(0.7)
+
+    daily = get_trends(db_session, "삼성전자", VERSION, "day")
+    assert [(p["mentions"], p["up"], p["down"]) for p in daily] == [(3, 2, 1)]
+    # 가격 변동 키워드는 자산으로 집계하지 않음
+    assert get_trends(db_session, "급등", VERSION, "day") == []
+    # from 은 구간 시작으로 내림, to 는 제외 경계
+    ranged = get_trends(db_session, "삼성전자", VERSION, "hour",
+                        date_from=datetime(2026, 10, 1, 9, 30), date_to=datetime(2026, 10, 1, 11))
+    assert [p["bucket_start"].hour for p in ranged] == [9]
+    with pytest.raises(ValueError):
+        get_trends(db_session, "삼성전자", VERSION, "week")
+
+
+def test_replace_and_delete_update_rollups_incrementally(db_session, stored):
+    save_predictions(db_session, {stored[1].id: _result("up", 0.6)}, VERSION)
+    assert [(p["up"], p["down"]) for p in get_trends(db_session, "삼성전자", VERSION, "day")] == [(3, 0)]
+
+    delete_news(db_session, stored[2].id)
+    hourly = get_trends(db_session, "삼성전자", VERSION, "hour")
+    assert [(p["bucket_start"].hour, p["mentions"]) for p in hourly] == [(9, 2)]
+
+    # 증분 결과 == 저장된 예측으로 처음부터 다시 만든 결과
+    incremental = _snapshot(db_session)
+    assert rebuild_trends(db_session) == 2
+    assert _snapshot(db_session) == incremental
+
+
+def test_trends_rest_and_graphql(db_session, stored):
+    app = FastAPI()
+    app.include_router(trends_rout.router)
+    app.dependency_overrides[get_db] = lambda: db_session
+    client = TestClient(app)
+
+    response = client.get("/trends", params={"asset": "삼성전자", "bucket": "day", "from": "2026-10-01T00:00:00"})
+    assert response.status_code == 200
+    assert response.json()[0]["mentions"] == 3
+    assert client.get("/trends", params={"asset": "삼성전자", "bucket": "week"}).status_code == 422
+
+    query = '{ trends(asset: "삼성전자", bucket: "hour") { bucketStart mentions up down meanConfidence } }'
+    context = {"db": db_session, "loaders": Loaders(db_session)}
+    ok, result = asyncio.run(graphql(graphql_schema, {"query": query}, context_value=context))
+    assert [p["bucketStart"] for p in result["data"]["trends"]] == [
+        "2026-10-01T09:00:00", "2026-10-01T11:00:00"
+    ]
@@ -0,0 +1,102 @@
+# tests/conftest.py
+import os
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Settings 필수 값 (실제 .env 가 없는 테스트 환경용 기본값)
+os.environ.setdefault("NAVER_CLIENT_ID", "test-client-id")
+os.environ.setdefault("NAVER_CLIENT_SECRET", "test-client-secret")
+os.environ.setdefault("DB_URL", "sqlite:///./test_news.db")
+
+import pytest
+import torch
+from transformers import GPTNeoConfig, GPTNeoForCausalLM, GPTNeoForSequenceClassification, PreTrainedTokenizerFast
+
+from backend.app.services.registry import registry
+from benchmarks.tiny_models import gpt_neo_config, make_tokenizer
+
+# 허브 접속 없이 쓸 수 있는 작은 바이트 BPE 토크나이저 학습용 말뭉치
+_CORPUS = [
+    "뉴스 기사: 삼성전자가 코스피 시장에서 급등했다.",
+    "애플이 오늘 주가가 하락했다. 결과: down",
+    "분석 대상 자산 방향성 up down neutral 결과: up",
+    "단계별 사고 과정: 실적 개선, 수요 증가, 결과: neutral",
+]
+
+
+def make_tiny_tokenizer() -> PreTrainedTokenizerFast:
+    return make_tokenizer(vocab_size=512, max_length=1024, corpus=_CORPUS * 10)
+
+
+def tiny_gpt_neo_config(tokenizer, **overrides) -> GPTNeoConfig:
+    # 벤치마크 모델보다 작게, 랜덤 초기화 값의 폭을 키워 토큰 분포가 고르게 나오도록 함
+    params = dict(
+        hidden_size=32,
+        num_layers=2,
+        num_heads=2,
+        intermediate_size=64,
+        max_position_embeddings=1024,
+        initializer_range=0.5,
+    )
+    params.update(overrides)
+    return gpt_neo_config(tokenizer, **params)
+
+
+@pytest.fixture(scope="session")
+def tiny_tokenizer():
+    return make_tiny_tokenizer()
+
+
+@pytest.fixture(scope="session")
+def tiny_causal_lm(tiny_tokenizer):
+    torch.manual_seed(0)
+    return GPTNeoForCausalLM(tiny_gpt_neo_config(tiny_tokenizer)).eval()
+
+
+@pytest.fixture(scope="session")
+def tiny_draft_lm(tiny_tokenizer):
+    # 추측 디코딩용: 본 모델과 토크나이저를 공유하는 더 작은 랜덤 모델
+    torch.manual_seed(1)
+    return GPTNeoForCausalLM(
+        tiny_gpt_neo_config(tiny_tokenizer, hidden_size=16, num_layers=1, attention_types=[[["global"], 1]])
+    ).eval()
+
+
+@pytest.fixture(scope="session")
+def tiny_classifier(tiny_tokenizer):
+    torch.manual_seed(0)
+    return GPTNeoForSequenceClassification(
+        tiny_gpt_neo_config(tiny_tokenizer, num_labels=2)
+    ).eval()
+
+
+@pytest.fixture
+def use_tiny_models(tiny_tokenizer, tiny_causal_lm, tiny_classifier):
+    """레지스트리의 cot/classifier 모델을 랜덤 초기화된 작은 모델로 교체합니다."""
+    registry.set("cot", (tiny_tokenizer, tiny_causal_lm, torch.device("cpu")))
+    registry.set("classifier", (tiny_tokenizer, tiny_classifier))
+    yield
+    registry.unload("cot")
+    registry.unload("classifier")
+
+
+@pytest.fixture
+def db_session():
+    """테이블이 생성된 인메모리 SQLite 세션"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from backend.app.db.models import Base, ensure_news_fts
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    ensure_news_fts(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()